@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the per-object wrappers with the array based bulk commands.
+
+Each case is timed with the NullBackend, which isolates the Python overhead
+of the wrappers, and with openseespy.
+
+Run with:
+
+    python benchmarks/bulkModel.py [number of nodes]
+"""
+import sys
+import time
+
+import numpy as np
+
+import openseespyhint as op
+from openseespyhint.backend import useBackend, NullBackend
+
+
+def gridNodes(N):
+    nx = int(np.sqrt(N))
+    x, y = np.meshgrid(np.arange(nx, dtype=float), np.arange(N // nx, dtype=float))
+    coords = np.column_stack([x.ravel(), y.ravel()])
+    return np.arange(1, len(coords) + 1), coords
+
+
+def loopNodes(tags, coords, mass):
+    for tag, crd in zip(tags.tolist(), coords.tolist()):
+        op.model.node(tag, crd, mass=mass)
+
+
+def bulkNodes(tags, coords, mass):
+    op.model.nodes(tags, coords, mass=mass)
+
+
+def loopTrusses(tags, coords, mass):
+    bulkNodes(tags, coords, mass)
+    op.model.uniaxialMaterial.Elastic(1, 1000.)
+    for tag, nodes in zip(tags[:-1].tolist(), zip(tags[:-1].tolist(), tags[1:].tolist())):
+        op.model.element.Truss(tag, nodes, 1.0, 1)
+
+
+def bulkTrusses(tags, coords, mass):
+    bulkNodes(tags, coords, mass)
+    op.model.uniaxialMaterial.Elastic(1, 1000.)
+    eleNodes = np.column_stack([tags[:-1], tags[1:]])
+    op.model.element.TrussMany(tags[:-1], eleNodes, 1.0, 1)
+
+
+cases = {'node loop': loopNodes,
+         'nodes': bulkNodes,
+         'Truss loop': loopTrusses,
+         'TrussMany': bulkTrusses}
+
+
+def timeCase(func, args, null):
+    op.utility.wipe()
+    op.model.basic(2, 2)
+    t0 = time.perf_counter()
+    if null:
+        with useBackend(NullBackend()):
+            func(*args)
+    else:
+        func(*args)
+    return time.perf_counter() - t0
+
+
+if __name__ == '__main__':
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    tags, coords = gridNodes(N)
+    args = (tags, coords, [1., 1.])
+    print(f'{len(tags)} nodes, times in s')
+    print(f"{'case':<16}{'null':>10}{'opensees':>10}")
+    for name, func in cases.items():
+        tNull = timeCase(func, args, True)
+        tOps = timeCase(func, args, False)
+        print(f'{name:<16}{tNull:10.3f}{tOps:10.3f}')
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Import time benchmark for openseespyhint.
+
+Every measurement is made in a fresh interpreter. For the cold numbers the
+byte code is written to an empty cache directory, so the timings include
+compiling the source files, which is what a newly started worker pays. The
+warm numbers reuse the cache.
+
+For each submodule the benchmark reports the time to import the package and
+touch only that submodule, and compares it to the old eager import, where
+every submodule was loaded by ``import openseespyhint``.
+
+Run with:
+
+    python benchmarks/importTime.py [repeats]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+submodules = ['model', 'model.element', 'model.uniaxialMaterial',
+              'model.beamIntegration', 'model.block', 'model.geomTransf',
+              'model.pattern', 'model.SPconstraint', 'model.timeSeries',
+              'analysis', 'analysis.algorithm', 'analysis.integrator',
+              'analysis.system', 'analysis.test', 'utility']
+
+# Touches the listed submodules after importing the package.
+touchSnippet = """
+import time
+t0 = time.perf_counter()
+import openseespyhint as op
+t1 = time.perf_counter()
+for name in {names!r}:
+    obj = op
+    for part in name.split('.'):
+        obj = getattr(obj, part)
+t2 = time.perf_counter()
+print('TIMING', t1 - t0, t2 - t1)
+"""
+
+
+def runSnippet(names, cacheDir):
+    env = dict(os.environ)
+    env['PYTHONPYCACHEPREFIX'] = cacheDir
+    code = touchSnippet.format(names=list(names))
+    out = subprocess.run([sys.executable, '-c', code], env=env,
+                         capture_output=True, text=True, check=True).stdout
+    line = [l for l in out.splitlines() if l.startswith('TIMING')][-1]
+    _, tImport, tTouch = line.split()
+    return float(tImport), float(tTouch)
+
+
+def measure(names, repeats, cold):
+    """
+    Returns the median package import time and first touch time in ms.
+    """
+    imports, touches = [], []
+    with tempfile.TemporaryDirectory() as warmDir:
+        if not cold:
+            runSnippet(names, warmDir)
+        for ii in range(repeats):
+            if cold:
+                with tempfile.TemporaryDirectory() as coldDir:
+                    tImport, tTouch = runSnippet(names, coldDir)
+            else:
+                tImport, tTouch = runSnippet(names, warmDir)
+            imports.append(tImport*1000)
+            touches.append(tTouch*1000)
+    return statistics.median(imports), statistics.median(touches)
+
+
+def report(repeats, cold):
+    label = 'cold (no byte code)' if cold else 'warm (cached byte code)'
+    eager = sum(measure(submodules, repeats, cold))
+    print(f'\n{label}, median of {repeats} runs, times in ms')
+    print(f'eager import of every submodule: {eager:8.1f}')
+    print(f"{'submodule':<26}{'import':>10}{'touch':>10}{'total':>10}{'gain':>10}")
+    for name in submodules:
+        tImport, tTouch = measure([name], repeats, cold)
+        total = tImport + tTouch
+        print(f'{name:<26}{tImport:10.1f}{tTouch:10.1f}{total:10.1f}{eager - total:10.1f}')
+
+
+if __name__ == '__main__':
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    report(repeats, cold=True)
+    report(repeats, cold=False)
@@ -1,5 +1,17 @@
 print('ran')
-from . import analysis
-# from model import *
-from . import model
-from . import utility
\ No newline at end of file
+import importlib
+
+# Submodules are imported on first attribute access, i.e. op.model is only
+# loaded the first time it is used.
+_submodules = ['analysis', 'backend', 'cache', 'eigenCache', 'model', 'output', 'profiling',
+               'runner', 'shadow', 'tape', 'utility']
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules))
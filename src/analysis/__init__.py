@@ -1,24 +1,27 @@
-# from . algorithm import *
-from . import algorithm
+import importlib
 
-# from . constraints import *
-from . import constraints
+from ..backend import ops
 
-# from . integrator import *
-from . import integrator
+# Submodules are imported on first attribute access.
+_submodules = ['algorithm', 'constraints', 'convergence', 'driver', 'graph', 'integrator',
+               'numberer', 'system', 'test']
 
-# from . system import *
-from . import numberer
 
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# from . system import *
-from . import system
 
-# from . test import *
-from . import test
+def __dir__():
+    return sorted(set(globals()) | set(_submodules))
 
 
-import openseespy.opensees as ops
+# Functions called after each converged increment of analyze.
+stepHooks = []
+
+# Functions called with the status code after a failed increment of analyze.
+failHooks = []
 
 
 def analysis(analysisType):
@@ -67,11 +70,90 @@ def analyze(numIncr=1, dt=0.0, dtMin=0.0, dtMax=0.0, Jd=0):
     
     ===============================   ======================================================================================
 
+    If hooks are registered with :func:`addStepHook` or :func:`addFailHook`,
+    the increments are run one at a time and every step hook is called after
+    each converged increment, which adds a Python call per increment. The
+    analysis stops at the first increment that fails, and every fail hook is
+    called with its status code. A VariableTransient analysis, with
+    ``dtMin``, ``dtMax`` or ``Jd`` given, adapts its time step over the
+    increments of one call, so it is always run as one call and raises a
+    ``ValueError`` while hooks are registered.
+
     Hints:
         untested
 
     """
-    ops.analyze(numIncr, dt, dtMin, dtMax, Jd)
+    # The variable transient arguments are only sent if they are used, as
+    # OpenSees doesn't accept them for the other analysis types.
+    variable = bool(dtMin or dtMax or Jd)
+    if variable:
+        uniqueArgs = [dt, dtMin, dtMax, Jd]
+    elif dt:
+        uniqueArgs = [dt]
+    else:
+        uniqueArgs = []
+    if not stepHooks and not failHooks:
+        return ops.analyze(numIncr, *uniqueArgs)
+    if variable:
+        raise ValueError('a VariableTransient analysis adapts its time step within one call, '
+                         'so it can not run with step or fail hooks. Remove them, or see '
+                         'openseespyhint.analysis.driver.VariableStepDriver')
+    ok = 0
+    for ii in range(numIncr):
+        ok = ops.analyze(1, *uniqueArgs)
+        if ok != 0:
+            for hook in failHooks:
+                hook(ok)
+            break
+        for hook in stepHooks:
+            hook()
+    return ok
+
+
+def addStepHook(hook):
+    """
+    Registers a function that is called with no arguments after every
+    converged increment of :func:`analyze`, and returns it.
+
+    ========================   ===========================================================================
+    ``hook``                   function called after each converged increment.
+    ========================   ===========================================================================
+
+    """
+    stepHooks.append(hook)
+    return hook
+
+
+def removeStepHook(hook):
+    """
+    Removes a function registered with :func:`addStepHook`, if it is
+    registered.
+    """
+    if hook in stepHooks:
+        stepHooks.remove(hook)
+
+
+def addFailHook(hook):
+    """
+    Registers a function that is called with the status code after an
+    increment of :func:`analyze` fails, and returns it.
+
+    ========================   ===========================================================================
+    ``hook``                   function called with the status code of each failed increment.
+    ========================   ===========================================================================
+
+    """
+    failHooks.append(hook)
+    return hook
+
+
+def removeFailHook(hook):
+    """
+    Removes a function registered with :func:`addFailHook`, if it is
+    registered.
+    """
+    if hook in failHooks:
+        failHooks.remove(hook)
 
 
 def  eigen(solver='-genBandArpack', numEigenvalues = None):
@@ -102,4 +184,4 @@ def  eigen(solver='-genBandArpack', numEigenvalues = None):
     if numEigenvalues:
         uniqueArgs.append(numEigenvalues)
     
-    ops.eigen(solver, *uniqueArgs)
\ No newline at end of file
+    return ops.eigen(solver, *uniqueArgs)
\ No newline at end of file
@@ -1,4 +1,4 @@
-import openseespy.opensees as ops
+from ..backend import ops
 
 def Linear(secant=False, initial=False, factorOnce=False):
     """
@@ -1,4 +1,4 @@
-import openseespy.opensees as ops
+from ..backend import ops
 
 def numIncr=1(numIncr, dt, dtMin, dtMax, Jd):
     """
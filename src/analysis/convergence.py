@@ -0,0 +1,168 @@
+"""
+Logs how each increment of the analysis converged, or failed to converge.
+
+After each increment of :func:`openseespyhint.analysis.analyze`, including
+the one that fails, the log stores the time, status code, load factor,
+number of iterations, number of factorizations and the norms of the
+convergence test in one growable array, so tolerances and iteration limits
+can be tuned on data.
+
+.. code-block:: python
+
+   from openseespyhint.analysis.convergence import ConvergenceLog
+
+   log = ConvergenceLog(patternTag=1).start()
+   op.analysis.analyze(500, 0.01)
+   log.remove()
+   print(log.summary())
+   for start, end in log.slowRegions():
+       print(f'slow convergence from t = {start} to {end}')
+
+"""
+import numpy as np
+
+from ..backend import ops
+from ..output.recorder import StepRecorder
+from . import addFailHook, failHooks, removeFailHook
+
+
+class ConvergenceLog(StepRecorder):
+    """
+    Records the convergence of each increment. A failed increment is logged
+    with the status code returned by ``analyze`` and the norms of the
+    iterations it tried.
+
+    ========================   ===========================================================================
+    ``patternTag`` |int|       pattern whose load factor is logged, otherwise the load factor is nan.
+                               (optional)
+    ``capacity`` |int|         number of increments to allocate space for. The log grows as needed.
+                               (optional)
+    ========================   ===========================================================================
+
+    The logged columns are available as arrays:
+
+    ========================   ===========================================================================
+    ``time``                   domain time. A failed increment has the time of the last converged one.
+    ``status``                 0 for a converged increment, otherwise the status code of the failure
+    ``loadFactor``             load factor of ``patternTag``
+    ``iterations``             iterations of the convergence test, ``testIter``
+    ``numIter``                iterations of the algorithm, ``numIter``
+    ``numFact``                number of factorizations, ``numFact``
+    ``firstNorm``              norm of the convergence test after the first iteration
+    ``lastNorm``               norm of the convergence test at the last iteration
+    ``rate``                   mean reduction of the norm per iteration, (last / first) ** (1 / (n - 1)).
+                               Values close to 1 mean slow, linear convergence.
+    ========================   ===========================================================================
+    """
+
+    columns = ['time', 'status', 'loadFactor', 'iterations', 'numIter', 'numFact', 'firstNorm',
+               'lastNorm', 'rate']
+
+    def __init__(self, patternTag=None, capacity=1024):
+        super().__init__(None)
+        self.patternTag = patternTag
+        self._data = np.full((max(capacity, 1), len(self.columns)), np.nan)
+
+    def store(self, time, status=0):
+        row = self.count
+        if row == len(self._data):
+            data = np.full((2 * row, len(self.columns)), np.nan)
+            data[:row] = self._data
+            self._data = data
+        norms = ops.testNorm()
+        # A failed test counts one iteration past the norms it stores.
+        iterations = min(ops.testIter(), len(norms))
+        first = norms[0] if iterations > 0 else np.nan
+        last = norms[iterations - 1] if iterations > 0 else np.nan
+        rate = np.nan
+        if iterations > 1 and first > 0 and last > 0:
+            rate = (last / first) ** (1 / (iterations - 1))
+        loadFactor = np.nan if self.patternTag is None else ops.getLoadFactor(self.patternTag)
+        self._data[row] = (time, status, loadFactor, iterations, ops.numIter(), ops.numFact(),
+                           first, last, rate)
+
+    def recordFailure(self, status):
+        """
+        Logs a failed increment. Called with the status code after each
+        failed increment while the log is active.
+        """
+        self.store(ops.getTime(), status)
+        self.count += 1
+
+    def start(self):
+        """
+        Registers the log as a step hook and a fail hook of
+        :func:`openseespyhint.analysis.analyze`, and returns it.
+        """
+        if self.recordFailure not in failHooks:
+            addFailHook(self.recordFailure)
+        return super().start()
+
+    def remove(self):
+        """
+        Stops logging. The logged increments are kept.
+        """
+        super().remove()
+        removeFailHook(self.recordFailure)
+
+    def __getattr__(self, name):
+        if name in ConvergenceLog.columns:
+            return self._data[:self.count, ConvergenceLog.columns.index(name)]
+        raise AttributeError(name)
+
+    def __len__(self):
+        return self.count
+
+    def asDict(self):
+        """
+        Returns the logged columns as a dict of arrays.
+        """
+        return {name: self._data[:self.count, ii].copy() for ii, name in enumerate(self.columns)}
+
+    def summary(self):
+        """
+        Returns summary statistics of the log as a dict.
+        """
+        iterations = self.iterations
+        if not len(iterations):
+            return {'increments': 0}
+        return {'increments': len(iterations),
+                'failures': int(np.count_nonzero(self.status)),
+                'totalIterations': int(iterations.sum()),
+                'meanIterations': float(iterations.mean()),
+                'medianIterations': float(np.median(iterations)),
+                'maxIterations': int(iterations.max()),
+                'p95Iterations': float(np.percentile(iterations, 95)),
+                'meanRate': float(np.nanmean(self.rate)) if np.any(np.isfinite(self.rate)) else np.nan,
+                'worstRate': float(np.nanmax(self.rate)) if np.any(np.isfinite(self.rate)) else np.nan}
+
+    def slowMask(self, minIterations=None, maxRate=None):
+        """
+        Returns a boolean array of the increments that converged slowly,
+        i.e. took at least ``minIterations`` iterations or reduced the norm by
+        less than ``maxRate`` per iteration.
+
+        By default ``minIterations`` is twice the median number of iterations,
+        and at least 3, and the rate is not checked.
+        """
+        iterations = self.iterations
+        if minIterations is None:
+            median = np.median(iterations) if len(iterations) else 0
+            minIterations = max(3, 2 * median)
+        slow = iterations >= minIterations
+        if maxRate is not None:
+            slow |= self.rate > maxRate
+        return slow
+
+    def slowRegions(self, minIterations=None, maxRate=None, minLength=1):
+        """
+        Returns the ``(startTime, endTime)`` of each run of at least
+        ``minLength`` consecutive slow increments, see :meth:`slowMask`.
+        """
+        slow = self.slowMask(minIterations, maxRate).astype(np.int8)
+        edges = np.diff(np.concatenate([[0], slow, [0]]))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        time = self.time
+        return [(time[start], time[end - 1]) for start, end in zip(starts, ends)
+                if end - start >= minLength]
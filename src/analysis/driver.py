@@ -0,0 +1,418 @@
+"""
+An analysis driver that retries failed steps with other solution settings
+and smaller increments.
+
+Instead of a hand written ``while ok != 0`` loop, the driver is given a
+ladder of settings to try in order. If a step fails with every rung of the
+ladder it is split in half, down to ``minFraction`` of a full step, and
+after ``growAfter`` converged sub-steps the increment is doubled again.
+
+.. code-block:: python
+
+   from openseespyhint.analysis.driver import AdaptiveDriver
+
+   driver = AdaptiveDriver([
+       {'algorithm': ('Newton',), 'test': ('NormDispIncr', 1e-8, 10)},
+       {'algorithm': ('KrylovNewton',)},
+       {'algorithm': ('NewtonLineSearch',), 'test': ('NormDispIncr', 1e-8, 50)},
+       {'algorithm': ('BFGS',)},
+   ])
+   ok = driver.run(2000, 0.01)
+   print(driver.stats()['iterations'].sum())
+
+:class:`VariableStepDriver` runs a transient analysis with a time step that
+a controller adapts after each step, while landing exactly on given time
+points. Landing on every sample of a ground motion record caps each step at
+the record's dt, so :func:`recordTimePoints` picks the samples a step must
+not pass, where the record is not close to a straight line.
+
+.. code-block:: python
+
+   from openseespyhint.analysis.driver import (ErrorController, VariableStepDriver,
+                                               recordTimePoints)
+
+   times = record.dt * np.arange(len(record))
+   points = recordTimePoints(times, record, tol=0.01 * np.abs(record).max())
+   driver = VariableStepDriver(ErrorController([10, 20], tol=1e-5), dtMin=1e-4,
+                               timePoints=points)
+   ok = driver.run(endTime=40.0, dt=0.005)
+
+"""
+import bisect
+import math
+import time
+
+import numpy as np
+
+from ..backend import ops
+from . import analyze
+
+
+defaultLadder = [
+    {'algorithm': ('Newton',)},
+    {'algorithm': ('KrylovNewton',)},
+    {'algorithm': ('NewtonLineSearch',)},
+    {'algorithm': ('BFGS',)},
+]
+
+
+class AdaptiveDriver:
+    """
+    Runs an analysis one step at a time, falling back through a ladder of
+    solution settings and sub-steps when a step fails.
+
+    ========================   ===========================================================================
+    ``ladder`` |list|          the settings to try in order. Each rung is either a dict of command name
+                               to arguments, i.e. ``{'algorithm': ('KrylovNewton',)}``, or a function
+                               that sends the commands itself. Dict rungs are applied on top of the
+                               first rung, so settings the first rung sets are restored. (optional)
+    ``setIncrement``           function called with the fraction of a full step before each static
+                               increment, i.e. ``lambda f: ops.integrator('LoadControl', 0.1 * f)``.
+                               Not needed for transient analyses, where the time step is scaled.
+                               (optional)
+    ``minFraction`` |float|    smallest sub-step, as a fraction of a full step. (optional)
+    ``growAfter`` |int|        number of converged sub-steps after which the sub-step is doubled.
+                               (optional)
+    ``sticky`` |bool|          if True each increment starts at the rung the last increment converged
+                               with, and steps back down the ladder one rung after ``growAfter``
+                               converged increments. This avoids retrying rungs that just failed.
+                               (optional)
+    ========================   ===========================================================================
+
+    Each converged increment is logged with its time, size, ladder rung,
+    number of iterations, number of failed attempts before it and the wall
+    time spent on it, see :meth:`stats`.
+    """
+
+    def __init__(self, ladder=None, setIncrement=None, minFraction=1 / 64, growAfter=2,
+                 sticky=False):
+        self.ladder = list(defaultLadder if ladder is None else ladder)
+        if not self.ladder:
+            raise ValueError('the ladder needs at least one rung')
+        self.setIncrement = setIncrement
+        self.minFraction = minFraction
+        self.growAfter = growAfter
+        self.sticky = sticky
+        self.fraction = 1.0
+        self._start = 0
+        self._streak = 0
+        self._rung = None
+        self._incrementFraction = None
+        self._log = []
+
+    def _apply(self, rung):
+        if rung == self._rung:
+            return
+        settings = self.ladder[rung]
+        if callable(settings):
+            settings()
+        else:
+            first = self.ladder[0]
+            if rung and isinstance(first, dict):
+                settings = {**first, **settings}
+            for cmd, args in settings.items():
+                getattr(ops, cmd)(*args)
+        self._rung = rung
+
+    def _increment(self, fraction, dt):
+        if dt:
+            return analyze(1, dt * fraction)
+        if self.setIncrement is not None and fraction != self._incrementFraction:
+            self.setIncrement(fraction)
+            self._incrementFraction = fraction
+        return analyze(1)
+
+    def step(self, dt=0.0):
+        """
+        Runs one full step of size ``dt``, or one static increment, and
+        returns 0 if it converged. If it doesn't, the last attempt's result
+        is returned and the domain is left at the last converged sub-step.
+        """
+        remaining = 1.0
+        converged = 0
+        while remaining > 1e-12:
+            fraction = min(self.fraction, remaining)
+            attempts = 0
+            start = time.perf_counter()
+            for rung in range(self._start, len(self.ladder)):
+                self._apply(rung)
+                ok = self._increment(fraction, dt)
+                if ok == 0:
+                    break
+                attempts += 1
+            if ok == 0:
+                self._log.append((ops.getTime(), fraction * dt if dt else fraction, rung,
+                                  ops.testIter(), attempts, time.perf_counter() - start))
+                remaining -= fraction
+                converged += 1
+                if self.sticky:
+                    self._stick(rung)
+                if converged >= self.growAfter and self.fraction < 1.0:
+                    self.fraction = min(1.0, 2 * self.fraction)
+                    converged = 0
+            else:
+                if not dt and self.setIncrement is None:
+                    # the size of a static increment can't be changed
+                    return ok
+                self.fraction /= 2
+                converged = 0
+                if self.fraction < self.minFraction * (1 - 1e-9):
+                    self.fraction = self.minFraction
+                    return ok
+        return 0
+
+    def _stick(self, rung):
+        if rung != self._start:
+            self._start = rung
+            self._streak = 0
+            return
+        self._streak += 1
+        if self._streak >= self.growAfter and self._start > 0:
+            self._start -= 1
+            self._streak = 0
+
+    def run(self, numIncr, dt=0.0):
+        """
+        Runs ``numIncr`` steps, and returns 0 if they all converged.
+        Otherwise stops at the first step that fails and returns its result.
+        """
+        for ii in range(numIncr):
+            ok = self.step(dt)
+            if ok != 0:
+                return ok
+        return 0
+
+    def stats(self):
+        """
+        Returns the log of converged increments as a dict of arrays, with the
+        keys ``time``, ``size``, ``rung``, ``iterations``, ``failures`` and
+        ``wallTime``.
+        """
+        names = ['time', 'size', 'rung', 'iterations', 'failures', 'wallTime']
+        columns = list(zip(*self._log)) if self._log else [()] * len(names)
+        dtypes = [float, float, int, int, int, float]
+        return {name: np.array(column, dtype=dtype)
+                for name, column, dtype in zip(names, columns, dtypes)}
+
+
+class StepController:
+    """
+    Base class of the time step controllers of :class:`VariableStepDriver`.
+
+    ``before()`` is called before each step, ``accept(dt)`` after a step of
+    size ``dt`` converged and returns the next step, and ``reject(dt)`` after
+    a step failed and returns the step to retry with. By default the step is
+    kept after a converged step, and halved after a failed one.
+    """
+
+    def before(self):
+        pass
+
+    def accept(self, dt):
+        return dt
+
+    def reject(self, dt):
+        return dt / 2
+
+
+class IterationController(StepController):
+    """
+    Scales the step by ``(target / iterations) ** exponent``, so steps that
+    converge in fewer iterations than ``target`` grow, as in the
+    ``VariableTransient`` analysis with ``Jd = target``.
+
+    ========================   ===========================================================================
+    ``target`` |int|           the desired number of iterations per step. (optional)
+    ``exponent`` |float|       how strongly the step follows the iterations. (optional)
+    ``maxGrow`` |float|        largest factor the step grows by after one step. (optional)
+    ``maxShrink`` |float|      smallest factor the step shrinks to after one step. (optional)
+    ========================   ===========================================================================
+    """
+
+    def __init__(self, target=4, exponent=0.5, maxGrow=2.0, maxShrink=0.5):
+        self.target = target
+        self.exponent = exponent
+        self.maxGrow = maxGrow
+        self.maxShrink = maxShrink
+
+    def accept(self, dt):
+        factor = (self.target / max(ops.testIter(), 1)) ** self.exponent
+        return dt * min(max(factor, self.maxShrink), self.maxGrow)
+
+
+class ErrorController(StepController):
+    """
+    Scales the step from an estimate of the local error: the difference
+    between the converged displacements and the displacements predicted from
+    the last step's displacement, velocity and acceleration, which is third
+    order in the step.
+
+    ========================   ===========================================================================
+    ``nodeTags`` |listi|       the nodes whose displacements are checked, by default all nodes. (optional)
+    ``tol`` |float|            relative error allowed per step. (optional)
+    ``atol`` |float|           absolute error allowed per step, used when displacements are small.
+                               (optional)
+    ``safety`` |float|         factor on the step proposed from the error. (optional)
+    ``maxGrow`` |float|        largest factor the step grows by after one step. (optional)
+    ``maxShrink`` |float|      smallest factor the step shrinks to after one step. (optional)
+    ========================   ===========================================================================
+
+    A converged step can't be undone, so a step with a large error only makes
+    the next step smaller.
+    """
+
+    def __init__(self, nodeTags=None, tol=1e-4, atol=1e-8, safety=0.9, maxGrow=2.0,
+                 maxShrink=0.2):
+        self.nodeTags = nodeTags
+        self.tol = tol
+        self.atol = atol
+        self.safety = safety
+        self.maxGrow = maxGrow
+        self.maxShrink = maxShrink
+        self.error = np.nan
+        self._state = None
+
+    def before(self):
+        from ..output.bulk import nodeAccelAll, nodeDispAll, nodeVelAll
+
+        if self._state is None:
+            self._state = [nodeDispAll(self.nodeTags), nodeVelAll(self.nodeTags),
+                           nodeAccelAll(self.nodeTags)]
+        else:
+            for values, query in zip(self._state, [nodeDispAll, nodeVelAll, nodeAccelAll]):
+                query(self.nodeTags, out=values)
+
+    def accept(self, dt):
+        from ..output.bulk import nodeDispAll
+
+        u, v, a = (np.nan_to_num(values) for values in self._state)
+        current = np.nan_to_num(nodeDispAll(self.nodeTags))
+        predicted = u + dt * v + 0.5 * dt ** 2 * a
+        scale = self.atol + self.tol * np.abs(current).max(initial=0.0)
+        self.error = np.abs(current - predicted).max(initial=0.0) / scale
+        if self.error == 0:
+            return dt * self.maxGrow
+        factor = self.safety * self.error ** (-1 / 3)
+        return dt * min(max(factor, self.maxShrink), self.maxGrow)
+
+
+def recordTimePoints(times, values, tol=0.0):
+    """
+    Returns the times of the samples of a record that a variable step
+    analysis must land on. A ``Path`` time series is linear between its
+    samples, so a step that passes over samples applies the straight line
+    between the samples at its ends instead. A sample is dropped if every
+    dropped sample between the kept ones around it is within ``tol`` of that
+    line, and the peaks of the record are always kept.
+
+    ========================   ===========================================================================
+    ``times`` |listf|          the times of the samples.
+    ``values`` |listf|         the values of the samples.
+    ``tol`` |float|            the largest change of a dropped sample, in the units of ``values``.
+                               (optional)
+    ========================   ===========================================================================
+
+    The larger ``tol``, the fewer points and the longer the steps can be, but
+    the more the applied record is smoothed. With ``tol=0`` only the samples
+    on straight parts of the record are dropped.
+    """
+    times = np.asarray(times, dtype=float)
+    values = np.asarray(values, dtype=float)
+    if len(times) < 3:
+        return times.copy()
+    slope = np.diff(values)
+    peaks = np.flatnonzero(slope[:-1] * slope[1:] < 0) + 1
+    isPeak = np.zeros(len(times), dtype=bool)
+    isPeak[peaks] = True
+    keep = [0]
+    last = 0
+    for index in range(2, len(times)):
+        # the samples after the last kept one, up to index, are dropped if close to the line
+        between = slice(last + 1, index)
+        fraction = (times[between] - times[last]) / (times[index] - times[last])
+        line = values[last] + fraction * (values[index] - values[last])
+        if isPeak[index - 1] or np.abs(values[between] - line).max() > tol:
+            keep.append(index - 1)
+            last = index - 1
+    keep.append(len(times) - 1)
+    return times[keep]
+
+
+class VariableStepDriver:
+    """
+    Runs a transient analysis one step at a time, with the step size set by a
+    controller after each step.
+
+    ========================   ===========================================================================
+    ``controller``             a :class:`StepController`, by default an :class:`IterationController`.
+                               (optional)
+    ``dtMin`` |float|          smallest step. A step that fails at this size stops the run. By default
+                               1/64 of the first step. (optional)
+    ``dtMax`` |float|          largest step. (optional)
+    ``timePoints`` |listf|     times the analysis must land on, so none of them is stepped over, i.e. the
+                               samples of a ``Path`` time series picked by :func:`recordTimePoints`.
+                               (optional)
+    ========================   ===========================================================================
+
+    Steps are shortened to land on each time point, and the gap to the next
+    point is split into equal steps rather than leaving a short step at its
+    end. Each converged step is logged with its time, size and iterations,
+    see :meth:`stats`.
+    """
+
+    def __init__(self, controller=None, dtMin=None, dtMax=None, timePoints=None):
+        self.controller = IterationController() if controller is None else controller
+        self.dtMin = dtMin
+        self.dtMax = dtMax
+        self.timePoints = np.unique(np.asarray([] if timePoints is None else timePoints,
+                                               dtype=float))
+        self.dt = None
+        self._log = []
+
+    def _nextPoint(self, t, endTime, tol):
+        index = bisect.bisect_right(self.timePoints, t + tol)
+        if index < len(self.timePoints) and self.timePoints[index] < endTime:
+            return self.timePoints[index]
+        return endTime
+
+    def run(self, endTime, dt):
+        """
+        Runs the analysis from the current time to ``endTime``, starting with
+        a step of ``dt``, and returns 0 if every step converged. Otherwise
+        stops at the first step that fails at ``dtMin`` and returns its result.
+        """
+        dtMin = dt / 64 if self.dtMin is None else self.dtMin
+        dtMax = math.inf if self.dtMax is None else self.dtMax
+        if self.dt is None:
+            self.dt = dt
+        t = ops.getTime()
+        tol = 1e-9 * dt
+        while t < endTime - tol:
+            target = self._nextPoint(t, endTime, tol)
+            gap = target - t
+            step = min(self.dt, dtMax, gap)
+            step = gap / math.ceil(gap / step - 1e-9)
+
+            self.controller.before()
+            start = time.perf_counter()
+            ok = analyze(1, step)
+            if ok != 0:
+                if step <= dtMin * (1 + 1e-9):
+                    return ok
+                self.dt = max(self.controller.reject(step), dtMin)
+                continue
+            t = ops.getTime()
+            self._log.append((t, step, ops.testIter(), time.perf_counter() - start))
+            self.dt = min(max(self.controller.accept(step), dtMin), dtMax)
+        return 0
+
+    def stats(self):
+        """
+        Returns the log of converged steps as a dict of arrays, with the keys
+        ``time``, ``size``, ``iterations`` and ``wallTime``.
+        """
+        names = ['time', 'size', 'iterations', 'wallTime']
+        columns = list(zip(*self._log)) if self._log else [()] * len(names)
+        dtypes = [float, float, int, float]
+        return {name: np.array(column, dtype=dtype)
+                for name, column, dtype in zip(names, columns, dtypes)}
@@ -0,0 +1,370 @@
+"""
+Estimates the bandwidth, profile and fill of the system of equations from the
+connectivity of the model, before the system is assembled.
+
+The node graph joins every pair of nodes that share an element, and the dof
+graph joins every dof of those nodes. The numberers number the dofs of a node
+together, so the dof graph is the node graph with a block of ``ndf`` rows per
+node, and the estimates are computed on the node graph in blocks. Each node
+order, i.e. the node tags for the ``Plain`` numberer, reverse Cuthill-McKee
+for ``RCM`` and minimum degree for ``AMD``, gives the bandwidth, profile and
+Cholesky fill of the stiffness matrix, and from them the memory and
+factorization cost of each system.
+
+.. code-block:: python
+
+   from openseespyhint.analysis.graph import estimateOrderings, systemCosts
+
+   stats = estimateOrderings()
+   print(stats['numEqn'], stats['RCM']['bandwidth'], stats['AMD']['fill'])
+   for system, cost in systemCosts(stats).items():
+       print(system, cost['numberer'], cost['bytes'] / 2**20, 'MB')
+
+"""
+import heapq
+
+import numpy as np
+
+from ..output.modelJSON import modelGeometry
+
+
+def nodeGraph(domain=None):
+    """
+    Returns the node graph of a model as ``(tags, indptr, indices)``: the
+    node tags, and the neighbours of the node in row i as
+    ``indices[indptr[i]:indptr[i + 1]]``, in compressed sparse row form.
+
+    ========================   ===========================================================================
+    ``domain``                 a :class:`openseespyhint.shadow.ShadowDomain`, by default the current model
+                               from :func:`openseespyhint.output.modelJSON.modelGeometry`. (optional)
+    ========================   ===========================================================================
+
+    Only element connectivity is used, nodes joined by constraints such as
+    ``equalDOF`` are not neighbours.
+    """
+    if domain is None:
+        domain = modelGeometry()
+    tags = np.array(domain.nodeTags)
+    N = len(tags)
+    table = domain.eleNodesTable
+    rows = np.full(table.shape, -1, dtype=int)
+    known = table >= 0
+    if known.any():
+        rows[known] = domain.nodeRows(table[known])
+
+    first, second = [], []
+    for a in range(rows.shape[1]):
+        for b in range(rows.shape[1]):
+            if a != b:
+                pair = (rows[:, a] >= 0) & (rows[:, b] >= 0)
+                first.append(rows[pair, a])
+                second.append(rows[pair, b])
+    if first:
+        keys = np.unique(np.concatenate(first) * N + np.concatenate(second))
+    else:
+        keys = np.empty(0, dtype=int)
+    indices = keys % N if N else keys
+    indptr = np.zeros(N + 1, dtype=int)
+    np.cumsum(np.bincount(keys // N if N else keys, minlength=N), out=indptr[1:])
+    return tags, indptr, indices
+
+
+def nodeNdf(domain):
+    """
+    Returns the number of dofs of each node, using the model ``ndf`` where a
+    node's is unknown.
+    """
+    ndf = np.array(domain.nodeNdf)
+    default = domain.ndf or (ndf.max(initial=-1) if (ndf > 0).any() else 1)
+    ndf[ndf <= 0] = default
+    return ndf
+
+
+def dofGraph(domain=None):
+    """
+    Returns the dof graph of a model as ``(nodeRows, indptr, indices)``: the
+    node row of each dof, and the dofs coupled to dof i, including the other
+    dofs of its node, as ``indices[indptr[i]:indptr[i + 1]]``. Dofs are
+    numbered node by node, in the order of the node rows.
+    """
+    if domain is None:
+        domain = modelGeometry()
+    tags, nodePtr, nodeIndices = nodeGraph(domain)
+    ndf = nodeNdf(domain)
+    start = np.zeros(len(ndf) + 1, dtype=int)
+    np.cumsum(ndf, out=start[1:])
+    pieces, lengths = [], []
+    for i in range(len(ndf)):
+        coupled = np.sort(np.append(nodeIndices[nodePtr[i]:nodePtr[i + 1]], i))
+        columns = np.concatenate([np.arange(start[j], start[j + 1]) for j in coupled])
+        pieces.append(np.tile(columns, ndf[i]))
+        lengths.append(np.full(ndf[i], len(columns)))
+    indices = np.concatenate(pieces) if pieces else np.empty(0, dtype=int)
+    indptr = np.zeros(start[-1] + 1, dtype=int)
+    if lengths:
+        np.cumsum(np.concatenate(lengths), out=indptr[1:])
+    return np.repeat(np.arange(len(ndf)), ndf), indptr, indices
+
+
+def rcmOrder(indptr, indices):
+    """
+    Returns the reverse Cuthill-McKee order of a graph in compressed sparse
+    row form, as an array of rows. Each connected part starts from its node
+    with the lowest degree.
+    """
+    N = len(indptr) - 1
+    degree = np.diff(indptr)
+    visited = np.zeros(N, dtype=bool)
+    order = []
+    for start in np.argsort(degree, kind='stable'):
+        if visited[start]:
+            continue
+        visited[start] = True
+        queue = [start]
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            neighbours = indices[indptr[node]:indptr[node + 1]]
+            neighbours = neighbours[~visited[neighbours]]
+            neighbours = neighbours[np.argsort(degree[neighbours], kind='stable')]
+            visited[neighbours] = True
+            queue.extend(neighbours.tolist())
+        order.extend(queue)
+    return np.array(order[::-1], dtype=int)
+
+
+def minimumDegreeOrder(indptr, indices, weights=None):
+    """
+    Returns an approximate minimum degree order of a graph in compressed
+    sparse row form. The degree of a node is the summed ``weights`` of its
+    neighbours in the elimination graph, i.e. the dofs per node, so whole
+    nodes are eliminated as supervariables.
+
+    The elimination graph is kept as a quotient graph: each eliminated node
+    becomes an element holding the set of its remaining neighbours, and the
+    degrees are the approximate external degrees of the AMD algorithm, so no
+    cliques are formed. It runs in Python, and takes a few seconds for a model
+    of 1e4 nodes.
+    """
+    N = len(indptr) - 1
+    weight = (np.ones(N, dtype=int) if weights is None else np.asarray(weights)).tolist()
+    variables = [set(indices[indptr[i]:indptr[i + 1]].tolist()) for i in range(N)]
+    elements = [set() for i in range(N)]
+    members = {}
+    memberWeight = {}
+    degree = [sum(weight[j] for j in variables[i]) for i in range(N)]
+    heap = [(degree[i], i) for i in range(N)]
+    heapq.heapify(heap)
+    eliminated = [False] * N
+    remaining = sum(weight)
+    order = []
+    while heap:
+        d, pivot = heapq.heappop(heap)
+        if eliminated[pivot] or d != degree[pivot]:
+            continue
+        eliminated[pivot] = True
+        order.append(pivot)
+        remaining -= weight[pivot]
+
+        # the new element holds the neighbours of the pivot, and absorbs its elements
+        reach = set(variables[pivot])
+        absorbed = elements[pivot]
+        for element in absorbed:
+            reach |= members.pop(element)
+            del memberWeight[element]
+        reach.discard(pivot)
+        members[pivot] = reach
+        reachWeight = memberWeight[pivot] = sum(weight[j] for j in reach)
+        variables[pivot] = set()
+        elements[pivot] = set()
+
+        # weight of each other element outside the new one
+        outside = {}
+        for node in reach:
+            nodeElements = elements[node]
+            nodeElements -= absorbed
+            for element in nodeElements:
+                if element not in outside:
+                    outside[element] = memberWeight[element]
+                outside[element] -= weight[node]
+        for node in reach:
+            nodeVariables = variables[node]
+            nodeVariables -= reach
+            nodeVariables.discard(pivot)
+            external = sum(weight[j] for j in nodeVariables) + reachWeight - weight[node]
+            external += sum(outside[element] for element in elements[node])
+            elements[node].add(pivot)
+            degree[node] = min(external, remaining - weight[node])
+            heapq.heappush(heap, (degree[node], node))
+    return np.array(order, dtype=int)
+
+
+def _positions(order):
+    position = np.empty(len(order), dtype=int)
+    position[order] = np.arange(len(order))
+    return position
+
+
+def bandwidthProfile(order, indptr, indices, ndf=None):
+    """
+    Returns the half bandwidth, the profile, the number of entries below the
+    diagonal inside the envelope, and the sum of the squared row widths of the
+    envelope, of a graph numbered in ``order``. With ``ndf`` each node is a
+    block of that many dofs, numbered together.
+    """
+    N = len(indptr) - 1
+    ndf = np.ones(N, dtype=int) if ndf is None else np.asarray(ndf, dtype=int)
+    start = np.zeros(N, dtype=int)
+    start[order] = np.concatenate([[0], np.cumsum(ndf[order])[:-1]]) if N else start
+    rows = np.repeat(np.arange(N), np.diff(indptr))
+    lower = start[indices] < start[rows]
+    last = start[rows] + ndf[rows] - 1
+    bandwidth = int((last[lower] - start[indices][lower]).max(initial=0))
+    bandwidth = max(bandwidth, int(ndf.max(initial=1)) - 1)
+    lowest = start.copy()
+    np.minimum.at(lowest, rows, start[indices])
+    # each of the ndf rows of a node reaches down to the first dof of its lowest neighbour
+    offset = start - lowest
+    profile = ndf * offset + ndf * (ndf - 1) // 2
+    # the sum of the squared row widths gives the skyline factorization cost
+    width = np.arange(int(ndf.max(initial=1)))
+    squares = sum(((offset + t) ** 2 * (t < ndf)).sum() for t in width)
+    return bandwidth, int(profile.sum()), int(squares)
+
+
+def choleskyFill(order, indptr, indices, ndf=None):
+    """
+    Returns the number of entries of the Cholesky factor, including the
+    diagonal, and the number of operations to compute it, of a graph numbered
+    in ``order``. With ``ndf`` each node is a block of that many dofs.
+
+    The structure of the factor is found from the elimination tree, visiting
+    each of its entries once.
+    """
+    N = len(indptr) - 1
+    ndf = np.ones(N, dtype=int) if ndf is None else np.asarray(ndf, dtype=int)
+    position = _positions(order)
+    weight = ndf[order].tolist()
+    neighbours = [sorted(position[indices[indptr[node]:indptr[node + 1]]].tolist())
+                  for node in order]
+    parent = [-1] * N
+    ancestor = [-1] * N
+    mark = [-1] * N
+    below = [0] * N
+    for i in range(N):
+        lower = [k for k in neighbours[i] if k < i]
+        # elimination tree, with path compression
+        for k in lower:
+            while k != -1 and k < i:
+                following = ancestor[k]
+                ancestor[k] = i
+                if following == -1:
+                    parent[k] = i
+                k = following
+        # row i of the factor is the union of the tree paths from its entries
+        mark[i] = i
+        for k in lower:
+            while k != -1 and mark[k] != i:
+                mark[k] = i
+                below[k] += weight[i]
+                k = parent[k]
+    fill = 0
+    operations = 0
+    for k in range(N):
+        for t in range(weight[k]):
+            count = weight[k] - t + below[k]
+            fill += count
+            operations += count * count
+    return fill, operations
+
+
+def estimateOrderings(domain=None, orderings=('Plain', 'RCM', 'AMD'), fill=None):
+    """
+    Estimates the system of equations of a model under each numberer, and
+    returns the results as a dict with ``numEqn`` and, for each ordering, a
+    dict with the keys:
+
+    ========================   ===========================================================================
+    ``bandwidth``              half bandwidth, in dofs
+    ``profile``                number of entries below the diagonal inside the envelope
+    ``profileOps``             operations of a skyline factorization, the sum of the squared row widths
+    ``fill``                   number of entries of the sparse Cholesky factor, including the diagonal
+    ``fillOps``                operations of a sparse Cholesky factorization
+    ========================   ===========================================================================
+
+    ========================   ===========================================================================
+    ``domain``                 a :class:`openseespyhint.shadow.ShadowDomain`, by default the current model.
+                               (optional)
+    ``orderings`` |list|       the numberers to estimate, of ``'Plain'``, ``'RCM'`` and ``'AMD'``.
+                               (optional)
+    ``fill`` |list|            the orderings to find the Cholesky fill of, by default all of them. The
+                               other orderings get no ``fill`` and ``fillOps``. (optional)
+    ========================   ===========================================================================
+
+    Fixed dofs are counted as equations, and nodes tied by constraints are
+    not coupled, so the estimates are close upper bounds.
+
+    Hints: the fill is found in Python in time proportional to its size, which
+    for a banded order of a large model is the whole envelope. Limit ``fill``
+    to the orderings a sparse solver would use.
+    """
+    if domain is None:
+        domain = modelGeometry()
+    tags, indptr, indices = nodeGraph(domain)
+    ndf = nodeNdf(domain)
+    stats = {'numEqn': int(ndf.sum())}
+    makers = {'Plain': lambda: np.argsort(tags, kind='stable'),
+              'RCM': lambda: rcmOrder(indptr, indices),
+              'AMD': lambda: minimumDegreeOrder(indptr, indices, ndf)}
+    for name in orderings:
+        if name not in makers:
+            raise ValueError(f"orderings must be 'Plain', 'RCM' or 'AMD', got {name!r}")
+        order = makers[name]()
+        bandwidth, profile, profileOps = bandwidthProfile(order, indptr, indices, ndf)
+        stats[name] = {'bandwidth': bandwidth, 'profile': profile, 'profileOps': profileOps}
+        if fill is None or name in fill:
+            stats[name]['fill'], stats[name]['fillOps'] = choleskyFill(order, indptr, indices, ndf)
+    return stats
+
+
+def systemCosts(stats, spd=True):
+    """
+    Predicts the memory in bytes and the factorization operations of each
+    system for the estimates of :func:`estimateOrderings`, using for each
+    system the estimated ordering that needs the least memory. Returns a dict
+    of system name to ``{'numberer', 'bytes', 'operations'}``.
+
+    Symmetric positive definite systems are costed for ``BandSPD``,
+    ``ProfileSPD`` and ``SparseSYM``, other systems for ``BandGen`` and
+    ``UmfPack``. Sparse systems are costed with their own fill reducing order,
+    and include their integer indices. Orderings without a ``fill`` estimate
+    are costed for the sparse systems with their envelope, which holds the
+    factor, so the sparse costs are then upper bounds.
+    """
+    n = stats['numEqn']
+    names = [name for name in ('Plain', 'RCM', 'AMD') if name in stats]
+
+    def cost(memory, operations, orderings=names):
+        best = min(orderings, key=lambda name: memory(stats[name]))
+        return {'numberer': best, 'bytes': 8 * memory(stats[best]),
+                'operations': operations(stats[best])}
+
+    def fill(s):
+        return s['fill'] if 'fill' in s else s['profile'] + n
+
+    def fillOps(s):
+        return s['fillOps'] if 'fillOps' in s else s['profileOps']
+
+    sparseOrders = [name for name in names if name == 'AMD'] or names
+    if spd:
+        return {
+            'BandSPD': cost(lambda s: n * (s['bandwidth'] + 1), lambda s: n * s['bandwidth'] ** 2),
+            'ProfileSPD': cost(lambda s: s['profile'] + n, lambda s: s['profileOps']),
+            'SparseSYM': cost(lambda s: 1.5 * fill(s) + n, fillOps, sparseOrders),
+        }
+    # LU needs the upper factor as well, and room for pivoting
+    return {
+        'BandGen': cost(lambda s: n * (3 * s['bandwidth'] + 1), lambda s: 2 * n * s['bandwidth'] ** 2),
+        'UmfPack': cost(lambda s: 3 * fill(s) + n, lambda s: 2 * fillOps(s), sparseOrders),
+    }
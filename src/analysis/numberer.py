@@ -1,4 +1,4 @@
-import openseespy.opensees as ops
+from ..backend import ops
 
 def Plain():
     """
@@ -99,3 +99,25 @@ def ParallelRCM():
 
     ops.numberer('ParallelRCM')
 
+
+def auto(algorithm=None, integrator=None, spd=None, domain=None, constraints=None):
+    """
+    Constructs the system of equations and the numberer chosen for the model,
+    and returns the choice, see :func:`openseespyhint.analysis.system.auto`.
+    The numberer depends on the system it is chosen for, so both are chosen,
+    and sent, together, and calling either ``auto`` is enough.
+
+    ========================   ===========================================================================
+    ``algorithm`` |str|        the algorithm type, i.e. ``'Newton'``, by default the one recorded by the
+                               shadow domain. (optional)
+    ``integrator`` |str|       the integrator type, i.e. ``'DisplacementControl'``, by default the one
+                               recorded by the shadow domain. (optional)
+    ``spd`` |bool|             if the system is symmetric positive definite. (optional)
+    ``domain``                 a :class:`openseespyhint.shadow.ShadowDomain`, by default the current model.
+                               (optional)
+    ``constraints`` |str|      the constraint handler type, i.e. ``'Lagrange'``. (optional)
+    ========================   ===========================================================================
+    """
+    from . import system
+
+    return system.auto(algorithm, integrator, spd, domain, constraints)
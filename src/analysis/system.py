@@ -1,4 +1,9 @@
-import openseespy.opensees as ops
+import logging
+import os
+
+from ..backend import ops
+
+logger = logging.getLogger(__name__)
 
 def BandGen():
     """
@@ -150,3 +155,181 @@ def Mumps(icntl14=20., icntl7=7):
         uniqueArgs.append(icntl7)
     ops.system('Mumps',     *uniqueArgs)
 
+
+# Integrators that can follow a softening branch, where the stiffness is not
+# positive definite.
+indefiniteIntegrators = frozenset(['DisplacementControl', 'ParallelDisplacementControl',
+                                   'ArcLength', 'MinUnbalDispNorm'])
+
+# Algorithms that factor the matrix once, or rarely.
+factorOnceAlgorithms = frozenset(['Linear', 'ModifiedNewton'])
+
+# Parts of element type names with unsymmetric stiffness, i.e. friction and contact.
+unsymmetricElementKeys = ('slider', 'fpbearing', 'friction', 'contact', 'impact', 'eqsbearing')
+
+# Number of equations below which the sparse solvers are not considered, as
+# their setup outweighs the factorization.
+sparseLimit = 2000
+
+# Number of nodes above which the AMD order is not estimated. The minimum
+# degree order and its fill run in Python, and take about 0.4 s for a plane
+# quad mesh of 3000 nodes, growing faster than linearly.
+amdLimit = 3000
+
+# Share of the physical memory a system may use.
+memoryShare = 0.5
+
+
+def _physicalMemory():
+    try:
+        return os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def chooseSolver(algorithm=None, integrator=None, spd=None, domain=None, memoryLimit=None,
+                 constraints=None):
+    """
+    Chooses a system and numberer for the model from its size, connectivity
+    and symmetry, and returns the choice as a dict with the keys ``system``,
+    ``numberer``, ``spd``, ``stats``, ``costs`` and ``reasons``. Nothing is sent to
+    OpenSees, see :func:`auto`.
+
+    ========================   ===========================================================================
+    ``algorithm`` |str|        the algorithm type, i.e. ``'Newton'``. Algorithms that factor once are
+                               chosen on memory rather than factorization time. By default the
+                               algorithm recorded by the shadow domain. (optional)
+    ``integrator`` |str|       the integrator type, i.e. ``'DisplacementControl'``. Integrators that can
+                               follow softening need a solver for indefinite systems. By default the
+                               integrator recorded by the shadow domain. (optional)
+    ``spd`` |bool|             if the system is symmetric positive definite. By default it is found from
+                               the integrator, constraint handler and element types, and it is False if
+                               the integrator is not known. (optional)
+    ``domain``                 a :class:`openseespyhint.shadow.ShadowDomain`, by default the current model.
+                               (optional)
+    ``memoryLimit`` |int|      bytes a system may use, by default half the physical memory. Systems
+                               predicted to need more are not chosen. (optional)
+    ``constraints`` |str|      the constraint handler type, i.e. ``'Lagrange'``, whose multipliers make
+                               the system indefinite. By default the handler recorded by the shadow
+                               domain. (optional)
+    ========================   ===========================================================================
+
+    The memory and factorization cost of each system are predicted by
+    :func:`openseespyhint.analysis.graph.systemCosts`. The fill of the sparse
+    systems is estimated with the AMD order for models of up to
+    :data:`amdLimit` nodes, and bounded by the envelope of the best band order
+    for larger ones.
+
+    Hints: the estimates run in Python. The graph and the band orders take
+    about 0.1 s for 1e4 nodes, the AMD estimate about 0.4 s at the default
+    :data:`amdLimit`, and 7 s for 2e4 nodes.
+    """
+    from ..output.modelJSON import modelGeometry
+    from .graph import estimateOrderings, nodeNdf, systemCosts
+
+    if domain is None:
+        domain = modelGeometry()
+    if algorithm is None:
+        algorithm = getattr(domain, 'algorithm', None)
+    if integrator is None:
+        integrator = getattr(domain, 'integrator', None)
+    ndf = nodeNdf(domain)
+    n = int(ndf.sum())
+    reasons = [f'about {n} equations']
+    orderings = ('Plain', 'RCM')
+    fill = ()
+    if n >= sparseLimit:
+        if len(ndf) <= amdLimit:
+            orderings, fill = ('Plain', 'RCM', 'AMD'), ('AMD',)
+        else:
+            reasons.append(f'more than {amdLimit} nodes, so the AMD order is not estimated, and the '
+                           f'sparse systems are costed with the envelope of the best band order')
+    stats = estimateOrderings(domain, orderings, fill)
+
+    if spd is None:
+        spd = True
+        if integrator is None:
+            spd = False
+            reasons.append('the integrator is not known, so the system is not taken as '
+                           'symmetric positive definite')
+        elif integrator in indefiniteIntegrators:
+            spd = False
+            reasons.append(f'the {integrator} integrator can follow softening, '
+                           f'so the system may be indefinite')
+        if constraints is None:
+            constraints = getattr(domain, 'constraints', None)
+        if constraints == 'Lagrange':
+            spd = False
+            reasons.append('Lagrange multipliers for the constraints make the system indefinite')
+        types = {name for name in domain.eleTypeNames
+                 if any(key in name.lower() for key in unsymmetricElementKeys)}
+        if types:
+            spd = False
+            reasons.append(f"elements of type {', '.join(sorted(types))} have unsymmetric stiffness")
+        if spd:
+            reasons.append('the system is taken as symmetric positive definite')
+
+    costs = systemCosts(stats, spd)
+    if n < sparseLimit:
+        costs = {name: cost for name, cost in costs.items() if name not in ('SparseSYM', 'UmfPack')}
+        reasons.append(f'fewer than {sparseLimit} equations, so the sparse solvers are not used')
+    if memoryLimit is None:
+        physical = _physicalMemory()
+        memoryLimit = physical * memoryShare if physical else None
+    if memoryLimit is not None:
+        fits = {name: cost for name, cost in costs.items() if cost['bytes'] <= memoryLimit}
+        for name in sorted(set(costs) - set(fits)):
+            reasons.append(f"{name} would need about {costs[name]['bytes'] / 2 ** 20:.0f} MB, "
+                           f"more than the {memoryLimit / 2 ** 20:.0f} MB limit")
+        if fits:
+            costs = fits
+        else:
+            smallest = min(costs, key=lambda name: costs[name]['bytes'])
+            costs = {smallest: costs[smallest]}
+            reasons.append('no system fits in the memory limit, so the smallest is used')
+
+    byMemory = algorithm in factorOnceAlgorithms
+    reasons.append(f'the {algorithm} algorithm factors rarely, so memory decides' if byMemory
+                   else 'the matrix is factored often, so factorization time decides')
+    key = 'bytes' if byMemory else 'operations'
+    other = 'operations' if byMemory else 'bytes'
+    system = min(costs, key=lambda name: (costs[name][key], costs[name][other]))
+    cost = costs[system]
+    reasons.append(f"{system} with {cost['numberer']} numbering needs about "
+                   f"{cost['bytes'] / 2 ** 20:.3g} MB and {cost['operations']:.3g} operations "
+                   f"per factorization")
+    choice = {'system': system, 'numberer': cost['numberer'], 'costs': costs}
+
+    for reason in reasons:
+        logger.info(reason)
+    choice.update(spd=spd, stats=stats, reasons=reasons)
+    return choice
+
+
+def auto(algorithm=None, integrator=None, spd=None, domain=None, constraints=None):
+    """
+    Constructs the system of equations and the numberer chosen for the model
+    by :func:`chooseSolver`, and returns the choice. The reasons for the
+    choice are logged at the info level, and returned in
+    ``choice['reasons']``.
+
+    ========================   ===========================================================================
+    ``algorithm`` |str|        the algorithm type, i.e. ``'Newton'``, by default the one recorded by the
+                               shadow domain. (optional)
+    ``integrator`` |str|       the integrator type, i.e. ``'DisplacementControl'``, by default the one
+                               recorded by the shadow domain. (optional)
+    ``spd`` |bool|             if the system is symmetric positive definite. (optional)
+    ``domain``                 a :class:`openseespyhint.shadow.ShadowDomain`, by default the current model.
+                               (optional)
+    ``constraints`` |str|      the constraint handler type, i.e. ``'Lagrange'``. (optional)
+    ========================   ===========================================================================
+
+    Bandwidth and profile systems get the numberer that gives them the
+    smallest matrix, and sparse systems ``AMD``, so the two are chosen, and
+    sent, together. :func:`openseespyhint.analysis.numberer.auto` does the
+    same.
+    """
+    choice = chooseSolver(algorithm, integrator, spd, domain, constraints=constraints)
+    ops.system(choice['system'])
+    ops.numberer(choice['numberer'])
+    return choice
@@ -1,4 +1,4 @@
-import openseespy.opensees as ops
+from ..backend import ops
 
 def NormUnbalance(tol, iter, pFlag=0, nType=None, maxIncr=None):
     """
@@ -0,0 +1,248 @@
+"""
+The backends that the command wrappers send their OpenSees commands to.
+
+Every wrapper calls ``ops.<command>(*args)``, where ``ops`` is the proxy
+defined in this module. The proxy forwards each command to the active backend:
+
+* ``OpenSeesBackend`` - runs the command in openseespy (default). The native
+  library is only loaded when the first command is sent.
+* ``NullBackend`` - accepts and counts every command without running it.
+* ``RecordingBackend`` - stores every command and its arguments, and
+  optionally forwards it to another backend.
+
+The default backend can be set with the ``OPENSEESPYHINT_BACKEND`` environment
+variable, i.e. ``OPENSEESPYHINT_BACKEND=null`` dry runs a model script.
+
+For example,
+
+.. code-block:: python
+
+   import openseespyhint as op
+   from openseespyhint.backend import useBackend, NullBackend
+
+   with useBackend(NullBackend()) as backend:
+       buildModel()
+   print(backend.counts['element'])
+
+"""
+import collections
+import contextlib
+import importlib
+import os
+
+
+class Backend:
+    """
+    Base class for backends. Commands a backend doesn't handle itself are
+    forwarded to ``inner``.
+
+    Backends resolve a command the first time it is looked up, and store the
+    resulting callable on the instance so later look ups are plain attribute
+    access.
+    """
+
+    def __init__(self, inner=None):
+        self.inner = inner
+
+    def __getattr__(self, cmd):
+        inner = self.__dict__.get('inner')
+        if cmd.startswith('_') or inner is None:
+            raise AttributeError(cmd)
+        return getattr(inner, cmd)
+
+
+class OpenSeesBackend(Backend):
+    """
+    Runs commands in openseespy.
+    """
+
+    def __getattr__(self, cmd):
+        if cmd.startswith('_'):
+            raise AttributeError(cmd)
+        opensees = importlib.import_module('openseespy.opensees')
+        command = getattr(opensees, cmd)
+        setattr(self, cmd, command)
+        return command
+
+
+class NullBackend(Backend):
+    """
+    Accepts every command without running it. Each command returns 0, the
+    OpenSees success code, and the number of calls to each command is counted
+    in ``counts``.
+
+    The queries that return a list in OpenSees return an empty list, so
+    helpers that iterate over them, i.e. the bulk queries of
+    :mod:`openseespyhint.output`, see an empty domain. Queries of a single
+    component, i.e. ``nodeDisp(tag, dof)``, return 0.
+    """
+
+    # Queries that return a list, and the number of arguments from which they
+    # return a single component instead. None if they always return a list.
+    listQueries = {
+        'getNodeTags': None, 'getEleTags': None, 'getFixedNodes': None, 'getFixedDOFs': None,
+        'getPatterns': None, 'nodeDOFs': None, 'nodeBounds': None, 'eleNodes': None,
+        'eleResponse': None, 'basicForce': None, 'basicDeformation': None,
+        'basicStiffness': None, 'sectionStiffness': None, 'sectionFlexibility': None,
+        'testNorm': None, 'eigen': None,
+        'nodeDisp': 2, 'nodeVel': 2, 'nodeAccel': 2, 'nodeReaction': 2, 'nodeUnbalance': 2,
+        'nodeCoord': 2, 'nodeMass': 2, 'nodeEigenvector': 3, 'eleForce': 2,
+        'eleDynamicalForce': 2, 'sectionForce': 3, 'sectionDeformation': 3,
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.counts = collections.Counter()
+
+    def __getattr__(self, cmd):
+        if cmd.startswith('_'):
+            raise AttributeError(cmd)
+        counts = self.counts
+        if cmd in self.listQueries:
+            componentArgs = self.listQueries[cmd]
+
+            def command(*args):
+                counts[cmd] += 1
+                if componentArgs is not None and len(args) >= componentArgs:
+                    return 0
+                return []
+        else:
+            def command(*args):
+                counts[cmd] += 1
+                return 0
+
+        setattr(self, cmd, command)
+        return command
+
+
+class RecordingBackend(Backend):
+    """
+    Stores every command as a ``(cmd, args)`` tuple in ``calls``, which is a
+    list unless another container with an ``append`` method, i.e. a
+    :class:`openseespyhint.tape.Tape`, is given.
+
+    If ``inner`` is given, the command is also sent to it and its result is
+    returned, otherwise the command returns 0.
+    """
+
+    def __init__(self, inner=None, calls=None):
+        super().__init__(inner)
+        self.calls = [] if calls is None else calls
+
+    def __getattr__(self, cmd):
+        if cmd.startswith('_'):
+            raise AttributeError(cmd)
+        calls = self.calls
+        if self.inner is None:
+            def command(*args):
+                calls.append((cmd, args))
+                return 0
+        else:
+            target = getattr(self.inner, cmd)
+
+            def command(*args):
+                calls.append((cmd, args))
+                return target(*args)
+
+        setattr(self, cmd, command)
+        return command
+
+
+backendTypes = {'opensees': OpenSeesBackend,
+                'null': NullBackend,
+                'recording': RecordingBackend}
+
+
+class _Proxy:
+    """
+    Forwards ``ops.<command>`` to the active backend. Looked up commands are
+    cached on the proxy until the backend changes.
+    """
+
+    def __getattr__(self, cmd):
+        if cmd.startswith('_'):
+            raise AttributeError(cmd)
+        command = getattr(_backend, cmd)
+        self.__dict__[cmd] = command
+        return command
+
+
+ops = _Proxy()
+_backend = backendTypes[os.environ.get('OPENSEESPYHINT_BACKEND', 'opensees')]()
+
+
+def getBackend():
+    """
+    Returns the active backend.
+    """
+    return _backend
+
+
+def setBackend(backend):
+    """
+    Sets the backend used by all wrappers and returns the previous one.
+
+    ========================   ===========================================================================
+    ``backend``                a backend object, or one of ``'opensees'``, ``'null'`` or ``'recording'``
+    ========================   ===========================================================================
+    """
+    global _backend
+    if isinstance(backend, str):
+        backend = backendTypes[backend]()
+    previous = _backend
+    _backend = backend
+    ops.__dict__.clear()
+    return previous
+
+
+@contextlib.contextmanager
+def useBackend(backend):
+    """
+    Sets the backend for the duration of a ``with`` block, and yields it.
+    """
+    previous = setBackend(backend)
+    try:
+        yield _backend
+    finally:
+        setBackend(previous)
+
+
+def findLayer(layerType):
+    """
+    Returns the first layer of the active backend that is an instance of
+    ``layerType``, following the ``inner`` chain, or None if there is none.
+    """
+    backend = _backend
+    while backend is not None:
+        if isinstance(backend, layerType):
+            return backend
+        backend = backend.__dict__.get('inner')
+    return None
+
+
+def removeLayer(layerType):
+    """
+    Unlinks the first layer of the active backend that is an instance of
+    ``layerType``, wherever it sits in the ``inner`` chain, and returns it.
+    Raises ValueError if there is no such layer.
+
+    The layers above it drop the commands they have cached, so the next look
+    up goes through the remaining layers.
+    """
+    above = []
+    backend = _backend
+    while backend is not None and not isinstance(backend, layerType):
+        above.append(backend)
+        backend = backend.__dict__.get('inner')
+    if backend is None:
+        raise ValueError(f'{layerType.__name__} is not a layer of the active backend')
+    if not above:
+        setBackend(backend.inner)
+        return backend
+    above[-1].inner = backend.inner
+    for layer in above:
+        for name, value in list(layer.__dict__.items()):
+            if name != 'inner' and callable(value):
+                del layer.__dict__[name]
+    ops.__dict__.clear()
+    return backend
@@ -0,0 +1,121 @@
+"""
+Memoizes query commands, i.e. ``nodeDisp`` or ``eleForce``, between commands
+that change the domain.
+
+Post processing code often asks for the same response many times in one step.
+With the cache enabled, a query is only sent to OpenSees the first time it is
+made with a set of arguments, and later calls return the stored value. Every
+command that is not a known query, i.e. ``analyze``, ``setTime``,
+``setNodeDisp`` or ``wipe``, starts a new stamp and clears the stored values.
+
+.. code-block:: python
+
+   import openseespyhint as op
+   from openseespyhint.cache import enableCache
+
+   cache = enableCache()
+   for ii in range(Nsteps):
+       op.analysis.analyze(1)
+       monitor()  # repeated queries only cross into OpenSees once per step
+   print(cache.hits, cache.misses)
+
+"""
+from .backend import Backend, findLayer, getBackend, removeLayer, setBackend
+
+
+# Commands that only read the domain. Any other command invalidates the cache.
+queryCommands = frozenset([
+    'nodeDisp', 'nodeVel', 'nodeAccel', 'nodeReaction', 'nodeUnbalance',
+    'nodeResponse', 'nodeCoord', 'nodeEigenvector', 'nodeMass', 'nodeDOFs',
+    'nodeBounds', 'nodePressure', 'eleForce', 'eleDynamicalForce',
+    'eleResponse', 'eleNodes', 'getNodeTags', 'getEleTags', 'basicForce',
+    'basicDeformation', 'basicStiffness', 'sectionForce', 'sectionDeformation',
+    'sectionStiffness', 'sectionFlexibility', 'sectionLocation',
+    'sectionWeight', 'getTime', 'getLoadFactor', 'testIter', 'testNorm',
+    'numIter', 'systemSize', 'getNumThreads', 'version',
+])
+
+
+class CacheBackend(Backend):
+    """
+    Forwards every command to ``inner``, and stores the results of query
+    commands by ``(cmd, args)`` until the next command that is not a query.
+
+    ``stamp`` counts the commands that invalidated the cache, and ``hits`` and
+    ``misses`` count the cached and forwarded queries.
+    """
+
+    def __init__(self, inner, queries=queryCommands):
+        super().__init__(inner)
+        self.queries = queries
+        self.stamp = 0
+        self.hits = 0
+        self.misses = 0
+        self._values = {}
+
+    def clear(self):
+        """
+        Clears the stored values and starts a new stamp.
+        """
+        self._values.clear()
+        self.stamp += 1
+
+    def __getattr__(self, cmd):
+        if cmd.startswith('_'):
+            raise AttributeError(cmd)
+        target = getattr(self.inner, cmd)
+        values = self._values
+
+        if cmd in self.queries:
+            def command(*args):
+                key = (cmd, args)
+                try:
+                    value = values[key]
+                except KeyError:
+                    value = values[key] = target(*args)
+                    self.misses += 1
+                except TypeError:
+                    # unhashable arguments are never cached
+                    return target(*args)
+                else:
+                    self.hits += 1
+                # lists are copied so callers can't change the stored value
+                return list(value) if isinstance(value, list) else value
+        else:
+            def command(*args):
+                if values:
+                    values.clear()
+                self.stamp += 1
+                return target(*args)
+
+        setattr(self, cmd, command)
+        return command
+
+
+def getCache():
+    """
+    Returns the cache layer of the active backend, or None if the cache is not
+    enabled.
+    """
+    return findLayer(CacheBackend)
+
+
+def enableCache():
+    """
+    Starts memoizing query commands, and returns the cache layer. If the cache
+    is already enabled the existing layer is returned.
+    """
+    cache = getCache()
+    if cache is None:
+        cache = CacheBackend(getBackend())
+        setBackend(cache)
+    return cache
+
+
+def disableCache():
+    """
+    Stops memoizing query commands. The layer is removed wherever it sits in
+    the active backend.
+    """
+    if findLayer(CacheBackend) is not None:
+        removeLayer(CacheBackend)
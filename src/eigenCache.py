@@ -0,0 +1,242 @@
+"""
+Reuses eigen analyses of a model that has not changed.
+
+Scripts often call ``eigen`` several times on the same model, i.e. for the
+Rayleigh coefficients, modal damping, plots and reports. The eigen cache is a
+backend layer that keeps a fingerprint of the model: a hash of every command
+sent since the last ``wipe``, apart from queries. An ``eigen`` call with the
+same fingerprint and arguments as an earlier one returns the stored
+eigenvalues, and ``nodeEigenvector`` then returns the stored eigenvectors.
+
+After a cache hit the eigenvectors in the OpenSees domain are those of the
+last solve, which may be of another model or other modes. Commands sent
+through the backend that read them, i.e. ``modalDamping``, ``printModel``
+and recorders of ``eigen`` responses, solve the served problem in OpenSees
+first if needed. Other recorders don't, so the cache still saves the solve
+in a script that creates displacement recorders after ``eigen``.
+Code that calls openseespy directly, such as the mode shape plots of
+``ops_vis``, only sees the served modes after
+:meth:`EigenCacheBackend.restoreDomain`.
+
+With a ``path`` the results are also saved to disk, so a script that builds
+the same model again in a later run skips the solve as well.
+
+.. code-block:: python
+
+   from openseespyhint.eigenCache import enableEigenCache
+
+   enableEigenCache('eigen')
+   buildModel()
+   lambdas = op.analysis.eigen(numEigenvalues=10)  # solved, and saved
+   rayleigh(lambdas)
+   lambdas = op.analysis.eigen(numEigenvalues=10)  # read from the cache
+
+"""
+import hashlib
+import os
+
+import numpy as np
+
+from .backend import Backend, findLayer, getBackend, removeLayer, setBackend
+from .cache import queryCommands
+
+
+# Commands that don't change the model, on top of the queries.
+_keepCommands = frozenset(['eigen', 'record', 'recorder', 'printModel', 'logFile',
+                           'setNumThreads'])
+
+# Commands that read the eigen results stored in the domain. Recorders only
+# read them for eigen responses, see EigenCacheBackend.recorder.
+_domainEigenCommands = frozenset(['modalDamping', 'modalDampingQ', 'modalProperties',
+                                  'responseSpectrumAnalysis', 'printModel'])
+
+
+class EigenCacheBackend(Backend):
+    """
+    Forwards every command to ``inner``, hashes the commands that change the
+    model, and serves repeated ``eigen`` calls from stored results.
+
+    ========================   ===========================================================================
+    ``path`` |str|             directory where results are saved as ``.npz`` files, and read from by
+                               later runs. (optional)
+    ``hits`` |int|             number of eigen calls served from the cache
+    ``misses`` |int|           number of eigen calls solved by OpenSees
+    ========================   ===========================================================================
+
+    Commands sent straight to openseespy, rather than through the wrappers or
+    :data:`openseespyhint.backend.ops`, are not seen by the cache and must not
+    change the model while it is enabled.
+    """
+
+    def __init__(self, inner, path=None):
+        super().__init__(inner)
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._results = {}
+        self._hash = hashlib.blake2b(digest_size=16)
+        self._served = None
+        self._domainKey = None
+        self._servedArgs = None
+        self._eigenRecorders = False
+
+    @property
+    def fingerprint(self):
+        """
+        The hash of the model commands sent since the last ``wipe``, as hex.
+        """
+        return self._hash.hexdigest()
+
+    def clear(self):
+        """
+        Drops the results stored in memory. Saved files are kept.
+        """
+        self._results.clear()
+        self._served = None
+
+    def _key(self, args):
+        key = self._hash.copy()
+        key.update(repr(('eigen', args)).encode())
+        return key.hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.path, f'eigen-{key}.npz')
+
+    def _load(self, key):
+        result = self._results.get(key)
+        if result is None and self.path is not None and os.path.exists(self._file(key)):
+            with np.load(self._file(key)) as data:
+                result = self._results[key] = {name: data[name] for name in data.files}
+        return result
+
+    def _solve(self, key, args):
+        values = self.inner.eigen(*args)
+        self.misses += 1
+        self._domainKey = key
+        tags = np.array(self.inner.getNodeTags(), dtype=int)
+        ndf = np.array([len(self.inner.nodeDOFs(int(tag))) for tag in tags], dtype=int)
+        vectors = np.full((len(values), len(tags), ndf.max(initial=0)), np.nan)
+        for row, tag in enumerate(tags):
+            for mode in range(len(values)):
+                vectors[mode, row, :ndf[row]] = self.inner.nodeEigenvector(int(tag), mode + 1)
+        result = self._results[key] = {'values': np.array(values), 'tags': tags,
+                                       'ndf': ndf, 'vectors': vectors}
+        if self.path is not None:
+            os.makedirs(self.path, exist_ok=True)
+            temporary = self._file(key) + '.tmp.npz'
+            np.savez(temporary, **result)
+            os.replace(temporary, self._file(key))
+        return result
+
+    def eigen(self, *args):
+        key = self._key(args)
+        result = self._load(key)
+        if result is None:
+            result = self._solve(key, args)
+        else:
+            self.hits += 1
+        self._servedArgs = (key, args)
+        index = {int(tag): row for row, tag in enumerate(result['tags'])}
+        self._served = dict(result, index=index)
+        return result['values'].tolist()
+
+    def nodeEigenvector(self, nodeTag, mode, *dof):
+        served = self._served
+        if served is None:
+            return self.inner.nodeEigenvector(nodeTag, mode, *dof)
+        row = served['index'][int(nodeTag)]
+        values = served['vectors'][int(mode) - 1, row, :served['ndf'][row]]
+        if dof and dof[0] > 0:
+            return float(values[dof[0] - 1])
+        return values.tolist()
+
+    def recorder(self, *args):
+        if any(isinstance(arg, str) and arg.lower().startswith('eigen') for arg in args):
+            self._eigenRecorders = True
+            self.restoreDomain()
+        return self.inner.recorder(*args)
+
+    def record(self, *args):
+        if self._eigenRecorders:
+            self.restoreDomain()
+        return self.inner.record(*args)
+
+    def restoreDomain(self):
+        """
+        Solves the last served eigen problem in OpenSees if the domain holds
+        other results, so code that reads the eigenvectors from the domain
+        sees the served modes. Call it before plotting mode shapes with
+        ``ops_vis`` or other code that calls openseespy directly.
+        """
+        if self._servedArgs is None:
+            return
+        key, args = self._servedArgs
+        if key != self._domainKey:
+            self.inner.eigen(*args)
+            self.misses += 1
+            self._domainKey = key
+
+    def __getattr__(self, cmd):
+        if cmd.startswith('_'):
+            raise AttributeError(cmd)
+        target = getattr(self.inner, cmd)
+
+        if cmd in _domainEigenCommands:
+            keep = cmd in _keepCommands
+
+            def command(*args):
+                self.restoreDomain()
+                if not keep:
+                    self._hash.update(repr((cmd, args)).encode())
+                return target(*args)
+        elif cmd in queryCommands or cmd in _keepCommands:
+            command = target
+        elif cmd == 'wipe':
+            def command(*args):
+                self._hash = hashlib.blake2b(digest_size=16)
+                self._served = self._servedArgs = self._domainKey = None
+                self._eigenRecorders = False
+                return target(*args)
+        else:
+            def command(*args):
+                self._hash.update(repr((cmd, args)).encode())
+                return target(*args)
+
+        setattr(self, cmd, command)
+        return command
+
+
+def getEigenCache():
+    """
+    Returns the eigen cache layer of the active backend, or None if the eigen
+    cache is not enabled.
+    """
+    return findLayer(EigenCacheBackend)
+
+
+def enableEigenCache(path=None):
+    """
+    Starts caching eigen results, and returns the cache layer. If the eigen
+    cache is already enabled the existing layer is returned.
+
+    ========================   ===========================================================================
+    ``path`` |str|             directory the results are saved to and read from. (optional)
+    ========================   ===========================================================================
+
+    Enable the cache before the model is built, so the fingerprint covers
+    the whole model.
+    """
+    cache = getEigenCache()
+    if cache is None:
+        cache = EigenCacheBackend(getBackend(), path)
+        setBackend(cache)
+    return cache
+
+
+def disableEigenCache():
+    """
+    Stops caching eigen results. The layer is removed wherever it sits in the
+    active backend.
+    """
+    if findLayer(EigenCacheBackend) is not None:
+        removeLayer(EigenCacheBackend)
@@ -1,4 +1,4 @@
-import openseespy.opensees as ops
+from ..backend import ops
 
 def fix(nodeTag, constrValues= [0,0,0]):
     """
@@ -101,3 +101,76 @@ def fixZ(z, constrValues, tol=None):
 
 
 
+def fixMany(nodeTags, constrValues):
+    """
+    Create homogeneous SP constraints at many nodes at once. Nodes whose
+    constraint values are all ``0`` are skipped.
+
+    ========================   ===========================================================================
+    ``nodeTags`` |arrayi|      (N,) tags of nodes to be constrained
+    ``constrValues`` |arrayi|  (N, ndf) boolean mask or constraint values (0 or 1), or one row used for
+                               every node.
+
+                               * ``0`` free
+
+                               * ``1`` fixed
+    ========================   ===========================================================================
+
+    For example,
+
+    .. code-block:: python
+
+       # fix x and y at the base nodes, and only y at the roller
+       mask = np.array([[1, 1], [1, 1], [0, 1]], dtype=bool)
+       fixMany([1, 2, 3], mask)
+
+    """
+    import numpy as np
+    from .bulk import asTags, asRows
+    nodeTags = asTags(nodeTags, 'nodeTags')
+    constrValues = asRows(constrValues, nodeTags.size, 'constrValues', dtype=int)
+    isFixed = np.any(constrValues != 0, axis=1)
+    fix = ops.fix
+    for nodeTag, values in zip(nodeTags[isFixed].tolist(), constrValues[isFixed].tolist()):
+        fix(nodeTag, *values)
+
+def fixWhere(predicate, constrValues, nodeTags=None, crds=None):
+    """
+    Create homogeneous SP constraints at every node whose coordinates satisfy
+    a condition. The nodes are selected in one vectorized pass over the
+    coordinate table, which is taken from the shadow domain if no tags and
+    coordinates are given.
+
+    ========================   ===========================================================================
+    ``predicate``              function that takes the (N, ndm) coordinate array and returns a (N,)
+                               boolean array of the nodes to constrain
+    ``constrValues`` |listi|   constraint values (0 or 1) used for every selected node.
+    ``nodeTags`` |arrayi|      (N,) node tags (optional)
+    ``crds`` |arrayf|          (N, ndm) nodal coordinates (optional)
+    ========================   ===========================================================================
+
+    Returns the tags of the constrained nodes.
+
+    For example,
+
+    .. code-block:: python
+
+       # fix every node on the base, y = 0
+       fixWhere(lambda xy: np.abs(xy[:, 1]) < 1e-8, [1, 1, 1], tags, coords)
+
+    """
+    import numpy as np
+    from .bulk import asTags, asRows
+    if nodeTags is None:
+        from ..shadow import getShadow
+        shadow = getShadow()
+        if shadow is None:
+            raise ValueError('nodeTags and crds are required unless the shadow domain is enabled')
+        nodeTags, crds = shadow.nodeTags, shadow.coords
+    nodeTags = asTags(nodeTags, 'nodeTags')
+    crds = asRows(crds, nodeTags.size, 'crds')
+    selected = np.asarray(predicate(crds), dtype=bool)
+    if selected.shape != nodeTags.shape:
+        raise ValueError(f'predicate must return a boolean array of shape {nodeTags.shape}, got {selected.shape}')
+    fixMany(nodeTags[selected], constrValues)
+    return nodeTags[selected]
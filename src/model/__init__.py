@@ -1,41 +1,35 @@
-# from .beamIntegration import *
-from . import beamIntegration
+import importlib
 
-# from .block import *
-from . import block
+from ..backend import ops
 
+# Submodules are imported on first attribute access, so the large element and
+# material modules are only compiled and loaded when they are used.
+_submodules = ['beamIntegration', 'block', 'element', 'geomTransf', 'pattern',
+               'SPconstraint', 'timeSeries', 'uniaxialMaterial']
 
-# from .element import *
-from . import element
+# Array based commands, which live in bulk.py so numpy is only imported when
+# they are used.
+_bulkCommands = ['nodes']
 
-# from .frictionModel import *
 
-from .geomTransf import *
-from . import geomTransf
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module('.' + name, __name__)
+    if name in _bulkCommands:
+        command = getattr(importlib.import_module('.bulk', __name__), name)
+        globals()[name] = command
+        return command
+    # The geomTransf commands used to be star imported into this namespace.
+    if not name.startswith('_'):
+        geomTransf = importlib.import_module('.geomTransf', __name__)
+        if hasattr(geomTransf, name):
+            return getattr(geomTransf, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-# from .mp_constraint import *
-# from .ndMaterial import *
+def __dir__():
+    return sorted(set(globals()) | set(_submodules) | set(_bulkCommands))
 
-# from .pattern import *
-from . import pattern
-
-# from .rayleigh import *
-
-# from .section import *
-
-# from .SP_Constraint import *
-from . import SPconstraint
-
-# from .timeSeries import *
-from . import timeSeries
-
-
-# from .uniaxialMaterial import *
-from . import uniaxialMaterial
-
-
-import openseespy.opensees as ops
 
 def basic(ndm, ndf=None):
     """
@@ -1,4 +1,4 @@
-import openseespy.opensees as ops
+from ..backend import ops
 
 
 def block2D(numX, numY, startNode, startEle, eleType, eleArgs, crds):
@@ -0,0 +1,195 @@
+"""
+Array based model building commands, and the checks they share.
+
+The bulk commands check the shapes of their inputs once, convert them to
+Python lists in one step, and then send one OpenSees command per object with
+as little work per object as possible.
+"""
+from itertools import repeat
+
+import numpy as np
+
+from ..backend import ops
+
+
+def asTags(tags, name='tags'):
+    """
+    Returns the input as a 1D integer array, and checks that it contains no
+    duplicate tags.
+    """
+    tags = np.asarray(tags)
+    if tags.ndim != 1:
+        raise ValueError(f'{name} must be a 1D array, got shape {tags.shape}')
+    if not np.issubdtype(tags.dtype, np.integer):
+        if tags.size and not np.all(np.mod(tags, 1) == 0):
+            raise ValueError(f'{name} must be integers')
+        tags = tags.astype(int)
+    ordered = np.sort(tags)
+    if np.any(ordered[1:] == ordered[:-1]):
+        raise ValueError(f'{name} contains duplicate tags')
+    return tags
+
+
+def asRows(values, N, name, width=None, dtype=float):
+    """
+    Returns the input as an (N, width) array. A single row is repeated for
+    every object.
+    """
+    values = np.asarray(values, dtype=dtype)
+    if values.ndim == 1:
+        values = np.broadcast_to(values, (N, values.size))
+    if values.ndim != 2 or values.shape[0] != N:
+        raise ValueError(f'{name} must have shape ({N}, n), got {values.shape}')
+    if width is not None and values.shape[1] != width:
+        raise ValueError(f'{name} must have {width} columns, got {values.shape[1]}')
+    return values
+
+
+def asColumn(values, N, name, dtype=float):
+    """
+    Returns the input as a length N array. A scalar is repeated for every
+    object.
+    """
+    values = np.asarray(values, dtype=dtype)
+    if values.ndim > 1 or (values.ndim == 1 and values.size != N):
+        raise ValueError(f'{name} must be a scalar or have length {N}, got shape {values.shape}')
+    return np.broadcast_to(values, (N,))
+
+
+def asElements(eleTags, eleNodes, nen):
+    """
+    Checks the element tags and returns them with the (N, nen) integer
+    connectivity array.
+    """
+    eleTags = asTags(eleTags, 'eleTags')
+    N = eleTags.size
+    eleNodes = np.asarray(eleNodes)
+    if eleNodes.shape != (N, nen):
+        raise ValueError(f'eleNodes must have shape ({N}, {nen}), got {eleNodes.shape}')
+    if not np.issubdtype(eleNodes.dtype, np.integer):
+        if eleNodes.size and not np.all(np.mod(eleNodes, 1) == 0):
+            raise ValueError('eleNodes must be integers')
+        eleNodes = eleNodes.astype(int)
+    return eleTags, eleNodes
+
+
+def _join(args, segment):
+    if isinstance(args, tuple) and isinstance(segment, tuple):
+        return args + segment
+    if isinstance(args, tuple):
+        return [args + row for row in segment]
+    if isinstance(segment, tuple):
+        return [row + segment for row in args]
+    return [row + rowSegment for row, rowSegment in zip(args, segment)]
+
+
+def optionArgs(*options):
+    """
+    Collects the optional arguments of each object, keeping the order of the
+    options. Each option is one of:
+
+    * a flag, i.e. ``'-cMass'``, used for every object.
+    * ``(flag, values)``, where values is None (option skipped), a tuple used
+      for every object, or an (N,) or (N, n) array.
+
+    Returns a tuple if the arguments are the same for every object, otherwise
+    a list with a tuple of arguments for each object.
+    """
+    args = ()
+    for option in options:
+        if isinstance(option, str):
+            args = _join(args, (option,))
+            continue
+        flag, values = option
+        if values is None:
+            continue
+        if isinstance(values, tuple):
+            segment = (flag, *values)
+        elif values.size == 0:
+            continue
+        elif values.strides[0] == 0:
+            segment = (flag, *np.atleast_1d(values[0]).tolist())
+        elif values.ndim == 1:
+            segment = [(flag, value) for value in values.tolist()]
+        else:
+            segment = [(flag, *row) for row in values.tolist()]
+        args = _join(args, segment)
+    return args
+
+
+def elements(eleType, eleTags, eleNodes, properties, options=()):
+    """
+    Sends one element command per row, as
+    ``element(eleType, tag, *nodes, *properties, *options)``.
+
+    ``eleTags`` and ``eleNodes`` are the checked arrays from :func:`asElements`,
+    ``properties`` is a list of (N,) arrays of the positional arguments that
+    follow the nodes, and ``options`` are collected by :func:`optionArgs`.
+    """
+    element = ops.element
+    args = optionArgs(*options)
+    if all(column.strides[0] == 0 for column in properties) and isinstance(args, tuple):
+        shared = tuple(column[0].item() for column in properties) if eleTags.size else ()
+        for tag, nodes in zip(eleTags.tolist(), eleNodes.tolist()):
+            element(eleType, tag, *nodes, *shared, *args)
+        return
+
+    # Properties with a single broadcast value are repeated rather than listed.
+    columns = [repeat(column[0].item()) if column.strides[0] == 0 else column.tolist()
+               for column in properties]
+    props = zip(*columns) if columns else repeat(())
+    rows = zip(eleTags.tolist(), eleNodes.tolist(), props)
+    if isinstance(args, tuple):
+        for tag, nodes, props in rows:
+            element(eleType, tag, *nodes, *props, *args)
+    else:
+        for (tag, nodes, props), eleArgs in zip(rows, args):
+            element(eleType, tag, *nodes, *props, *eleArgs)
+
+
+def nodes(tags, coords, mass=None, ndf=None):
+    """
+    Create many OpenSees nodes at once.
+
+    ========================   ===========================================================================
+    ``tags`` |arrayi|          (N,) node tags.
+
+    ``coords`` |arrayf|        (N, ndm) nodal coordinates.
+
+    ``mass`` |arrayf|          (N, ndf) nodal masses, or a single row of ndf masses used for every
+                               node. (optional)
+
+    ``ndf`` |int|              nodal ndf, either one value for all nodes or (N,) values. (optional)
+    ========================   ===========================================================================
+
+    For example,
+
+    .. code-block:: python
+
+       x, y = np.meshgrid(np.arange(11.), np.arange(11.))
+       coords = np.column_stack([x.ravel(), y.ravel()])
+       op.model.nodes(np.arange(1, 122), coords)
+
+    """
+    tags = asTags(tags)
+    N = tags.size
+    coords = asRows(coords, N, 'coords')
+    if not 1 <= coords.shape[1] <= 3:
+        raise ValueError(f'coords must have 1 to 3 columns, got {coords.shape[1]}')
+    if not np.all(np.isfinite(coords)):
+        raise ValueError('coords must be finite')
+    if ndf is not None:
+        ndf = asColumn(ndf, N, 'ndf', dtype=int)
+    if mass is not None:
+        mass = asRows(mass, N, 'mass')
+        if ndf is not None and np.any(ndf != mass.shape[1]):
+            raise ValueError(f'mass has {mass.shape[1]} columns, which does not match ndf')
+
+    node = ops.node
+    args = optionArgs(('-ndf', ndf), ('-mass', mass))
+    if isinstance(args, tuple):
+        for tag, crd in zip(tags.tolist(), coords.tolist()):
+            node(tag, *crd, *args)
+    else:
+        for tag, crd, nodeArgs in zip(tags.tolist(), coords.tolist(), args):
+            node(tag, *crd, *nodeArgs)
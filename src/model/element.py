@@ -1,4 +1,7 @@
-import openseespy.opensees as ops
+from ..backend import ops
+
+# The *Many commands create elements from arrays. They import numpy and
+# model.bulk when called, so neither is loaded with this module.
 
 def zeroLength(eleTag, eleNodes, matTags=None, dirs=None, rFlag=0, vecx=None, vecyp=None):
     """
@@ -53,6 +56,42 @@ def zeroLength(eleTag, eleNodes, matTags=None, dirs=None, rFlag=0, vecx=None, ve
         uniqueArgs += vecyp
     ops.element('zeroLength', eleTag, *eleNodes, *uniqueArgs)
 
+def zeroLengthMany(eleTags, eleNodes, matTags, dirs, rFlag=0, vecx=None, vecyp=None):
+    """
+    Create many zeroLength elements at once, see :func:`zeroLength`.
+
+    ===================================   ===========================================================================
+    ``eleTags`` |arrayi|                  (nEle,) unique element object tags
+
+    ``eleNodes`` |arrayi|                 (nEle, 2) element nodes
+
+    ``matTags`` |arrayi|                  (nEle, nMat) UniaxialMaterial tags, or one row used for all elements
+
+    ``dirs`` |arrayi|                     (nEle, nMat) material directions, or one row used for all elements
+
+    ``rFlag`` |int|                       optional, default = 0 NO RAYLEIGH DAMPING (default), 1 include Rayleigh damping
+
+    ``vecx`` |arrayf|                     (nEle, 3) local x-axis vectors, or one vector used for all elements (optional)
+
+    ``vecyp`` |arrayf|                    (nEle, 3) vectors in the local x-y plane, or one vector used for all elements (optional)
+    ===================================   ===========================================================================
+
+    """
+    import numpy as np
+    from .bulk import asElements, asRows, elements
+    eleTags, eleNodes = asElements(eleTags, eleNodes, 2)
+    N = eleTags.size
+    matTags = asRows(matTags, N, 'matTags', dtype=int)
+    dirs = asRows(dirs, N, 'dirs', width=matTags.shape[1], dtype=int)
+    options = [('-mat', matTags), ('-dir', dirs)]
+    if rFlag == 1:
+        options.append(('-doRayleigh', (rFlag,)))
+    if vecx is not None:
+        orient = np.hstack([asRows(vecx, N, 'vecx', width=3),
+                            asRows(vecyp, N, 'vecyp', width=3)])
+        options.append(('-orient', orient))
+    elements('zeroLength', eleTags, eleNodes, [], options)
+
 # def zeroLengthND(eleTag, eleNodes, matTag, uniTag=None, vecx=None, vecyp=None):
 #     """
 
@@ -571,6 +610,42 @@ def Truss(eleTag, eleNodes, A, matTag, rho=None, cFlag=None, rFlag=None):
 
 
 
+def TrussMany(eleTags, eleNodes, A, matTag, rho=None, cFlag=None, rFlag=None):
+    """
+    Create many Truss elements at once, see :func:`Truss`.
+
+    ===================================   ===========================================================================
+    ``eleTags`` |arrayi|                  (nEle,) unique element object tags
+
+    ``eleNodes`` |arrayi|                 (nEle, 2) element nodes
+
+    ``A`` |arrayf|                        cross-sectional areas, one value or (nEle,) values
+
+    ``matTag`` |arrayi|                   UniaxialMaterial tags, one value or (nEle,) values
+
+    ``rho`` |arrayf|                      mass per unit length, one value or (nEle,) values (optional)
+
+    ``cFlag`` |int|                       consistent mass flag used for all elements, optional, default = 0
+
+    ``rFlag`` |int|                       Rayleigh damping flag used for all elements, optional, default = 0
+    ===================================   ===========================================================================
+
+    """
+    from .bulk import asElements, asColumn, elements
+    eleTags, eleNodes = asElements(eleTags, eleNodes, 2)
+    N = eleTags.size
+    properties = [asColumn(A, N, 'A'), asColumn(matTag, N, 'matTag', dtype=int)]
+    options = []
+    if rho is not None:
+        options.append(('-rho', asColumn(rho, N, 'rho')))
+    if cFlag:
+        options.append(('-cMass', (cFlag,)))
+    if rFlag:
+        options.append(('-doRayleigh', (rFlag,)))
+    elements('Truss', eleTags, eleNodes, properties, options)
+
+
+
 def TrussSection(eleTag, eleNodes, secTag, rho=None, cFlag=None, rFlag=None):
     """
     the other is to specify a Section identifier:
@@ -823,6 +898,89 @@ def elasticBeamColumn3D(eleTag, eleNodes, Area, E_mod, G_mod, Jxx, Iy, Iz, trans
         uniqueArgs.append('-cMass')
     ops.element('elasticBeamColumn', eleTag, *eleNodes, Area, E_mod, G_mod, Jxx, Iy, Iz, transfTag, *uniqueArgs)
 
+def elasticBeamColumn2DMany(eleTags, eleNodes, Area, E_mod, Iz, transfTag, mass=None, cMass=False, releaseCode=0):
+    """
+    Create many 2D elasticBeamColumn elements at once.
+
+    ===================================   ===========================================================================
+    ``eleTags`` |arrayi|                  (nEle,) unique element object tags
+
+    ``eleNodes`` |arrayi|                 (nEle, 2) element nodes
+
+    ``Area`` |arrayf|                     cross-sectional areas, one value or (nEle,) values
+
+    ``E_mod`` |arrayf|                    Young's Moduli, one value or (nEle,) values
+
+    ``Iz`` |arrayf|                       second moments of area about the local z-axis, one value or (nEle,) values
+
+    ``transfTag`` |arrayi|                coordinate-transformation tags, one value or (nEle,) values
+
+    ``mass`` |arrayf|                     element mass per unit length, one value or (nEle,) values (optional)
+
+    ``'-cMass'`` |bool|                   to form consistent mass matrices for all elements (optional)
+
+    ``'releaseCode'`` |arrayi|            moment release, one value or (nEle,) values (optional, 0=no release (default), 1=release at I, 2=release at J, 3=release at I and J)
+    ===================================   ===========================================================================
+
+    """
+    import numpy as np
+    from .bulk import asElements, asColumn, elements
+    eleTags, eleNodes = asElements(eleTags, eleNodes, 2)
+    N = eleTags.size
+    properties = [asColumn(Area, N, 'Area'), asColumn(E_mod, N, 'E_mod'),
+                  asColumn(Iz, N, 'Iz'), asColumn(transfTag, N, 'transfTag', dtype=int)]
+    options = []
+    if mass is not None:
+        options.append(('-mass', asColumn(mass, N, 'mass')))
+    if cMass:
+        options.append('-cMass')
+    if np.any(releaseCode):
+        options.append(('-release', asColumn(releaseCode, N, 'releaseCode', dtype=int)))
+    elements('elasticBeamColumn', eleTags, eleNodes, properties, options)
+
+def elasticBeamColumn3DMany(eleTags, eleNodes, Area, E_mod, G_mod, Jxx, Iy, Iz, transfTag, mass=None, cMass=False):
+    """
+    Create many 3D elasticBeamColumn elements at once, see :func:`elasticBeamColumn3D`.
+
+    ===================================   ===========================================================================
+    ``eleTags`` |arrayi|                  (nEle,) unique element object tags
+
+    ``eleNodes`` |arrayi|                 (nEle, 2) element nodes
+
+    ``Area`` |arrayf|                     cross-sectional areas, one value or (nEle,) values
+
+    ``E_mod`` |arrayf|                    Young's Moduli, one value or (nEle,) values
+
+    ``G_mod`` |arrayf|                    Shear Moduli, one value or (nEle,) values
+
+    ``Jxx`` |arrayf|                      torsional moments of inertia, one value or (nEle,) values
+
+    ``Iy`` |arrayf|                       second moments of area about the local y-axis, one value or (nEle,) values
+
+    ``Iz`` |arrayf|                       second moments of area about the local z-axis, one value or (nEle,) values
+
+    ``transfTag`` |arrayi|                coordinate-transformation tags, one value or (nEle,) values
+
+    ``mass`` |arrayf|                     element mass per unit length, one value or (nEle,) values (optional)
+
+    ``'-cMass'`` |bool|                   to form consistent mass matrices for all elements (optional)
+    ===================================   ===========================================================================
+
+    """
+    from .bulk import asElements, asColumn, elements
+    eleTags, eleNodes = asElements(eleTags, eleNodes, 2)
+    N = eleTags.size
+    properties = [asColumn(Area, N, 'Area'), asColumn(E_mod, N, 'E_mod'),
+                  asColumn(G_mod, N, 'G_mod'), asColumn(Jxx, N, 'Jxx'),
+                  asColumn(Iy, N, 'Iy'), asColumn(Iz, N, 'Iz'),
+                  asColumn(transfTag, N, 'transfTag', dtype=int)]
+    options = []
+    if mass is not None:
+        options.append(('-mass', asColumn(mass, N, 'mass')))
+    if cMass:
+        options.append('-cMass')
+    elements('elasticBeamColumn', eleTags, eleNodes, properties, options)
+
 # def ModElasticBeam2d(eleTag, eleNodes, Area, E_mod, Iz, K11, K33, K44, transfTag, massDens=None, cMass=None):
 #     """
 
@@ -1002,6 +1160,37 @@ def dispBeamColumn(eleTag, eleNodes, transfTag, integrationTag, cMass = False, m
         uniqueArgs.append(mass)
     ops.element('dispBeamColumn', eleTag, *eleNodes, transfTag, integrationTag, mass, *uniqueArgs)
 
+def dispBeamColumnMany(eleTags, eleNodes, transfTag, integrationTag, cMass=False, mass=None):
+    """
+    Create many dispBeamColumn elements at once.
+
+    ========================   =============================================================
+    ``eleTags`` |arrayi|       (nEle,) element tags
+
+    ``eleNodes`` |arrayi|      (nEle, 2) element nodes
+
+    ``transfTag`` |arrayi|     transformation tags, one value or (nEle,) values
+
+    ``integrationTag`` |arrayi|  :func:`beamIntegration` tags, one value or (nEle,) values
+
+    ``'-cMass'`` |bool|        to form consistent mass matrices for all elements (optional)
+
+    ``mass`` |arrayf|          element mass densities, one value or (nEle,) values (optional)
+    ========================   =============================================================
+
+    """
+    from .bulk import asElements, asColumn, elements
+    eleTags, eleNodes = asElements(eleTags, eleNodes, 2)
+    N = eleTags.size
+    properties = [asColumn(transfTag, N, 'transfTag', dtype=int),
+                  asColumn(integrationTag, N, 'integrationTag', dtype=int)]
+    options = []
+    if cMass:
+        options.append('-cMass')
+    if mass is not None:
+        options.append(('-mass', asColumn(mass, N, 'mass')))
+    elements('dispBeamColumn', eleTags, eleNodes, properties, options)
+
 def forceBeamColumn(eleTag, eleNodes, transfTag, integrationTag, maxIter=None, tol=None, mass=None):
     """
     Create a ForceBeamColumn element.
@@ -1041,6 +1230,39 @@ def forceBeamColumn(eleTag, eleNodes, transfTag, integrationTag, maxIter=None, t
         uniqueArgs.append(mass)
     ops.element('forceBeamColumn', eleTag, *eleNodes, transfTag, integrationTag, maxIter, tol, mass, *uniqueArgs)
 
+def forceBeamColumnMany(eleTags, eleNodes, transfTag, integrationTag, maxIter=None, tol=None, mass=None):
+    """
+    Create many ForceBeamColumn elements at once.
+
+    ========================   =============================================================
+    ``eleTags`` |arrayi|       (nEle,) element tags
+
+    ``eleNodes`` |arrayi|      (nEle, 2) element nodes
+
+    ``transfTag`` |arrayi|     transformation tags, one value or (nEle,) values
+
+    ``integrationTag`` |arrayi|  :func:`beamIntegration` tags, one value or (nEle,) values
+
+    ``maxIter`` |int|          maximum number of element compatibility iterations, used for all elements (optional)
+
+    ``tol`` |float|            tolerance for element compatibility, used for all elements (optional, default = 1e-12)
+
+    ``mass`` |arrayf|          element mass densities, one value or (nEle,) values (optional)
+    ========================   =============================================================
+
+    """
+    from .bulk import asElements, asColumn, elements
+    eleTags, eleNodes = asElements(eleTags, eleNodes, 2)
+    N = eleTags.size
+    properties = [asColumn(transfTag, N, 'transfTag', dtype=int),
+                  asColumn(integrationTag, N, 'integrationTag', dtype=int)]
+    options = []
+    if maxIter:
+        options.append(('-iter', (int(maxIter), tol if tol else 1e-12)))
+    if mass is not None:
+        options.append(('-mass', asColumn(mass, N, 'mass')))
+    elements('forceBeamColumn', eleTags, eleNodes, properties, options)
+
 # def nonlinearBeamColumn(eleTag, eleNodes, numIntgrPts, secTag, transfTag, maxIter, tol, mass, intType=None):
 #     """
 
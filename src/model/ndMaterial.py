@@ -1,4 +1,4 @@
-import openseespy.opensees as ops
+from ..backend import ops
 
 def ElasticIsotropic(matTag, E, nu, rho):
     """
@@ -1,4 +1,4 @@
-import openseespy.opensees as ops
+from ..backend import ops
 
 def nodeTag(nodeTag, crds, ndf=None, mass=None, disp=None, vel=None, accel=None):
     """
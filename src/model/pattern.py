@@ -1,4 +1,4 @@
-import openseespy.opensees as ops
+from ..backend import ops
 
 def Plain(patternTag, tsTag, fact=None):
     """
@@ -81,6 +81,29 @@ def load(nodeTag, loadValues):
 
 
 
+def loads(nodeTags, loadValues):
+    """
+    Construct NodalLoad objects at many nodes at once, and add them to the
+    enclosing LoadPattern. Nodes whose load values are all zero are skipped.
+
+    ========================   =============================================================
+    ``nodeTags`` |arrayi|      (N,) tags of nodes to which loads are applied.
+    ``loadValues`` |arrayf|    (N, ndf) reference load values, or one row of ndf values
+                               used for every node.
+    ========================   =============================================================
+
+    """
+    import numpy as np
+    from .bulk import asTags, asRows
+    nodeTags = asTags(nodeTags, 'nodeTags')
+    loadValues = asRows(loadValues, nodeTags.size, 'loadValues')
+    isLoaded = np.any(loadValues != 0., axis=1)
+    load = ops.load
+    for nodeTag, values in zip(nodeTags[isLoaded].tolist(), loadValues[isLoaded].tolist()):
+        load(nodeTag, *values)
+
+
+
 def eleLoad(eleTags, eleTag1=None, eleTag2=None, Wy=None, Wz=None, 
             Wx=None, Px=None, Py=None, Pz=None, xL=None,  tempPts=None):
     """
@@ -152,6 +175,51 @@ def eleLoad(eleTags, eleTag1=None, eleTag2=None, Wy=None, Wz=None,
 
 
 
+def eleLoads(eleTags, Wy, Wz=None, Wx=None):
+    """
+    Construct uniform beam ElementalLoad objects for many elements at once,
+    and add them to the enclosing LoadPattern.
+
+    Elements with the same load values share one eleLoad command, so applying
+    a gravity load to every beam is a single call. Elements whose loads are all
+    zero are skipped.
+
+    ========================   =============================================================
+    ``eleTags`` |arrayi|       (N,) tags of PREVIOUSLY DEFINED elements
+    ``Wy`` |arrayf|            uniformily distributed ref loads in the local y direction,
+                               one value or (N,) values
+    ``Wz`` |arrayf|            uniformily distributed ref loads in the local z direction,
+                               one value or (N,) values. (required only for 3D)
+    ``Wx`` |arrayf|            uniformily distributed ref loads along the member length,
+                               one value or (N,) values. (optional)
+    ========================   =============================================================
+
+    """
+    import numpy as np
+    from .bulk import asTags, asColumn
+    eleTags = asTags(eleTags, 'eleTags')
+    N = eleTags.size
+    columns = [asColumn(Wy, N, 'Wy')]
+    if Wz is not None:
+        columns.append(asColumn(Wz, N, 'Wz'))
+    columns.append(asColumn(0. if Wx is None else Wx, N, 'Wx'))
+    values = np.column_stack(columns)
+    isLoaded = np.any(values != 0., axis=1)
+    eleTags = eleTags[isLoaded]
+    values = values[isLoaded]
+    if eleTags.size == 0:
+        return
+
+    rows, group = np.unique(values, axis=0, return_inverse=True)
+    group = group.ravel()
+    order = np.argsort(group, kind='stable')
+    splits = np.cumsum(np.bincount(group, minlength=len(rows)))[:-1]
+    eleLoad = ops.eleLoad
+    for row, tags in zip(rows.tolist(), np.split(eleTags[order], splits)):
+        eleLoad('-ele', *tags.tolist(), '-type', '-beamUniform', *row)
+
+
+
 def sp(nodeTag, dof, dofValues):
     """
     This command is used to construct a NodalLoad object and add it to the enclosing LoadPattern.
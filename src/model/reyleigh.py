@@ -1,4 +1,4 @@
-import openseespy.opensees as ops
+from ..backend import ops
 
 def alphaM(alphaM, betaK, betaKinit, betaKcomm):
     """
@@ -1,4 +1,4 @@
-import openseespy.opensees as ops
+from ..backend import ops
 
 def Elastic(secTag, E_mod, A, Iz, Iy, G_mod, Jxx, alphaY, alphaZ):
 
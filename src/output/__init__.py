@@ -0,0 +1,496 @@
+"""
+Commands that query the state of the domain and the analysis.
+
+Each command returns the value given by OpenSees. Queries can be memoized
+within an analysis step with :func:`openseespyhint.cache.enableCache`.
+"""
+import importlib
+
+from ..backend import ops
+
+# Submodules are imported on first attribute access.
+_submodules = ['load', 'modelJSON', 'recorder', 'store']
+
+# Array based commands, which live in bulk.py so numpy is only imported when
+# they are used.
+_bulkCommands = ['nodeDispAll', 'nodeVelAll', 'nodeAccelAll', 'nodeReactionAll',
+                 'eleForceAll', 'localForceAll', 'basicForceAll',
+                 'basicDeformationAll', 'basicStiffnessAll']
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module('.' + name, __name__)
+    if name in _bulkCommands:
+        command = getattr(importlib.import_module('.bulk', __name__), name)
+        globals()[name] = command
+        return command
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules) | set(_bulkCommands))
+
+
+def _dofArgs(*args):
+    """
+    Drops trailing optional arguments that were not given.
+    """
+    args = list(args)
+    while args and args[-1] is None:
+        args.pop()
+    return args
+
+
+def nodeDisp(nodeTag, dof=None):
+    """
+    Returns the current displacement at a specified node.
+
+    ========================   ===========================================================================
+    ``nodeTag`` |int|          node tag.
+    ``dof`` |int|              specific dof at the node (1 through ndf), (optional), if no ``dof`` is
+                               provided, a list of values for all dofs is returned.
+    ========================   ===========================================================================
+
+    """
+    return ops.nodeDisp(*_dofArgs(nodeTag, dof))
+
+
+def nodeVel(nodeTag, dof=None):
+    """
+    Returns the current velocity at a specified node.
+
+    ========================   ===========================================================================
+    ``nodeTag`` |int|          node tag.
+    ``dof`` |int|              specific dof at the node (1 through ndf), (optional), if no ``dof`` is
+                               provided, a list of values for all dofs is returned.
+    ========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    return ops.nodeVel(*_dofArgs(nodeTag, dof))
+
+
+def nodeAccel(nodeTag, dof=None):
+    """
+    Returns the current acceleration at a specified node.
+
+    ========================   ===========================================================================
+    ``nodeTag`` |int|          node tag.
+    ``dof`` |int|              specific dof at the node (1 through ndf), (optional), if no ``dof`` is
+                               provided, a list of values for all dofs is returned.
+    ========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    return ops.nodeAccel(*_dofArgs(nodeTag, dof))
+
+
+def nodeReaction(nodeTag, dof=None):
+    """
+    Returns the reactions at a specified node. Must call :func:`reactions`
+    before this command.
+
+    ========================   ===========================================================================
+    ``nodeTag`` |int|          node tag.
+    ``dof`` |int|              specific dof at the node (1 through ndf), (optional), if no ``dof`` is
+                               provided, a list of values for all dofs is returned.
+    ========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    return ops.nodeReaction(*_dofArgs(nodeTag, dof))
+
+
+def nodeUnbalance(nodeTag, dof=None):
+    """
+    Returns the unbalanced force at a specified node.
+
+    ========================   ===========================================================================
+    ``nodeTag`` |int|          node tag.
+    ``dof`` |int|              specific dof at the node (1 through ndf), (optional), if no ``dof`` is
+                               provided, a list of values for all dofs is returned.
+    ========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    return ops.nodeUnbalance(*_dofArgs(nodeTag, dof))
+
+
+def nodeResponse(nodeTag, dof, responseID):
+    """
+    Returns the responses at a specified node. To get reactions (id=6), must
+    call the ``reactions`` command before this command.
+
+    ========================   ===========================================================================
+    ``nodeTag`` |int|          node tag.
+    ``dof`` |int|              specific dof of the response
+    ``responseID`` |int|       the id of responses:
+
+                               * Disp = 1
+                               * Vel = 2
+                               * Accel = 3
+                               * IncrDisp = 4
+                               * IncrDeltaDisp = 5
+                               * Reaction = 6
+                               * Unbalance = 7
+                               * RayleighForces = 8
+    ========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    return ops.nodeResponse(nodeTag, dof, responseID)
+
+
+def nodeCoord(nodeTag, dim=None):
+    """
+    Returns the coordinates of a specified node.
+
+    ========================   ===========================================================================
+    ``nodeTag`` |int|          node tag.
+    ``dim`` |int|              specific dimension at the node (1 through ndm), (optional), if no ``dim``
+                               is provided, a list of values for all dimensions is returned.
+    ========================   ===========================================================================
+
+    """
+    return ops.nodeCoord(*_dofArgs(nodeTag, dim))
+
+
+def nodeEigenvector(nodeTag, eigenvector, dof=None):
+    """
+    Returns the eigenvector at a specified node.
+
+    ========================   ===========================================================================
+    ``nodeTag`` |int|          node tag.
+    ``eigenvector`` |int|      mode number of eigenvector to be returned
+    ``dof`` |int|              specific dof at the node (1 through ndf), (optional), if no ``dof`` is
+                               provided, a list of values for all dofs is returned.
+    ========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    return ops.nodeEigenvector(*_dofArgs(nodeTag, eigenvector, dof))
+
+
+def nodeMass(nodeTag, dof=None):
+    """
+    Returns the mass at a specified node.
+
+    ========================   ===========================================================================
+    ``nodeTag`` |int|          node tag.
+    ``dof`` |int|              specific dof at the node (1 through ndf), (optional), if no ``dof`` is
+                               provided, a list of values for all dofs is returned.
+    ========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    return ops.nodeMass(*_dofArgs(nodeTag, dof))
+
+
+def nodeDOFs(nodeTag):
+    """
+    Returns the DOF numbering of a node.
+
+    ========================   ===========================================================================
+    ``nodeTag`` |int|          node tag.
+    ========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    return ops.nodeDOFs(nodeTag)
+
+
+def eleForce(eleTag, dof=None):
+    """
+    Returns the elemental resisting force.
+
+    ========================   ===========================================================================
+    ``eleTag`` |int|           element tag.
+    ``dof`` |int|              specific dof at the element, (optional), if no ``dof`` is provided, a list
+                               of values for all dofs is returned.
+    ========================   ===========================================================================
+
+    """
+    return ops.eleForce(*_dofArgs(eleTag, dof))
+
+
+def eleResponse(eleTag, *args):
+    """
+    Returns the same element quantities as those obtained from the element
+    recorder at a particular time step.
+
+    ========================   ===========================================================================
+    ``eleTag`` |int|           element tag.
+    ``args``                   same arguments as those specified in element recorder. These arguments are
+                               specific to the type of element being used.
+    ========================   ===========================================================================
+
+    For example,
+
+    .. code-block:: python
+
+       op.output.eleResponse(1, 'section', 1, 'force')
+
+    Hints:
+        untested
+
+    """
+    return ops.eleResponse(eleTag, *args)
+
+
+def eleNodes(eleTag):
+    """
+    Returns the nodes of an element.
+
+    ========================   ===========================================================================
+    ``eleTag`` |int|           element tag.
+    ========================   ===========================================================================
+
+    """
+    return ops.eleNodes(eleTag)
+
+
+def getNodeTags(mtag=None):
+    """
+    Returns all nodes in the domain, or in a mesh.
+
+    ========================   ===========================================================================
+    ``mtag`` |int|             mesh tag. (optional)
+    ========================   ===========================================================================
+
+    """
+    uniqueArgs = []
+    if mtag is not None:
+        uniqueArgs += ['-mesh', mtag]
+    return ops.getNodeTags(*uniqueArgs)
+
+
+def getEleTags(mtag=None):
+    """
+    Returns all elements in the domain, or in a mesh.
+
+    ========================   ===========================================================================
+    ``mtag`` |int|             mesh tag. (optional)
+    ========================   ===========================================================================
+
+    """
+    uniqueArgs = []
+    if mtag is not None:
+        uniqueArgs += ['-mesh', mtag]
+    return ops.getEleTags(*uniqueArgs)
+
+
+def basicForce(eleTag):
+    """
+    Returns the basic force of a beam-column element.
+
+    ========================   ===========================================================================
+    ``eleTag`` |int|           element tag.
+    ========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    return ops.basicForce(eleTag)
+
+
+def basicDeformation(eleTag):
+    """
+    Returns the basic deformation of a beam-column element.
+
+    ========================   ===========================================================================
+    ``eleTag`` |int|           element tag.
+    ========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    return ops.basicDeformation(eleTag)
+
+
+def basicStiffness(eleTag):
+    """
+    Returns the basic stiffness of a beam-column element, as a flat list.
+
+    ========================   ===========================================================================
+    ``eleTag`` |int|           element tag.
+    ========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    return ops.basicStiffness(eleTag)
+
+
+def sectionForce(eleTag, secNum, dof=None):
+    """
+    Returns the section force for a beam-column element. The dof of the
+    section depends on the section type.
+
+    ========================   ===========================================================================
+    ``eleTag`` |int|           element tag.
+    ``secNum`` |int|           section number, i.e. the Gauss integration number
+    ``dof`` |int|              the dof of the section, (optional), if no ``dof`` is provided, a list of
+                               values for all dofs is returned.
+    ========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    return ops.sectionForce(*_dofArgs(eleTag, secNum, dof))
+
+
+def sectionDeformation(eleTag, secNum, dof=None):
+    """
+    Returns the section deformation for a beam-column element. The dof of the
+    section depends on the section type.
+
+    ========================   ===========================================================================
+    ``eleTag`` |int|           element tag.
+    ``secNum`` |int|           section number, i.e. the Gauss integration number
+    ``dof`` |int|              the dof of the section, (optional), if no ``dof`` is provided, a list of
+                               values for all dofs is returned.
+    ========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    return ops.sectionDeformation(*_dofArgs(eleTag, secNum, dof))
+
+
+def sectionStiffness(eleTag, secNum, dof=None):
+    """
+    Returns the section stiffness for a beam-column element.
+
+    ========================   ===========================================================================
+    ``eleTag`` |int|           element tag.
+    ``secNum`` |int|           section number, i.e. the Gauss integration number
+    ``dof`` |int|              the dof of the section, (optional)
+    ========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    return ops.sectionStiffness(*_dofArgs(eleTag, secNum, dof))
+
+
+def getTime():
+    """
+    Returns the current time in the domain.
+
+    """
+    return ops.getTime()
+
+
+def getLoadFactor(patternTag):
+    """
+    Returns the load factor :math:`\\lambda` for the pattern.
+
+    ========================   ===========================================================================
+    ``patternTag`` |int|       pattern tag.
+    ========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    return ops.getLoadFactor(patternTag)
+
+
+def testIter():
+    """
+    Returns the number of iterations the convergence test took in the last
+    analysis step.
+
+    Hints:
+        untested
+
+    """
+    return ops.testIter()
+
+
+def testNorm():
+    """
+    Returns the norms from the convergence test for the last analysis step.
+
+    .. note::
+
+       The size of norms will be equal to the max number of iterations
+       specified. The first ``testIter`` of these will be non-zero, the
+       remaining ones will be zero.
+
+    Hints:
+        untested
+
+    """
+    return ops.testNorm()
+
+
+def numIter():
+    """
+    Returns the number of iterations.
+
+    Hints:
+        untested
+
+    """
+    return ops.numIter()
+
+
+def printModel(filename=None, JSON=False, nodes=None, eles=None, flag=None):
+    """
+    Prints the domain to screen or to a file.
+
+    ========================   ===========================================================================
+    ``filename`` |str|         name of file to which output is sent, by default, print to the screen.
+                               (optional)
+    ``JSON`` |bool|            print to a JSON file. (optional)
+    ``nodes`` |listi|          a list of nodes tags to be printed, default is to print all. (optional)
+    ``eles`` |listi|           a list of element tags to be printed, default is to print all. (optional)
+    ``flag`` |int|             integer flag to be sent to the print() method, depending on the node and
+                               element type (optional)
+    ========================   ===========================================================================
+
+    .. note::
+
+       This command was called ``print`` in Tcl. Since ``print`` is a built-in
+       function in Python, it is renamed to ``printModel``.
+
+    Hints:
+        untested
+
+    """
+    uniqueArgs = []
+    if filename:
+        uniqueArgs += ['-file', filename]
+    if JSON:
+        uniqueArgs.append('-JSON')
+    if flag is not None:
+        uniqueArgs += ['-flag', flag]
+    if nodes is not None:
+        uniqueArgs += ['-node', *nodes]
+    if eles is not None:
+        uniqueArgs += ['-ele', *eles]
+    return ops.printModel(*uniqueArgs)
@@ -0,0 +1,319 @@
+"""
+Array based query commands.
+
+Each command sends one query per object and writes the results straight
+into a 2D array, which can be passed back in with ``out`` at every step so no
+new arrays are created while an analysis runs.
+"""
+import numpy as np
+
+from ..backend import ops
+
+
+def _allNodeTags():
+    from ..shadow import getShadow
+    shadow = getShadow()
+    if shadow is not None:
+        return shadow.nodeTags
+    return ops.getNodeTags()
+
+
+def _allEleTags():
+    from ..shadow import getShadow
+    shadow = getShadow()
+    if shadow is not None:
+        return shadow.eleTags
+    return ops.getEleTags()
+
+
+def asQueryTags(tags, name='tags'):
+    """
+    Returns the tags as a list of ints. Unlike the model building commands,
+    repeated tags are allowed.
+    """
+    tags = np.asarray(tags)
+    if tags.ndim != 1:
+        raise ValueError(f'{name} must be a 1D array, got shape {tags.shape}')
+    if tags.size and not np.issubdtype(tags.dtype, np.integer):
+        if not np.all(np.mod(tags, 1) == 0):
+            raise ValueError(f'{name} must be integers')
+        tags = tags.astype(int)
+    return tags.tolist()
+
+
+def padRows(rows, width=None):
+    """
+    Returns a list of value lists as a 2D array, padding short rows with nan.
+    """
+    try:
+        values = np.array(rows, dtype=float)
+    except ValueError:
+        values = None
+    if values is None or values.ndim != 2:
+        values = np.full((len(rows), max(map(len, rows), default=0)), np.nan)
+        for ii, row in enumerate(rows):
+            values[ii, :len(row)] = row
+    if width is not None and values.shape[1] < width:
+        values = np.hstack([values, np.full((len(values), width - values.shape[1]), np.nan)])
+    return values
+
+
+def checkOut(out, shape):
+    """
+    Returns a new (N, width) nan array, or checks the shape of the given one.
+    """
+    if out is None:
+        return np.full(shape, np.nan)
+    if out.shape != shape:
+        raise ValueError(f'out must have shape {shape}, got {out.shape}')
+    return out
+
+
+def fillOut(out, rows, what='values'):
+    """
+    Writes a list of value lists into ``out``, which must have the shape of
+    the padded rows. Rows are not broadcast, so a result narrower or wider
+    than ``out`` raises a ``ValueError``.
+    """
+    if not rows:
+        return out
+    values = padRows(rows)
+    if values.shape != out.shape:
+        raise ValueError(f'out has shape {out.shape}, but the results have shape '
+                         f'{values.shape}, up to {values.shape[1]} {what} per row')
+    out[...] = values
+    return out
+
+
+def nodeResponseAll(cmd, tags=None, dofs=None, out=None):
+    """
+    Sends ``cmd(tag)`` for every node and writes the results into an
+    (N, ndf) array, or (N, len(dofs)) if dofs are given. Nodes with fewer dofs
+    than the widest node are padded with nan.
+    """
+    tags = asQueryTags(_allNodeTags() if tags is None else tags)
+    query = getattr(ops, cmd)
+    rows = [query(tag) for tag in tags]
+    if dofs is None:
+        if out is None:
+            return padRows(rows)
+        out = checkOut(out, (len(tags), out.shape[1]))
+        return fillOut(out, rows, 'dofs')
+
+    columns = np.asarray(dofs, dtype=int) - 1
+    if columns.ndim != 1 or np.any(columns < 0):
+        raise ValueError('dofs must be a list of dofs numbered from 1')
+    out = checkOut(out, (len(tags), columns.size))
+    if tags:
+        values = padRows(rows, columns.max() + 1)
+        np.take(values, columns, axis=1, out=out)
+    return out
+
+
+def nodeDispAll(tags=None, dofs=None, out=None):
+    """
+    Returns the current displacements of many nodes as one array.
+
+    ========================   ===========================================================================
+    ``tags`` |arrayi|          (N,) node tags, by default all nodes in the domain. (optional)
+    ``dofs`` |listi|           dofs to return, numbered from 1, by default all dofs. (optional)
+    ``out`` |arrayf|           (N, ndf) or (N, len(dofs)) array to write the results into, which can be
+                               reused between steps. (optional)
+    ========================   ===========================================================================
+
+    Returns an (N, ndf) array, or (N, len(dofs)) if ``dofs`` are given.
+    Nodes with fewer dofs than the widest node are padded with nan. If the
+    shadow domain is enabled the default nodes are taken from it.
+
+    For example,
+
+    .. code-block:: python
+
+       U = op.output.nodeDispAll(tags, dofs=[1, 2])
+       for ii in range(Nsteps):
+           op.analysis.analyze(1)
+           op.output.nodeDispAll(tags, dofs=[1, 2], out=U)
+
+    """
+    return nodeResponseAll('nodeDisp', tags, dofs, out)
+
+
+def nodeVelAll(tags=None, dofs=None, out=None):
+    """
+    Returns the current velocities of many nodes as one array, see
+    :func:`nodeDispAll`.
+
+    ========================   ===========================================================================
+    ``tags`` |arrayi|          (N,) node tags, by default all nodes in the domain. (optional)
+    ``dofs`` |listi|           dofs to return, numbered from 1, by default all dofs. (optional)
+    ``out`` |arrayf|           array to write the results into. (optional)
+    ========================   ===========================================================================
+
+    """
+    return nodeResponseAll('nodeVel', tags, dofs, out)
+
+
+def nodeAccelAll(tags=None, dofs=None, out=None):
+    """
+    Returns the current accelerations of many nodes as one array, see
+    :func:`nodeDispAll`.
+
+    ========================   ===========================================================================
+    ``tags`` |arrayi|          (N,) node tags, by default all nodes in the domain. (optional)
+    ``dofs`` |listi|           dofs to return, numbered from 1, by default all dofs. (optional)
+    ``out`` |arrayf|           array to write the results into. (optional)
+    ========================   ===========================================================================
+
+    """
+    return nodeResponseAll('nodeAccel', tags, dofs, out)
+
+
+def nodeReactionAll(tags=None, dofs=None, out=None):
+    """
+    Returns the reactions of many nodes as one array, see
+    :func:`nodeDispAll`. Must call :func:`reactions` before this command.
+
+    ========================   ===========================================================================
+    ``tags`` |arrayi|          (N,) node tags, by default all nodes in the domain. (optional)
+    ``dofs`` |listi|           dofs to return, numbered from 1, by default all dofs. (optional)
+    ``out`` |arrayf|           array to write the results into. (optional)
+    ========================   ===========================================================================
+
+    """
+    return nodeResponseAll('nodeReaction', tags, dofs, out)
+
+
+def groupByWidth(tags, rows):
+    """
+    Groups the query results by their length, and returns a dict of
+    ``width: (tags, values)`` where values is a (n, width) array.
+    """
+    widths = np.fromiter(map(len, rows), dtype=int, count=len(rows))
+    tags = np.asarray(tags, dtype=int)
+    groups = {}
+    for width in np.unique(widths).tolist():
+        select = np.flatnonzero(widths == width)
+        values = np.array([rows[ii] for ii in select.tolist()], dtype=float)
+        groups[width] = (tags[select], values.reshape(len(select), width))
+    return groups
+
+
+def eleResponseAll(tags, cmd, *args, grouped=False, out=None):
+    """
+    Sends ``cmd(tag, *args)`` for every element and collects the results.
+
+    If ``grouped`` is False, returns an (M, width) array, padding elements
+    with shorter results with nan. Otherwise returns a dict of
+    ``width: (tags, values)``, with one (n, width) array for each result length.
+
+    A result from an earlier call can be passed in as ``out`` to fill it in
+    place. For a grouped result the element groups of ``out`` are reused, and
+    ``tags`` is ignored.
+    """
+    query = getattr(ops, cmd)
+    if grouped and out is not None:
+        for width, (groupTags, values) in out.items():
+            fillOut(values, [query(tag, *args) for tag in groupTags.tolist()])
+        return out
+
+    tags = asQueryTags(_allEleTags() if tags is None else tags)
+    rows = [query(tag, *args) for tag in tags]
+    if grouped:
+        return groupByWidth(tags, rows)
+    if out is None:
+        return padRows(rows)
+    out = checkOut(out, (len(tags), out.shape[1]))
+    return fillOut(out, rows)
+
+
+def eleForceAll(tags=None, grouped=False, out=None):
+    """
+    Returns the resisting forces of many elements.
+
+    ========================   ===========================================================================
+    ``tags`` |arrayi|          (M,) element tags, by default all elements in the domain. (optional)
+    ``grouped`` |bool|         if True the elements are grouped by the number of force components, see
+                               below. (optional)
+    ``out``                    result of an earlier call to fill in place. (optional)
+    ========================   ===========================================================================
+
+    Returns an (M, width) array, where elements with fewer force components
+    than the widest element are padded with nan. If ``grouped`` is True
+    returns a dict of ``width: (tags, values)`` instead, so models that mix
+    element types are stored without padding.
+
+    For example,
+
+    .. code-block:: python
+
+       forces = op.output.eleForceAll(grouped=True)
+       for ii in range(Nsteps):
+           op.analysis.analyze(1)
+           op.output.eleForceAll(grouped=True, out=forces)
+           beamForces = forces[6][1]
+
+    """
+    return eleResponseAll(tags, 'eleForce', grouped=grouped, out=out)
+
+
+def localForceAll(tags=None, grouped=False, out=None):
+    """
+    Returns the forces of many elements in their local coordinate systems, as
+    ``eleResponse(tag, 'localForces')``. See :func:`eleForceAll`.
+
+    ========================   ===========================================================================
+    ``tags`` |arrayi|          (M,) element tags, by default all elements in the domain. (optional)
+    ``grouped`` |bool|         if True the elements are grouped by the number of force components.
+                               (optional)
+    ``out``                    result of an earlier call to fill in place. (optional)
+    ========================   ===========================================================================
+
+    """
+    return eleResponseAll(tags, 'eleResponse', 'localForces', grouped=grouped, out=out)
+
+
+def basicForceAll(tags=None, grouped=False, out=None):
+    """
+    Returns the basic forces of many beam-column elements. See
+    :func:`eleForceAll`.
+
+    ========================   ===========================================================================
+    ``tags`` |arrayi|          (M,) element tags, by default all elements in the domain. (optional)
+    ``grouped`` |bool|         if True the elements are grouped by the number of force components.
+                               (optional)
+    ``out``                    result of an earlier call to fill in place. (optional)
+    ========================   ===========================================================================
+
+    """
+    return eleResponseAll(tags, 'basicForce', grouped=grouped, out=out)
+
+
+def basicDeformationAll(tags=None, grouped=False, out=None):
+    """
+    Returns the basic deformations of many beam-column elements. See
+    :func:`eleForceAll`.
+
+    ========================   ===========================================================================
+    ``tags`` |arrayi|          (M,) element tags, by default all elements in the domain. (optional)
+    ``grouped`` |bool|         if True the elements are grouped by the number of components. (optional)
+    ``out``                    result of an earlier call to fill in place. (optional)
+    ========================   ===========================================================================
+
+    """
+    return eleResponseAll(tags, 'basicDeformation', grouped=grouped, out=out)
+
+
+def basicStiffnessAll(tags=None, grouped=False, out=None):
+    """
+    Returns the basic stiffness matrices of many beam-column elements, each
+    flattened to one row. See :func:`eleForceAll`.
+
+    ========================   ===========================================================================
+    ``tags`` |arrayi|          (M,) element tags, by default all elements in the domain. (optional)
+    ``grouped`` |bool|         if True the elements are grouped by the size of their matrices. (optional)
+    ``out``                    result of an earlier call to fill in place. (optional)
+    ========================   ===========================================================================
+
+    A row of width n*n can be reshaped to the (n, n) matrix.
+    """
+    return eleResponseAll(tags, 'basicStiffness', grouped=grouped, out=out)
@@ -0,0 +1,172 @@
+"""
+Reads the files written by the OpenSees recorders into numpy arrays.
+
+Text files are parsed in large chunks with numpy instead of line by line,
+binary files are read with ``numpy.fromfile``, and for xml files only the
+header is parsed as xml while the data block is parsed like a text file.
+
+.. code-block:: python
+
+   from openseespyhint.output.load import loadRecorder
+
+   data = loadRecorder('disp.out', cache=True)
+   t, u = data[:, 0], data[:, 1:]
+
+"""
+import os
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+
+_chunkBytes = 1 << 24
+
+
+def _readText(f, end=None):
+    """
+    Parses whitespace separated rows from the current position of f, until
+    the end of the file or the first line that starts with ``end``. Returns a
+    2D array with one row per line.
+    """
+    width = None
+    chunks = []
+    rest = b''
+    done = False
+    while not done:
+        block = f.read(_chunkBytes)
+        if not block:
+            done = True
+            lines, rest = rest, b''
+        else:
+            block = rest + block
+            cut = block.rfind(b'\n') + 1
+            lines, rest = block[:cut], block[cut:]
+        if end is not None:
+            stop = lines.find(end)
+            if stop >= 0:
+                lines = lines[:stop]
+                done = True
+        if width is None:
+            first = lines.lstrip().split(b'\n', 1)[0]
+            if first.strip():
+                width = len(first.split())
+        if lines.strip():
+            chunks.append(np.fromstring(lines.decode('ascii'), sep=' '))
+    values = np.concatenate(chunks) if chunks else np.empty(0)
+    if width is None:
+        return values.reshape(0, 0)
+    if values.size % width:
+        raise ValueError(f'the rows of the file do not all have {width} values')
+    return values.reshape(-1, width)
+
+
+def _binaryWidth(size, head):
+    """
+    Finds the number of values per row of a binary recorder file. Each row is
+    written as the values as doubles followed by a newline byte.
+    """
+    for width in range(1, min(size, len(head)) // 9 + 1):
+        rowBytes = 8 * width + 1
+        if size % rowBytes == 0 and all(head[end] == 10 for end in
+                                        range(rowBytes - 1, len(head), rowBytes)):
+            return width
+    raise ValueError('could not find the row length of the binary file, give columns')
+
+
+def _readBinary(path, columns=None):
+    size = os.path.getsize(path)
+    if size == 0:
+        return np.empty((0, columns or 0))
+    if columns is None:
+        with open(path, 'rb') as f:
+            head = f.read(1 << 16)
+        columns = _binaryWidth(size, head)
+    if size % (8 * columns + 1):
+        raise ValueError(f'the file size does not match rows of {columns} values')
+    rows = np.fromfile(path, dtype=np.dtype([('values', '<f8', (columns,)), ('end', 'u1')]))
+    return np.ascontiguousarray(rows['values'])
+
+
+def readRecorderHeader(path):
+    """
+    Reads the header of an xml recorder file, and returns a list with a
+    ``(outputType, attributes, responses)`` tuple for each output block. For
+    example ``('NodeOutput', {'nodeTag': '2', ...}, ['D1', 'D2'])``.
+    """
+    header = []
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip().startswith(b'<Data>'):
+                break
+            header.append(line)
+    text = b''.join(header).decode('utf-8') + '</OpenSees>'
+    root = ET.fromstring(text)
+    outputs = []
+    for block in root:
+        responses = [item.text.strip() for item in block.iter('ResponseType')]
+        outputs.append((block.tag, dict(block.attrib), responses))
+    return outputs
+
+
+def _readXML(path):
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip().startswith(b'<Data>'):
+                break
+        else:
+            raise ValueError(f'{path} has no <Data> block')
+        return _readText(f, end=b'</Data>')
+
+
+def _fileType(path):
+    with open(path, 'rb') as f:
+        head = f.read(4096)
+    if head.lstrip().startswith(b'<?xml'):
+        return 'xml'
+    if b'\0' in head or any(byte > 127 for byte in head):
+        return 'binary'
+    try:
+        for line in head.splitlines()[:-1] or head.splitlines():
+            [float(value) for value in line.split()]
+    except ValueError:
+        return 'binary'
+    return 'file'
+
+
+def loadRecorder(path, fileType=None, columns=None, cache=False):
+    """
+    Reads a recorder output file into a 2D array with one row per recorded
+    step.
+
+    ========================   ===========================================================================
+    ``path`` |str|             the recorder file.
+    ``fileType`` |str|         ``'file'`` for text, ``'xml'`` or ``'binary'``. By default the type is
+                               guessed from the content of the file. (optional)
+    ``columns`` |int|          number of values per row of a binary file, by default found from the
+                               file. (optional)
+    ``cache`` |bool|           if True the array is saved as ``path + '.npy'``, and later calls read the
+                               saved array while it is newer than the recorder file. (optional)
+    ========================   ===========================================================================
+
+    The column labels of an xml file can be read with
+    :func:`readRecorderHeader`.
+    """
+    cachePath = os.fspath(path) + '.npy'
+    if cache and os.path.exists(cachePath) and os.path.getmtime(cachePath) >= os.path.getmtime(path):
+        return np.load(cachePath)
+
+    if fileType is None:
+        fileType = _fileType(path)
+    if fileType == 'binary':
+        data = _readBinary(path, columns)
+    elif fileType == 'xml':
+        data = _readXML(path)
+    elif fileType == 'file':
+        with open(path, 'rb') as f:
+            data = _readText(f)
+    else:
+        raise ValueError(f"fileType must be 'file', 'xml' or 'binary', got {fileType!r}")
+
+    if cache:
+        np.save(cachePath, data)
+    return data
@@ -0,0 +1,134 @@
+"""
+Reads the JSON file written by ``printModel('-JSON')`` into arrays.
+
+The model is returned as a :class:`openseespyhint.shadow.ShadowDomain`, so
+code that reads the geometry works the same with a file and with the shadow
+domain of a running model. Element types are the OpenSees class names in the
+file, i.e. ``'ElasticBeam2d'`` rather than ``'elasticBeamColumn'``.
+
+.. code-block:: python
+
+   from openseespyhint.output.modelJSON import readModelJSON
+
+   model = readModelJSON('model.json')
+   xyz = model.nodeCoord()
+   ij = model.eleNodes()
+
+"""
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from ..backend import ops
+from ..shadow import ShadowDomain, getShadow
+
+
+def _tag(value):
+    """
+    Returns a tag written as a number or a string, or -1.
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return -1
+
+
+def _firstTag(element, single, many):
+    if single in element:
+        return _tag(element[single])
+    values = element.get(many)
+    if values:
+        return _tag(values[0])
+    return -1
+
+
+def _byTag(items):
+    return {_tag(item['name']): item for item in items}
+
+
+def parseModelJSON(model):
+    """
+    Converts the dict loaded from a ``printModel`` JSON file to a
+    :class:`ShadowDomain`. See :func:`readModelJSON`.
+    """
+    model = model.get('StructuralAnalysisModel', model)
+    geometry = model.get('geometry', {})
+    properties = model.get('properties', {})
+
+    nodes = geometry.get('nodes', [])
+    N = len(nodes)
+    ndm = max((len(node['crd']) for node in nodes), default=0)
+    coords = np.full((N, ndm), np.nan)
+    for ii, node in enumerate(nodes):
+        crd = node['crd']
+        coords[ii, :len(crd)] = crd
+
+    elements = geometry.get('elements', [])
+    M = len(elements)
+    nen = max((len(element['nodes']) for element in elements), default=0)
+    eleNodes = np.full((M, nen), -1, dtype=int)
+    for ii, element in enumerate(elements):
+        eleNodes[ii, :len(element['nodes'])] = element['nodes']
+
+    domain = ShadowDomain.fromArrays(
+        [node['name'] for node in nodes], coords,
+        nodeNdf=[node.get('ndf', -1) for node in nodes],
+        eleTags=[element['name'] for element in elements],
+        eleNodes=eleNodes,
+        eleTypes=[element['type'] for element in elements],
+        eleMatTags=[_firstTag(element, 'material', 'materials') for element in elements],
+        eleSecTags=[_firstTag(element, 'section', 'sections') for element in elements],
+        eleTransfTags=[_tag(element.get('crdTransformation')) for element in elements])
+
+    # the same (command, type) and type values as the shadow domain
+    for command, key in [('uniaxialMaterial', 'uniaxialMaterials'), ('nDMaterial', 'ndMaterials')]:
+        data = _byTag(properties.get(key, []))
+        domain.materialData.update(data)
+        domain.materials.update({tag: (command, item.get('type')) for tag, item in data.items()})
+    domain.sectionData = _byTag(properties.get('sections', []))
+    domain.sections = {tag: item.get('type') for tag, item in domain.sectionData.items()}
+    domain.transformData = _byTag(properties.get('crdTransformations', []))
+    domain.transforms = {tag: item.get('type') for tag, item in domain.transformData.items()}
+    return domain
+
+
+def readModelJSON(path):
+    """
+    Reads a ``printModel`` JSON file in one pass, and returns the model as a
+    :class:`openseespyhint.shadow.ShadowDomain`.
+
+    ========================   ===========================================================================
+    ``path`` |str|             the JSON file.
+    ========================   ===========================================================================
+
+    The ``materials``, ``sections`` and ``transforms`` of the returned domain
+    hold the types as in the shadow domain, with the OpenSees class names of
+    the file, i.e. ``('uniaxialMaterial', 'ElasticMaterial')``. The full
+    entries of the file are in ``materialData``, ``sectionData`` and
+    ``transformData``, by tag.
+    """
+    with open(path) as f:
+        return parseModelJSON(json.load(f))
+
+
+def modelGeometry():
+    """
+    Returns the current model as a :class:`openseespyhint.shadow.ShadowDomain`.
+
+    If the shadow domain is enabled it is returned directly. Otherwise the
+    model is printed to a temporary JSON file and read back, which takes one
+    OpenSees command instead of a ``nodeCoord`` and ``eleNodes`` call for
+    every node and element.
+    """
+    shadow = getShadow()
+    if shadow is not None:
+        return shadow
+    handle, path = tempfile.mkstemp(suffix='.json')
+    os.close(handle)
+    try:
+        ops.printModel('-JSON', '-file', path)
+        return readModelJSON(path)
+    finally:
+        os.remove(path)
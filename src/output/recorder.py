@@ -0,0 +1,520 @@
+"""
+Recorders, which save responses at every converged step.
+
+The file recorders are run by OpenSees and write text, xml or binary files.
+The memory recorders are run in Python after each increment of
+:func:`openseespyhint.analysis.analyze`, and store the responses in numpy
+buffers, so results can be used without writing and reading back a file.
+
+For example,
+
+.. code-block:: python
+
+   rec = op.output.recorder.MemoryNode([2, 3], [1], 'disp', deltaT=0.01)
+   op.analysis.analyze(1000, 0.001)
+   t, u = rec.time, rec.values[:, :, 0]
+
+"""
+import abc
+
+import numpy as np
+
+from ..backend import ops
+from ..analysis import addStepHook, removeStepHook
+from .bulk import nodeResponseAll, eleResponseAll, asQueryTags, _allNodeTags, _allEleTags
+
+
+def _outputArgs(filename, fileType, time, deltaT, precision, closeOnWrite, tsTag=None):
+    if fileType not in ('file', 'xml', 'binary'):
+        raise ValueError(f"fileType must be 'file', 'xml' or 'binary', got {fileType!r}")
+    uniqueArgs = ['-' + fileType, filename]
+    if precision is not None:
+        uniqueArgs += ['-precision', precision]
+    if time:
+        uniqueArgs.append('-time')
+    if deltaT:
+        uniqueArgs += ['-dT', deltaT]
+    if closeOnWrite:
+        uniqueArgs.append('-closeOnWrite')
+    if tsTag is not None:
+        uniqueArgs += ['-timeSeries', tsTag]
+    return uniqueArgs
+
+
+def Node(filename, nodeTags, dofs, respType, fileType='file', time=False, deltaT=None,
+         precision=None, closeOnWrite=False, tsTag=None):
+    """
+    The Node recorder type records the response of a number of nodes at every
+    converged step. Returns the recorder tag.
+
+    ===========================   ===========================================================================
+    ``filename`` |str|            name of file to which output is sent.
+    ``nodeTags`` |listi|          list of tags of nodes whose response is being recorded.
+    ``dofs`` |listi|              the specified dof at the nodes whose response is requested.
+    ``respType`` |str|            a string indicating response required:
+
+                                  * ``'disp'`` displacement
+                                  * ``'vel'`` velocity
+                                  * ``'accel'`` acceleration
+                                  * ``'incrDisp'`` incremental displacement
+                                  * ``'reaction'`` nodal reaction
+                                  * ``'eigen i'`` eigenvector for mode i
+    ``fileType`` |str|            ``'file'`` for text, ``'xml'`` or ``'binary'`` output. (optional)
+    ``time`` |bool|               places domain time in first entry of each data line. (optional)
+    ``deltaT`` |float|            time interval for recording, by default every step is recorded.
+                                  (optional)
+    ``precision`` |int|           number of significant digits. (optional)
+    ``closeOnWrite`` |bool|       close the file after every step. (optional)
+    ``tsTag`` |int|               the tag of a TimeSeries, whose value is added to the response.
+                                  (optional)
+    ===========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    uniqueArgs = _outputArgs(filename, fileType, time, deltaT, precision, closeOnWrite, tsTag)
+    return ops.recorder('Node', *uniqueArgs, '-node', *nodeTags, '-dof', *dofs, respType)
+
+
+def EnvelopeNode(filename, nodeTags, dofs, respType, fileType='file', time=False, deltaT=None,
+                 precision=None, closeOnWrite=False, tsTag=None):
+    """
+    The EnvelopeNode recorder type records the min, max and absolute max of a
+    number of nodal response quantities. Returns the recorder tag. The
+    arguments are the same as for :func:`Node`.
+
+    Hints:
+        untested
+
+    """
+    uniqueArgs = _outputArgs(filename, fileType, time, deltaT, precision, closeOnWrite, tsTag)
+    return ops.recorder('EnvelopeNode', *uniqueArgs, '-node', *nodeTags, '-dof', *dofs, respType)
+
+
+def Element(filename, eleTags, args, fileType='file', time=False, deltaT=None,
+            precision=None, closeOnWrite=False):
+    """
+    The Element recorder type records the response of a number of elements at
+    every converged step. Returns the recorder tag.
+
+    ===========================   ===========================================================================
+    ``filename`` |str|            name of file to which output is sent.
+    ``eleTags`` |listi|           list of tags of elements whose response is being recorded.
+    ``args`` |list|               arguments which are passed to the setResponse() element method, i.e.
+                                  ``['force']`` or ``['section', 1, 'deformation']``.
+    ``fileType`` |str|            ``'file'`` for text, ``'xml'`` or ``'binary'`` output. (optional)
+    ``time`` |bool|               places domain time in first entry of each data line. (optional)
+    ``deltaT`` |float|            time interval for recording, by default every step is recorded.
+                                  (optional)
+    ``precision`` |int|           number of significant digits. (optional)
+    ``closeOnWrite`` |bool|       close the file after every step. (optional)
+    ===========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    uniqueArgs = _outputArgs(filename, fileType, time, deltaT, precision, closeOnWrite)
+    return ops.recorder('Element', *uniqueArgs, '-ele', *eleTags, *args)
+
+
+def EnvelopeElement(filename, eleTags, args, fileType='file', time=False, deltaT=None,
+                    precision=None, closeOnWrite=False):
+    """
+    The EnvelopeElement recorder type records the min, max and absolute max of
+    a number of element responses. Returns the recorder tag. The arguments are
+    the same as for :func:`Element`.
+
+    Hints:
+        untested
+
+    """
+    uniqueArgs = _outputArgs(filename, fileType, time, deltaT, precision, closeOnWrite)
+    return ops.recorder('EnvelopeElement', *uniqueArgs, '-ele', *eleTags, *args)
+
+
+def PVD(filename, res=(), precision=None, dT=None):
+    """
+    Create a PVD recorder. Returns the recorder tag.
+
+    ========================   ===========================================================================
+    ``filename`` |str|         the name for ``filename.pvd`` and ``filename/`` directory, which must
+                               pre-exist.
+    ``res`` |lists|            a list of responses to be recorded, i.e. ``'disp'``, ``'vel'``,
+                               ``'accel'``, ``'incrDisp'``, ``'reaction'``, ``'pressure'``,
+                               ``'unbalancedLoad'``, ``'mass'`` or ``'eigen'``. (optional)
+    ``precision`` |int|        the precision of data. (optional)
+    ``dT`` |float|             the time interval for recording. (optional)
+    ========================   ===========================================================================
+
+    Hints:
+        untested
+
+    """
+    uniqueArgs = []
+    if precision is not None:
+        uniqueArgs += ['-precision', precision]
+    if dT is not None:
+        uniqueArgs += ['-dT', dT]
+    return ops.recorder('PVD', filename, *uniqueArgs, *res)
+
+
+# Memory recorders that are registered as step hooks.
+_memoryRecorders = []
+
+
+class StepRecorder(abc.ABC):
+    """
+    Base class of the recorders run after each converged step. Subclasses
+    must implement ``store(time)``, which is called at most once every
+    ``deltaT``.
+
+    ``sample(out)`` must return the response as an (N, width) array, and
+    write it into ``out`` if it is given.
+    """
+
+    def __init__(self, sample, deltaT=0.0):
+        self.sample = sample
+        self.deltaT = deltaT
+        self.count = 0
+        self._lastTime = None
+
+    def record(self):
+        """
+        Takes a sample, unless less than ``deltaT`` has passed since the last
+        one. Called after each converged step while the recorder is active.
+        """
+        time = ops.getTime()
+        if self._lastTime is not None and time - self._lastTime < self.deltaT * (1 - 1e-9):
+            return
+        self._lastTime = time
+        self.store(time)
+        self.count += 1
+
+    @abc.abstractmethod
+    def store(self, time):
+        """
+        Stores the response at ``time``.
+        """
+
+    def clear(self):
+        """
+        Drops the stored results.
+        """
+        self.count = 0
+        self._lastTime = None
+
+    def start(self):
+        """
+        Registers the recorder as a step hook of
+        :func:`openseespyhint.analysis.analyze`, and returns it.
+        """
+        if self not in _memoryRecorders:
+            addStepHook(self.record)
+            _memoryRecorders.append(self)
+        return self
+
+    def remove(self):
+        """
+        Stops recording. The stored results are kept.
+        """
+        removeStepHook(self.record)
+        if self in _memoryRecorders:
+            _memoryRecorders.remove(self)
+
+
+class MemoryRecorder(StepRecorder):
+    """
+    Stores every sample in a numpy buffer.
+
+    The buffer is allocated on the first sample. It holds ``capacity``
+    samples and doubles when it is full, or if ``ring`` is True it keeps only
+    the last ``capacity`` samples.
+
+    ========================   ===========================================================================
+    ``time``                   (n,) times of the stored samples
+    ``values``                 (n, N, width) stored samples, oldest first
+    ``count``                  number of samples taken, including those overwritten in a ring buffer
+    ========================   ===========================================================================
+    """
+
+    def __init__(self, sample, deltaT=0.0, capacity=1024, ring=False):
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        super().__init__(sample, deltaT)
+        self.capacity = capacity
+        self.ring = ring
+        self._time = np.full(capacity, np.nan)
+        self._data = None
+
+    def store(self, time):
+        row = self.count
+        if self.ring:
+            row %= self.capacity
+        elif row == len(self._time):
+            self._growTo(2 * row)
+        if self._data is None:
+            first = np.asarray(self.sample(None), dtype=float)
+            self._data = np.full((len(self._time),) + first.shape, np.nan)
+            self._data[row] = first
+        else:
+            self.sample(self._data[row])
+        self._time[row] = time
+
+    def _growTo(self, capacity):
+        time = np.full(capacity, np.nan)
+        time[:len(self._time)] = self._time
+        self._time = time
+        if self._data is not None:
+            data = np.full((capacity,) + self._data.shape[1:], np.nan)
+            data[:len(self._data)] = self._data
+            self._data = data
+
+    def _ordered(self, array):
+        n = min(self.count, len(self._time))
+        if not self.ring or self.count <= self.capacity:
+            return array[:n]
+        start = self.count % self.capacity
+        return np.concatenate([array[start:], array[:start]])
+
+    @property
+    def time(self):
+        return self._ordered(self._time)
+
+    @property
+    def values(self):
+        if self._data is None:
+            return np.empty((0, 0, 0))
+        return self._ordered(self._data)
+
+    def __len__(self):
+        return min(self.count, len(self._time))
+
+
+class EnvelopeMonitor(StepRecorder):
+    """
+    Keeps the running envelope of a response, without storing its history.
+
+    ========================   ===========================================================================
+    ``min``                    (N, width) smallest value of each component
+    ``max``                    (N, width) largest value of each component
+    ``absMax``                 (N, width) largest absolute value of each component
+    ``timeMin``                (N, width) time of the smallest value
+    ``timeMax``                (N, width) time of the largest value
+    ``timeAbsMax``             (N, width) time of the largest absolute value
+    ``count``                  number of samples taken
+    ========================   ===========================================================================
+
+    Components that don't exist, i.e. the padding of nodes with fewer dofs,
+    are nan.
+    """
+
+    def __init__(self, sample, deltaT=0.0):
+        super().__init__(sample, deltaT)
+        self.clear()
+
+    def clear(self):
+        super().clear()
+        self._current = None
+        self.min = self.max = self.absMax = None
+        self.timeMin = self.timeMax = self.timeAbsMax = None
+
+    def store(self, time):
+        if self._current is None:
+            current = self._current = np.asarray(self.sample(None), dtype=float)
+            self.min = current.copy()
+            self.max = current.copy()
+            self.absMax = np.abs(current)
+            self.timeMin = np.where(np.isnan(current), np.nan, time)
+            self.timeMax = self.timeMin.copy()
+            self.timeAbsMax = self.timeMin.copy()
+            self._absCurrent = np.empty_like(current)
+            self._mask = np.empty(current.shape, dtype=bool)
+            return
+        current, mask = self._current, self._mask
+        self.sample(current)
+        np.less(current, self.min, out=mask)
+        np.copyto(self.min, current, where=mask)
+        np.copyto(self.timeMin, time, where=mask)
+        np.greater(current, self.max, out=mask)
+        np.copyto(self.max, current, where=mask)
+        np.copyto(self.timeMax, time, where=mask)
+        np.abs(current, out=self._absCurrent)
+        np.greater(self._absCurrent, self.absMax, out=mask)
+        np.copyto(self.absMax, self._absCurrent, where=mask)
+        np.copyto(self.timeAbsMax, time, where=mask)
+
+
+class StoreRecorder(StepRecorder):
+    """
+    Appends every sample to a column of a
+    :class:`openseespyhint.output.store.ResultsWriter`, and the sample times
+    to the column ``name + '.time'``. Samples are written straight into the
+    chunk buffer of the writer.
+    """
+
+    def __init__(self, writer, name, sample, deltaT=0.0, tags=None):
+        super().__init__(sample, deltaT)
+        self.writer = writer
+        self.name = name
+        self.tags = tags
+
+    def store(self, time):
+        if self.name not in self.writer.columns:
+            first = np.asarray(self.sample(None), dtype=float)
+            self.writer.addColumn(self.name, first.shape, tags=self.tags)
+            self.writer.addColumn(self.name + '.time', ())
+            self.writer.append(self.name, first)
+        else:
+            self.sample(self.writer.nextRow(self.name))
+        self.writer.append(self.name + '.time', time)
+
+
+_nodeCommands = {'disp': 'nodeDisp', 'vel': 'nodeVel', 'accel': 'nodeAccel',
+                 'reaction': 'nodeReaction', 'unbalance': 'nodeUnbalance'}
+
+
+def _nodeSample(nodeTags, dofs, respType):
+    if respType not in _nodeCommands:
+        raise ValueError(f'respType must be one of {list(_nodeCommands)}, got {respType!r}')
+    cmd = _nodeCommands[respType]
+    tags = asQueryTags(_allNodeTags() if nodeTags is None else nodeTags, 'nodeTags')
+
+    def sample(out):
+        if respType == 'reaction':
+            ops.reactions()
+        return nodeResponseAll(cmd, tags, dofs, out)
+    sample.tags = tags
+    return sample
+
+
+def _eleSample(eleTags, args):
+    tags = asQueryTags(_allEleTags() if eleTags is None else eleTags, 'eleTags')
+
+    def sample(out):
+        return eleResponseAll(tags, 'eleResponse', *args, out=out)
+    sample.tags = tags
+    return sample
+
+
+def MemoryNode(nodeTags=None, dofs=None, respType='disp', deltaT=0.0, capacity=1024, ring=False):
+    """
+    Records nodal responses into memory after each converged step of
+    :func:`openseespyhint.analysis.analyze`, and returns the
+    :class:`MemoryRecorder`.
+
+    ========================   ===========================================================================
+    ``nodeTags`` |arrayi|      (N,) tags of the recorded nodes, by default all nodes. (optional)
+    ``dofs`` |listi|           recorded dofs, numbered from 1, by default all dofs. (optional)
+    ``respType`` |str|         ``'disp'``, ``'vel'``, ``'accel'``, ``'reaction'`` or ``'unbalance'``.
+                               (optional)
+    ``deltaT`` |float|         time interval for recording, by default every step is recorded. (optional)
+    ``capacity`` |int|         number of samples to allocate space for. (optional)
+    ``ring`` |bool|            if True only the last ``capacity`` samples are kept. (optional)
+    ========================   ===========================================================================
+
+    The values of the recorder have shape (n, N, ndf), or (n, N, len(dofs)).
+    """
+    sample = _nodeSample(nodeTags, dofs, respType)
+    return MemoryRecorder(sample, deltaT, capacity, ring).start()
+
+
+def MemoryElement(eleTags=None, args=('force',), deltaT=0.0, capacity=1024, ring=False):
+    """
+    Records element responses into memory after each converged step of
+    :func:`openseespyhint.analysis.analyze`, and returns the
+    :class:`MemoryRecorder`.
+
+    ========================   ===========================================================================
+    ``eleTags`` |arrayi|       (M,) tags of the recorded elements, by default all elements. (optional)
+    ``args`` |list|            arguments passed to ``eleResponse``, i.e. ``['localForces']``. (optional)
+    ``deltaT`` |float|         time interval for recording, by default every step is recorded. (optional)
+    ``capacity`` |int|         number of samples to allocate space for. (optional)
+    ``ring`` |bool|            if True only the last ``capacity`` samples are kept. (optional)
+    ========================   ===========================================================================
+
+    The values of the recorder have shape (n, M, width). Elements with
+    shorter responses are padded with nan.
+    """
+    sample = _eleSample(eleTags, args)
+    return MemoryRecorder(sample, deltaT, capacity, ring).start()
+
+
+def MemoryEnvelopeNode(nodeTags=None, dofs=None, respType='disp', deltaT=0.0):
+    """
+    Tracks the min, max and absolute max of nodal responses, and the times
+    they occur, after each converged step of
+    :func:`openseespyhint.analysis.analyze`. Returns the
+    :class:`EnvelopeMonitor`. The arguments are the same as for
+    :func:`MemoryNode`.
+
+    For example,
+
+    .. code-block:: python
+
+       env = op.output.recorder.MemoryEnvelopeNode(floorNodes, dofs=[1])
+       # the floors peak at different times, so the drifts get their own
+       # envelope, sampled from the displacements at each step
+       disp = np.empty((len(floorNodes), 1))
+       def storyDrift(out):
+           op.output.nodeDispAll(floorNodes, dofs=[1], out=disp)
+           return np.subtract(disp[1:], disp[:-1], out=out)
+       drift = op.output.recorder.EnvelopeMonitor(storyDrift).start()
+       op.analysis.analyze(Nsteps, dt)
+       peakDisp = env.absMax[:, 0]
+       peakDrift = drift.absMax[:, 0]
+
+    """
+    return EnvelopeMonitor(_nodeSample(nodeTags, dofs, respType), deltaT).start()
+
+
+def MemoryEnvelopeElement(eleTags=None, args=('force',), deltaT=0.0):
+    """
+    Tracks the min, max and absolute max of element responses, and the times
+    they occur, after each converged step of
+    :func:`openseespyhint.analysis.analyze`. Returns the
+    :class:`EnvelopeMonitor`. The arguments are the same as for
+    :func:`MemoryElement`.
+    """
+    return EnvelopeMonitor(_eleSample(eleTags, args), deltaT).start()
+
+
+def StoreNode(writer, name, nodeTags=None, dofs=None, respType='disp', deltaT=0.0):
+    """
+    Records nodal responses to a results store after each converged step of
+    :func:`openseespyhint.analysis.analyze`, and returns the
+    :class:`StoreRecorder`.
+
+    ========================   ===========================================================================
+    ``writer``                 the :class:`openseespyhint.output.store.ResultsWriter` to write to.
+    ``name`` |str|             name of the column. The times are written to ``name + '.time'``.
+    ``nodeTags`` |arrayi|      (N,) tags of the recorded nodes, by default all nodes. (optional)
+    ``dofs`` |listi|           recorded dofs, numbered from 1, by default all dofs. (optional)
+    ``respType`` |str|         ``'disp'``, ``'vel'``, ``'accel'``, ``'reaction'`` or ``'unbalance'``.
+                               (optional)
+    ``deltaT`` |float|         time interval for recording, by default every step is recorded. (optional)
+    ========================   ===========================================================================
+
+    """
+    sample = _nodeSample(nodeTags, dofs, respType)
+    return StoreRecorder(writer, name, sample, deltaT, sample.tags).start()
+
+
+def StoreElement(writer, name, eleTags=None, args=('force',), deltaT=0.0):
+    """
+    Records element responses to a results store after each converged step
+    of :func:`openseespyhint.analysis.analyze`, and returns the
+    :class:`StoreRecorder`. See :func:`StoreNode` and :func:`MemoryElement`
+    for the arguments.
+    """
+    sample = _eleSample(eleTags, args)
+    return StoreRecorder(writer, name, sample, deltaT, sample.tags).start()
+
+
+def removeMemoryRecorders():
+    """
+    Stops all memory recorders.
+    """
+    for recorder in list(_memoryRecorders):
+        recorder.remove()
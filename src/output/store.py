@@ -0,0 +1,210 @@
+"""
+A results store on disk, with one binary file per column and a JSON
+manifest.
+
+Each column holds one fixed shape array per row, i.e. the displacements of a
+set of nodes at one step. Rows are collected in chunks in memory and
+appended to the column file when a chunk is full, so writing costs one file
+write per chunk. The reader maps each column with ``numpy.memmap``, so step
+ranges or tag subsets can be sliced without reading the whole file.
+
+.. code-block:: python
+
+   from openseespyhint.output.store import ResultsWriter, ResultsReader
+
+   with ResultsWriter('results') as writer:
+       op.output.recorder.StoreNode(writer, 'disp', nodeTags, dofs=[1, 2])
+       op.analysis.analyze(10000, 0.01)
+
+   results = ResultsReader('results')
+   roof = results.select('disp', tags=[roofNode], steps=slice(5000, None))
+
+"""
+import json
+import os
+import re
+
+import numpy as np
+
+
+_manifestName = 'manifest.json'
+
+
+class _Column:
+    def __init__(self, path, shape, dtype, chunkSize, tags):
+        self.path = path
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.tags = tags
+        self.rows = 0
+        self.buffer = np.empty((chunkSize,) + self.shape, dtype=self.dtype)
+        self.filled = 0
+        self.file = open(path, 'wb')
+
+    def flush(self):
+        if self.filled:
+            self.file.write(self.buffer[:self.filled].tobytes())
+            self.filled = 0
+        self.file.flush()
+
+
+class ResultsWriter:
+    """
+    Writes columns of results to a directory, one row at a time.
+
+    ========================   ===========================================================================
+    ``path`` |str|             directory to write to. It is created if it doesn't exist.
+    ``chunkSize`` |int|        number of rows collected in memory before they are written. (optional)
+    ========================   ===========================================================================
+
+    The manifest is rewritten each time the chunks are flushed, so the rows
+    written so far can be read while an analysis is still running.
+    """
+
+    def __init__(self, path, chunkSize=256):
+        if chunkSize < 1:
+            raise ValueError('chunkSize must be at least 1')
+        self.path = path
+        self.chunkSize = chunkSize
+        self.columns = {}
+        os.makedirs(path, exist_ok=True)
+
+    def addColumn(self, name, shape, dtype=float, tags=None):
+        """
+        Adds a column whose rows are arrays of ``shape``. ``tags`` are the
+        object tags of the first dimension, if any, and are stored in the
+        manifest.
+        """
+        if not re.fullmatch(r'[\w.\-]+', name):
+            raise ValueError(f'column names may only contain letters, digits, _ . and -, got {name!r}')
+        if name in self.columns:
+            raise ValueError(f'column {name!r} already exists')
+        if tags is not None:
+            tags = [int(tag) for tag in tags]
+        path = os.path.join(self.path, name + '.bin')
+        self.columns[name] = _Column(path, shape, dtype, self.chunkSize, tags)
+
+    def nextRow(self, name):
+        """
+        Returns the next row of a column as a writable array, so results can
+        be written straight into the chunk buffer.
+        """
+        column = self.columns[name]
+        if column.filled == len(column.buffer):
+            self.flush()
+        row = column.buffer[column.filled, ...]
+        column.filled += 1
+        column.rows += 1
+        return row
+
+    def append(self, name, values):
+        """
+        Appends one row to a column.
+        """
+        self.nextRow(name)[...] = values
+
+    def flush(self):
+        """
+        Writes the collected rows of every column and the manifest.
+        """
+        for column in self.columns.values():
+            column.flush()
+        self._writeManifest()
+
+    def _writeManifest(self):
+        columns = {}
+        for name, column in self.columns.items():
+            columns[name] = {'file': os.path.basename(column.path),
+                             'dtype': column.dtype.str,
+                             'shape': list(column.shape),
+                             'rows': column.rows - column.filled,
+                             'tags': column.tags}
+        path = os.path.join(self.path, _manifestName)
+        with open(path + '.tmp', 'w') as f:
+            json.dump({'version': 1, 'columns': columns}, f, indent=1)
+        os.replace(path + '.tmp', path)
+
+    def close(self):
+        """
+        Writes the remaining rows and closes the column files.
+        """
+        self.flush()
+        for column in self.columns.values():
+            column.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class ResultsReader:
+    """
+    Reads a directory written by :class:`ResultsWriter`. Each column is
+    returned as a read only ``numpy.memmap`` of shape (rows, ...).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.reload()
+
+    def reload(self):
+        """
+        Reads the manifest again, i.e. to see rows written since the reader
+        was opened.
+        """
+        with open(os.path.join(self.path, _manifestName)) as f:
+            self.manifest = json.load(f)['columns']
+        self._maps = {}
+
+    @property
+    def names(self):
+        return list(self.manifest)
+
+    def __contains__(self, name):
+        return name in self.manifest
+
+    def __getitem__(self, name):
+        data = self._maps.get(name)
+        if data is None:
+            info = self.manifest[name]
+            shape = (info['rows'],) + tuple(info['shape'])
+            if info['rows'] == 0:
+                data = np.empty(shape, dtype=info['dtype'])
+            else:
+                data = np.memmap(os.path.join(self.path, info['file']), dtype=info['dtype'],
+                                 mode='r', shape=shape)
+            self._maps[name] = data
+        return data
+
+    def tags(self, name):
+        """
+        Returns the tags stored with a column, or None.
+        """
+        tags = self.manifest[name]['tags']
+        return None if tags is None else np.array(tags, dtype=int)
+
+    def select(self, name, tags=None, steps=slice(None)):
+        """
+        Returns the rows ``steps`` of a column, and only the objects in
+        ``tags`` if they are given. Only the selected data are read from disk.
+        ``steps`` is an int, a slice or an array of row indices, and an int
+        drops the step axis as in numpy indexing.
+        """
+        data = self[name][steps]
+        if tags is None:
+            return np.asarray(data)
+        tags = np.asarray(tags)
+        allTags = self.tags(name)
+        if allTags is None:
+            raise ValueError(f'column {name!r} has no tags')
+        order = np.argsort(allTags)
+        position = np.searchsorted(allTags, tags, sorter=order)
+        position = np.clip(position, 0, len(allTags) - 1)
+        rows = order[position]
+        if np.any(allTags[rows] != tags):
+            raise KeyError(f'tags not in column {name!r}: {np.setdiff1d(tags, allTags).tolist()}')
+        if isinstance(steps, (int, np.integer)):
+            return np.asarray(data[rows])
+        return np.asarray(data[:, rows])
@@ -0,0 +1,245 @@
+"""
+Counts and times every OpenSees command sent by the wrappers.
+
+The profiler is a backend layer, so it costs nothing while it is not
+enabled. Once enabled it records, for each command, the number of calls, the
+total time and a histogram of the call times, and optionally the Python
+call stack of each command for a flame graph.
+
+.. code-block:: python
+
+   from openseespyhint.profiling import profile
+
+   with profile(stacks=True) as profiler:
+       with profiler.phase('setup'):
+           buildModel()
+       with profiler.phase('analysis'):
+           runAnalysis()
+   print(profiler.report())
+   profiler.exportFolded('run.folded')  # flamegraph.pl run.folded > run.svg
+
+"""
+import collections
+import contextlib
+import math
+import sys
+import time
+
+from .backend import Backend, findLayer, getBackend, removeLayer, setBackend, useBackend
+from .cache import queryCommands
+
+
+# Commands that run or set up the analysis, used to group the report.
+analysisCommands = frozenset([
+    'analyze', 'eigen', 'analysis', 'algorithm', 'test', 'integrator',
+    'system', 'numberer', 'constraints', 'wipeAnalysis', 'reactions',
+    'modalProperties', 'responseSpectrumAnalysis', 'loadConst', 'setTime',
+    'reset', 'domainChange', 'record',
+])
+
+# Modules whose frames are left out of the call stacks: the backend layers.
+_layerModules = frozenset(__package__ + '.' + name
+                          for name in ['backend', 'cache', 'eigenCache', 'shadow', 'profiling',
+                                       'tape'])
+
+
+# Shortest time binned, so calls measured as 0 s by a coarse clock land in
+# the lowest bin rather than in the bin of frexp(0), 0.5 to 1 s.
+minTime = 2.0 ** -30
+
+
+def category(cmd):
+    """
+    Returns ``'query'``, ``'analysis'`` or ``'model'`` for a command.
+    """
+    if cmd in queryCommands:
+        return 'query'
+    if cmd in analysisCommands:
+        return 'analysis'
+    return 'model'
+
+
+class ProfilingBackend(Backend):
+    """
+    Forwards every command to ``inner``, and records the number of calls and
+    time spent in each command.
+
+    ========================   ===========================================================================
+    ``counts``                 Counter of calls per command
+    ``times``                  dict of total seconds per command
+    ``maxTimes``               dict of the longest call per command, in seconds
+    ``histograms``             dict of Counters per command, counting calls by the binary exponent of
+                               their time in seconds, see :meth:`histogram`. Times below
+                               ``minTime`` count in its bin.
+    ``folded``                 Counter of seconds per call stack, if ``stacks`` is True
+    ========================   ===========================================================================
+
+    If ``stacks`` is True the Python callers of each command, up to
+    ``depth`` frames, are recorded as well, which costs a few microseconds
+    per command.
+    """
+
+    def __init__(self, inner, stacks=False, depth=12):
+        super().__init__(inner)
+        self.stacks = stacks
+        self.depth = depth
+        self._phases = []
+        self.reset()
+
+    def reset(self):
+        """
+        Clears all records.
+        """
+        self.counts = collections.Counter()
+        self.times = collections.defaultdict(float)
+        self.maxTimes = collections.defaultdict(float)
+        self.histograms = collections.defaultdict(collections.Counter)
+        self.folded = collections.Counter()
+
+    def __getattr__(self, cmd):
+        if cmd.startswith('_'):
+            raise AttributeError(cmd)
+        target = getattr(self.inner, cmd)
+        counts, times, maxTimes = self.counts, self.times, self.maxTimes
+        histogram = self.histograms[cmd]
+        clock = time.perf_counter
+        frexp = math.frexp
+
+        def command(*args):
+            start = clock()
+            try:
+                return target(*args)
+            finally:
+                elapsed = clock() - start
+                counts[cmd] += 1
+                times[cmd] += elapsed
+                if elapsed > maxTimes[cmd]:
+                    maxTimes[cmd] = elapsed
+                histogram[frexp(max(elapsed, minTime))[1]] += 1
+                if self.stacks:
+                    self.folded[self._stack(cmd)] += elapsed
+
+        setattr(self, cmd, command)
+        return command
+
+    def _stack(self, cmd):
+        frames = []
+        frame = sys._getframe(2)
+        while frame is not None and len(frames) < self.depth:
+            module = frame.f_globals.get('__name__', '?')
+            if module not in _layerModules:
+                frames.append(f'{module}:{frame.f_code.co_name}')
+            frame = frame.f_back
+        frames.reverse()
+        return ';'.join(self._phases + frames + [cmd])
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Labels the commands sent in a ``with`` block, as the root of their
+        call stacks. Phases can be nested.
+        """
+        self._phases.append(name)
+        try:
+            yield self
+        finally:
+            self._phases.pop()
+
+    def histogram(self, cmd):
+        """
+        Returns the bin edges in seconds and the number of calls of a command
+        in each bin. Bins are powers of two.
+        """
+        bins = self.histograms.get(cmd)
+        if not bins:
+            return [], []
+        exponents = range(min(bins), max(bins) + 1)
+        edges = [2.0 ** (exponent - 1) for exponent in exponents] + [2.0 ** max(bins)]
+        return edges, [bins.get(exponent, 0) for exponent in exponents]
+
+    def _decades(self, cmd):
+        decades = collections.Counter()
+        for exponent, count in self.histograms[cmd].items():
+            decades[min(max(math.floor(math.log10(2.0 ** (exponent - 1))), -7), 0)] += count
+        return [decades.get(decade, 0) for decade in range(-7, 1)]
+
+    def report(self, top=20):
+        """
+        Returns a text report of the time spent per category and for the
+        ``top`` commands with the most total time.
+        """
+        total = sum(self.times.values()) or 1.0
+        lines = [f"{'category':<12}{'calls':>10}{'total s':>12}{'%':>8}"]
+        groups = collections.defaultdict(lambda: [0, 0.0])
+        for cmd, count in self.counts.items():
+            group = groups[category(cmd)]
+            group[0] += count
+            group[1] += self.times[cmd]
+        for name, (calls, seconds) in sorted(groups.items(), key=lambda item: -item[1][1]):
+            lines.append(f'{name:<12}{calls:>10}{seconds:>12.4f}{100 * seconds / total:>8.1f}')
+
+        lines.append('')
+        lines.append(f"{'command':<22}{'calls':>10}{'total s':>12}{'mean us':>10}{'max us':>10}"
+                     f"{'%':>7}   calls per decade <1us .. >=1s")
+        ranked = sorted(self.times.items(), key=lambda item: -item[1])[:top]
+        for cmd, seconds in ranked:
+            calls = self.counts[cmd]
+            decades = ' '.join(f'{count:>5}' for count in self._decades(cmd))
+            lines.append(f'{cmd:<22}{calls:>10}{seconds:>12.4f}{1e6 * seconds / calls:>10.1f}'
+                         f'{1e6 * self.maxTimes[cmd]:>10.1f}{100 * seconds / total:>7.1f}   {decades}')
+        return '\n'.join(lines)
+
+    def exportFolded(self, path):
+        """
+        Writes the recorded call stacks in the folded format read by
+        flamegraph.pl, speedscope and similar tools, with times in
+        microseconds. Requires ``stacks=True``.
+        """
+        if not self.stacks:
+            raise ValueError('call stacks are only recorded with stacks=True')
+        with open(path, 'w') as f:
+            for stack, seconds in self.folded.items():
+                f.write(f'{stack} {max(1, round(1e6 * seconds))}\n')
+
+
+def getProfiler():
+    """
+    Returns the profiling layer of the active backend, or None if profiling
+    is not enabled.
+    """
+    return findLayer(ProfilingBackend)
+
+
+def enableProfiling(stacks=False, depth=12):
+    """
+    Starts profiling every command, and returns the profiler. If profiling is
+    already enabled the existing profiler is returned.
+
+    ========================   ===========================================================================
+    ``stacks`` |bool|          if True the Python call stack of each command is recorded. (optional)
+    ``depth`` |int|            number of stack frames recorded per command. (optional)
+    ========================   ===========================================================================
+    """
+    profiler = getProfiler()
+    if profiler is None:
+        profiler = ProfilingBackend(getBackend(), stacks, depth)
+        setBackend(profiler)
+    return profiler
+
+
+def disableProfiling():
+    """
+    Stops profiling. The layer is removed wherever it sits in the active
+    backend.
+    """
+    if findLayer(ProfilingBackend) is not None:
+        removeLayer(ProfilingBackend)
+
+
+@contextlib.contextmanager
+def profile(stacks=False, depth=12):
+    """
+    Profiles the commands sent in a ``with`` block, and yields the profiler.
+    """
+    with useBackend(ProfilingBackend(getBackend(), stacks, depth)) as profiler:
+        yield profiler
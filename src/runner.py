@@ -0,0 +1,358 @@
+"""
+Runs independent analyses in parallel, one model per worker process.
+
+OpenSees keeps a single domain per process, so cases such as the records of
+a ground motion suite are run in a pool of worker processes. The workers are
+started once and reused, so the imports are paid once per worker rather than
+once per case, and the domain is wiped before each case.
+
+.. code-block:: python
+
+   from openseespyhint.runner import runCases
+
+   def runRecord(record):
+       buildModel()
+       applyGroundMotion(record)
+       ok = op.analysis.analyze(4000, 0.01)
+       return ok, op.output.nodeDisp(10, 1)
+
+   for result in runCases(runRecord, records, retries=1, timeout=600):
+       if result.error is None:
+           save(result.case, result.value)
+
+The function must be defined at the top level of a module, so it can be sent
+to the workers.
+
+When every case starts from the same state, i.e. after a long gravity
+analysis, :func:`forkCases` builds the model once and forks a copy of the
+process for each case instead.
+"""
+import collections
+import concurrent.futures
+import itertools
+import multiprocessing
+import os
+import pickle
+import selectors
+import signal
+import sys
+import time
+
+from .backend import ops
+from . import utility
+
+
+_killSignal = getattr(signal, 'SIGKILL', signal.SIGTERM)
+
+CaseResult = collections.namedtuple(
+    'CaseResult', ['index', 'case', 'value', 'error', 'attempts', 'wallTime'])
+CaseResult.__doc__ = """
+The outcome of one case. ``value`` is the return value of the function, or
+None if it raised, in which case ``error`` is the exception. ``attempts`` is
+the number of times the case was run, and ``wallTime`` the seconds spent on
+the last attempt.
+"""
+
+
+# Queue the workers report the cases they start on, set by _initWorker.
+_started = None
+
+
+def _initWorker(started, initializer, initargs):
+    global _started
+    _started = started
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _runCase(func, case, token):
+    """
+    Runs one case in a worker, on a wiped domain.
+    """
+    _started.put((token, os.getpid()))
+    start = time.perf_counter()
+    ops.wipe()
+    return func(case), time.perf_counter() - start
+
+
+def runCases(func, cases, workers=None, retries=0, timeout=None, initializer=None,
+             initargs=(), context=None):
+    """
+    Runs ``func(case)`` for each case in a pool of worker processes, and yields
+    a :class:`CaseResult` for each case as soon as it finishes. Results are
+    yielded in the order the cases finish, use ``result.index`` to match them to
+    the cases.
+
+    ========================   ===========================================================================
+    ``func``                   function that builds and analyzes the model of one case, and returns the
+                               results to keep. It runs on a wiped domain.
+    ``cases`` |list|           the arguments of each case.
+    ``workers`` |int|          number of worker processes, by default the number of cores. (optional)
+    ``retries`` |int|          number of times a case that raises or times out is run again.
+                               (optional)
+    ``timeout`` |float|        seconds a case may run before its worker is killed, and the case fails
+                               with a ``TimeoutError``. (optional)
+    ``initializer``            function run once in each worker when it starts, i.e. to import modules
+                               or set a log file. (optional)
+    ``initargs`` |list|        arguments of ``initializer``. (optional)
+    ``context``                the multiprocessing context or start method, i.e. ``'spawn'``.
+                               (optional)
+    ========================   ===========================================================================
+
+    The timeout is enforced by this process, from the time a worker starts
+    the case, so a case stuck in a long ``analyze`` call is stopped as well.
+    Killing a worker, or a worker crashing, breaks the pool: the pool is
+    restarted, and only the case whose worker died counts an attempt. The
+    other cases that were running are run again without counting one. If
+    several cases were running when a worker crashed, they are run again
+    one at a time until the one that crashes is found.
+    """
+    if isinstance(context, str):
+        context = multiprocessing.get_context(context)
+    workers = workers or os.cpu_count() or 1
+    cases = list(cases)
+    queue = collections.deque(range(len(cases)))
+    # cases that were running when a worker crashed, run alone to find the crashing one
+    suspects = collections.deque()
+    attempts = [0] * len(cases)
+    # written straight to a pipe, so the report of a case that crashes is not lost
+    started = (context or multiprocessing.get_context()).SimpleQueue()
+    # with a timeout no case waits in the pool, so each starts when it is sent
+    inFlight = workers if timeout else 2 * workers
+    counter = itertools.count()
+
+    def newPool():
+        return concurrent.futures.ProcessPoolExecutor(
+            workers, mp_context=context, initializer=_initWorker,
+            initargs=(started, initializer, tuple(initargs)))
+
+    def submit(index):
+        attempts[index] += 1
+        token = next(counter)
+        running[pool.submit(_runCase, func, cases[index], token)] = (index, token)
+
+    def readStarted():
+        tokens = {token for index, token in running.values()} | {token for index, token in lost}
+        while not started.empty():
+            token, pid = started.get()
+            # skip the cases of a pool that was restarted
+            if token in tokens:
+                begun[token] = (pid, time.monotonic())
+
+    def restart(pool, running):
+        pool.shutdown(wait=False, cancel_futures=True)
+        for index, token in running.values():
+            attempts[index] -= 1
+            queue.appendleft(index)
+        return newPool()
+
+    pool = newPool()
+    running = {}
+    begun = {}
+    lost = []
+    try:
+        while queue or suspects or running:
+            if suspects:
+                if not running:
+                    submit(suspects.popleft())
+            else:
+                # keep a few cases queued per worker, so retries go to the back
+                while queue and len(running) < inFlight:
+                    submit(queue.popleft())
+            wait = None
+            if timeout:
+                now = time.monotonic()
+                left = [start + timeout - now for pid, start in begun.values()]
+                # poll until every worker has reported the case it started
+                wait = max(0.0, min(left + [0.05] * (len(left) < len(running))))
+            done, _ = concurrent.futures.wait(running, timeout=wait,
+                                              return_when=concurrent.futures.FIRST_COMPLETED)
+            lost = []
+            for future in done:
+                index, token = running.pop(future)
+                try:
+                    value, wallTime = future.result()
+                except concurrent.futures.process.BrokenProcessPool:
+                    lost.append((index, token))
+                    continue
+                except Exception as error:
+                    result = CaseResult(index, cases[index], None, error, attempts[index], None)
+                else:
+                    result = CaseResult(index, cases[index], value, None, attempts[index], wallTime)
+                begun.pop(token, None)
+                if result.error is not None and attempts[index] <= retries:
+                    queue.append(index)
+                else:
+                    yield result
+
+            if lost:
+                # every case of the pool is lost, find the one whose worker died
+                readStarted()
+                lost.extend(running.values())
+                running = {}
+                pool.shutdown(wait=False, cancel_futures=True)
+                inCase = [item for item in lost if item[1] in begun]
+                crashed = inCase if len(inCase) == 1 else lost if len(lost) == 1 else []
+                again = [] if crashed else inCase or lost
+                for index, token in lost:
+                    if (index, token) in crashed:
+                        if attempts[index] <= retries:
+                            queue.append(index)
+                        else:
+                            error = concurrent.futures.process.BrokenProcessPool(
+                                'the worker process running the case ended abruptly')
+                            yield CaseResult(index, cases[index], None, error, attempts[index], None)
+                        continue
+                    attempts[index] -= 1
+                    (suspects if (index, token) in again else queue).appendleft(index)
+                lost, begun = [], {}
+                pool = newPool()
+                continue
+            if not timeout:
+                continue
+
+            readStarted()
+            now = time.monotonic()
+            expired = [(future, index, token) for future, (index, token) in running.items()
+                       if token in begun and now - begun[token][1] >= timeout]
+            if not expired:
+                continue
+            for future, index, token in expired:
+                os.kill(begun[token][0], _killSignal)
+                del running[future]
+                if attempts[index] <= retries:
+                    queue.append(index)
+                else:
+                    yield CaseResult(index, cases[index], None,
+                                     TimeoutError('the case ran past its timeout'),
+                                     attempts[index], now - begun[token][1])
+            pool = restart(pool, running)
+            running, begun = {}, {}
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _runChild(func, case, write):
+    """
+    Runs one case in a forked child, and sends the result to the parent.
+    """
+    start = time.perf_counter()
+    try:
+        utility.wipeAnalysis()
+        message = (func(case), None)
+    except BaseException as error:
+        message = (None, error)
+    try:
+        data = pickle.dumps(message + (time.perf_counter() - start,))
+    except Exception as error:
+        # the result or the exception can't be pickled
+        data = pickle.dumps((None, RuntimeError(repr(error)), time.perf_counter() - start))
+    with os.fdopen(write, 'wb') as f:
+        f.write(data)
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+
+def forkCases(func, cases, build=None, pseudoTime=0.0, workers=None, timeout=None):
+    """
+    Builds the model once, then runs ``func(case)`` for each case in a forked
+    copy of the process, and yields a :class:`CaseResult` for each case as
+    soon as it finishes.
+
+    ========================   ===========================================================================
+    ``func``                   function that runs the analysis of one case from the built state, and
+                               returns the results to keep. It starts with the analysis wiped, and has
+                               to define its own.
+    ``cases`` |list|           the arguments of each case.
+    ``build``                  function that builds the model and runs the gravity analysis in this
+                               process. If it is not given, the current domain is used. (optional)
+    ``pseudoTime`` |float|     after ``build``, the loads are set constant with
+                               :func:`openseespyhint.utility.loadConst` and the time set to this. If
+                               None, the loads and time are left as they are. (optional)
+    ``workers`` |int|          number of cases run at once, by default the number of cores. (optional)
+    ``timeout`` |float|        seconds a case may run before its process is killed. (optional)
+    ========================   ===========================================================================
+
+    Each child is a copy on write fork of this process, so the model is not
+    built again and only the memory the case changes is copied. Results are
+    pickled back to this process through a pipe. The children run on the copy
+    of the domain, so the domain of this process is not changed by the cases.
+
+    Hints: uses ``os.fork``, and is only available on Unix. Fork from a
+    process without other threads running.
+    """
+    if not hasattr(os, 'fork'):
+        raise ValueError('forkCases needs os.fork, which this platform does not have')
+    if build is not None:
+        build()
+        if pseudoTime is not None:
+            utility.loadConst(pseudoTime)
+    workers = workers or os.cpu_count() or 1
+    cases = list(cases)
+    queue = collections.deque(range(len(cases)))
+    selector = selectors.DefaultSelector()
+    running = {}
+    try:
+        while queue or running:
+            while queue and len(running) < workers:
+                index = queue.popleft()
+                read, write = os.pipe()
+                sys.stdout.flush()
+                sys.stderr.flush()
+                pid = os.fork()
+                if pid == 0:
+                    code = 0
+                    try:
+                        os.close(read)
+                        _runChild(func, cases[index], write)
+                    except BaseException:
+                        code = 1
+                    finally:
+                        os._exit(code)
+                os.close(write)
+                running[read] = (index, pid, time.monotonic(), [])
+                selector.register(read, selectors.EVENT_READ)
+
+            wait = None
+            if timeout:
+                first = min(start for _, _, start, _ in running.values())
+                wait = max(0.0, first + timeout - time.monotonic())
+            for key, _ in selector.select(wait):
+                index, pid, start, chunks = running[key.fd]
+                chunk = os.read(key.fd, 1 << 16)
+                if chunk:
+                    chunks.append(chunk)
+                    continue
+                yield _finishChild(selector, running, key.fd, cases, None)
+
+            if timeout:
+                now = time.monotonic()
+                for read, (index, pid, start, chunks) in list(running.items()):
+                    if now - start >= timeout:
+                        os.kill(pid, _killSignal)
+                        yield _finishChild(selector, running, read, cases,
+                                           TimeoutError('the case ran past its timeout'))
+    finally:
+        for read, (index, pid, start, chunks) in running.items():
+            os.kill(pid, _killSignal)
+            os.waitpid(pid, 0)
+            selector.unregister(read)
+            os.close(read)
+        selector.close()
+
+
+def _finishChild(selector, running, read, cases, error):
+    """
+    Collects a finished or killed child, and returns its result.
+    """
+    index, pid, start, chunks = running.pop(read)
+    selector.unregister(read)
+    os.close(read)
+    _, status = os.waitpid(pid, 0)
+    value, wallTime = None, time.monotonic() - start
+    if error is None:
+        if chunks:
+            value, error, wallTime = pickle.loads(b''.join(chunks))
+        else:
+            error = ChildProcessError(f'the case process ended with status {status}')
+    return CaseResult(index, cases[index], value, error, 1, wallTime)
@@ -0,0 +1,489 @@
+"""
+An array backed mirror of the model, kept up to date as commands are sent.
+
+Tools that need the model geometry can read it from the shadow domain with
+vectorized slices, instead of calling ``nodeCoord``, ``eleNodes`` and
+``getNodeTags`` once per object.
+
+The shadow domain is maintained by a backend layer that watches the commands
+sent by the wrappers, so it has to be enabled before the model is built:
+
+.. code-block:: python
+
+   import openseespyhint as op
+   from openseespyhint.shadow import enableShadow
+
+   shadow = enableShadow()
+   buildModel()
+   xyz = shadow.nodeCoord()
+   ij = shadow.eleNodes()
+
+"""
+import numpy as np
+
+from .backend import Backend, findLayer, getBackend, removeLayer, setBackend
+
+
+def _grow(array, size):
+    """
+    Returns the array with its first dimension doubled until it holds size
+    rows. New rows are filled with -1 for integer and nan for float arrays.
+    """
+    capacity = len(array)
+    if size <= capacity:
+        return array
+    while capacity < size:
+        capacity *= 2
+    fill = -1 if np.issubdtype(array.dtype, np.integer) else np.nan
+    grown = np.full((capacity,) + array.shape[1:], fill, dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class _TagIndex:
+    """
+    Maps tags to rows, both one at a time with a dict, and for arrays with a
+    sorted copy of the tags that is rebuilt after the tags change.
+    """
+
+    def __init__(self):
+        self.rows = {}
+        self._sorted = None
+
+    def add(self, tag, row):
+        self.rows[tag] = row
+        self._sorted = None
+
+    def rebuild(self, tags):
+        self.rows = {tag: row for row, tag in enumerate(tags.tolist())}
+        self._sorted = None
+
+    def lookup(self, tags, allTags, kind):
+        tags = np.asarray(tags)
+        if self._sorted is None:
+            order = np.argsort(allTags, kind='stable')
+            self._sorted = (allTags[order], order)
+        sortedTags, order = self._sorted
+        position = np.searchsorted(sortedTags, tags)
+        position = np.clip(position, 0, max(len(sortedTags) - 1, 0))
+        if len(sortedTags) == 0 or np.any(sortedTags[position] != tags):
+            missing = np.setdiff1d(tags, allTags)
+            raise KeyError(f'{kind} tags not in the shadow domain: {missing.tolist()}')
+        return order[position]
+
+
+class ShadowDomain:
+    """
+    Array backed mirror of the nodes and elements of a model.
+
+    Node data are stored in rows of growable arrays, in the order the nodes
+    were created, and element data in the same way. Arrays grow by doubling,
+    and the public attributes are views of the filled rows.
+
+    ========================   ===========================================================================
+    ``nodeTags``               (N,) node tags
+    ``coords``                 (N, ndm) nodal coordinates
+    ``nodeNdf``                (N,) number of dofs at each node, -1 if unknown
+    ``eleTags``                (M,) element tags
+    ``eleNodesTable``          (M, nen) element connectivity, padded with -1
+    ``eleTypeCodes``           (M,) index of each element type in ``eleTypeNames``
+    ``eleMatTags``             (M,) material tags, -1 if the element has none
+    ``eleSecTags``             (M,) section or beam integration tags, -1 if the element has none
+    ``eleTransfTags``          (M,) geometric transformation tags, -1 if the element has none
+    ``materials``              dict of material tag to ``(command, type)``
+    ``sections``               dict of section tag to type
+    ``transforms``             dict of transformation tag to type
+    ``materialData``           dict of material tag to its full ``printModel`` JSON entry, only for
+                               domains read with :func:`openseespyhint.output.modelJSON.readModelJSON`
+    ``sectionData``            dict of section tag to its full JSON entry, as ``materialData``
+    ``transformData``          dict of transformation tag to its full JSON entry, as ``materialData``
+    ``constraints``            type of the constraint handler, i.e. ``'Lagrange'``, None if not known
+    ``algorithm``              type of the solution algorithm, i.e. ``'Newton'``, None if not known
+    ``integrator``             type of the integrator, i.e. ``'ArcLength'``, None if not known
+    ========================   ===========================================================================
+    """
+
+    def __init__(self, capacity=1024):
+        self.capacity = capacity
+        self.wipe()
+
+    @classmethod
+    def fromArrays(cls, nodeTags, coords, nodeNdf=None, eleTags=(), eleNodes=None,
+                   eleTypes=None, eleMatTags=None, eleSecTags=None, eleTransfTags=None):
+        """
+        Creates a domain from node and element arrays, i.e. read from a
+        ``printModel`` JSON file. ``eleNodes`` is padded with -1, and the
+        optional element columns default to -1.
+        """
+        nodeTags = np.asarray(nodeTags, dtype=int)
+        coords = np.asarray(coords, dtype=float).reshape(len(nodeTags), -1)
+        eleTags = np.asarray(eleTags, dtype=int)
+        N, M = len(nodeTags), len(eleTags)
+        domain = cls(max(N, M, 1))
+        domain.ndm = coords.shape[1] if N else None
+        domain.numNodes = N
+        domain.numElements = M
+        domain._nodeTags[:N] = nodeTags
+        domain._coords[:N, :coords.shape[1]] = coords
+        if nodeNdf is not None:
+            domain._nodeNdf[:N] = nodeNdf
+        if eleNodes is not None and M:
+            eleNodes = np.asarray(eleNodes, dtype=int).reshape(M, -1)
+            domain._eleNodes = np.full((len(domain._eleTags), eleNodes.shape[1]), -1, dtype=int)
+            domain._eleNodes[:M] = eleNodes
+        domain._eleTags[:M] = eleTags
+        if eleTypes is not None and M:
+            names, codes = np.unique(np.asarray(eleTypes, dtype=str), return_inverse=True)
+            domain.eleTypeNames = names.tolist()
+            domain._eleTypeCodes = {name: code for code, name in enumerate(domain.eleTypeNames)}
+            domain._eleData[:M, 0] = codes
+        for column, values in enumerate([eleMatTags, eleSecTags, eleTransfTags], 1):
+            if values is not None:
+                domain._eleData[:M, column] = values
+        domain._nodeIndex.rebuild(domain.nodeTags)
+        domain._eleIndex.rebuild(domain.eleTags)
+        return domain
+
+    def wipe(self):
+        """
+        Clears the mirror, as ``wipe`` clears the domain.
+        """
+        capacity = self.capacity
+        self.ndm = None
+        self.ndf = None
+        self.numNodes = 0
+        self.numElements = 0
+        self._nodeTags = np.full(capacity, -1, dtype=int)
+        self._coords = np.full((capacity, 3), np.nan)
+        self._nodeNdf = np.full(capacity, -1, dtype=int)
+        self._eleTags = np.full(capacity, -1, dtype=int)
+        self._eleNodes = np.full((capacity, 2), -1, dtype=int)
+        self._eleData = np.full((capacity, 4), -1, dtype=int)
+        self.eleTypeNames = []
+        self._eleTypeCodes = {}
+        self._nodeIndex = _TagIndex()
+        self._eleIndex = _TagIndex()
+        self.materials = {}
+        self.sections = {}
+        self.transforms = {}
+        self.materialData = {}
+        self.sectionData = {}
+        self.transformData = {}
+        self.constraints = None
+        self.algorithm = None
+        self.integrator = None
+
+    # Views of the filled rows
+    @property
+    def nodeTags(self):
+        return self._nodeTags[:self.numNodes]
+
+    @property
+    def coords(self):
+        return self._coords[:self.numNodes, :self.ndm or 3]
+
+    @property
+    def nodeNdf(self):
+        return self._nodeNdf[:self.numNodes]
+
+    @property
+    def eleTags(self):
+        return self._eleTags[:self.numElements]
+
+    @property
+    def eleNodesTable(self):
+        return self._eleNodes[:self.numElements]
+
+    @property
+    def eleTypeCodes(self):
+        return self._eleData[:self.numElements, 0]
+
+    @property
+    def eleMatTags(self):
+        return self._eleData[:self.numElements, 1]
+
+    @property
+    def eleSecTags(self):
+        return self._eleData[:self.numElements, 2]
+
+    @property
+    def eleTransfTags(self):
+        return self._eleData[:self.numElements, 3]
+
+    # Updates
+    def addNode(self, tag, crds, ndf=-1):
+        row = self.numNodes
+        if row == len(self._nodeTags):
+            self._nodeTags = _grow(self._nodeTags, row + 1)
+            self._coords = _grow(self._coords, row + 1)
+            self._nodeNdf = _grow(self._nodeNdf, row + 1)
+        self._nodeTags[row] = tag
+        self._coords[row, :len(crds)] = crds
+        self._nodeNdf[row] = ndf
+        self._nodeIndex.add(tag, row)
+        self.numNodes += 1
+
+    def addElement(self, eleType, tag, nodes, matTag=-1, secTag=-1, transfTag=-1):
+        row = self.numElements
+        if row == len(self._eleTags):
+            self._eleTags = _grow(self._eleTags, row + 1)
+            self._eleNodes = _grow(self._eleNodes, row + 1)
+            self._eleData = _grow(self._eleData, row + 1)
+        nen = len(nodes)
+        if nen > self._eleNodes.shape[1]:
+            wider = np.full((len(self._eleNodes), nen), -1, dtype=int)
+            wider[:, :self._eleNodes.shape[1]] = self._eleNodes
+            self._eleNodes = wider
+        code = self._eleTypeCodes.get(eleType)
+        if code is None:
+            code = self._eleTypeCodes[eleType] = len(self.eleTypeNames)
+            self.eleTypeNames.append(eleType)
+        self._eleTags[row] = tag
+        self._eleNodes[row, :nen] = nodes
+        self._eleData[row] = (code, matTag, secTag, transfTag)
+        self._eleIndex.add(tag, row)
+        self.numElements += 1
+
+    def setNodeCoord(self, tag, dim, value):
+        self._coords[self._nodeIndex.rows[tag], dim - 1] = value
+
+    def removeNode(self, tag):
+        row = self._nodeIndex.rows.get(tag)
+        if row is None:
+            return
+        for name in ('_nodeTags', '_coords', '_nodeNdf'):
+            array = getattr(self, name)
+            array[row:self.numNodes - 1] = array[row + 1:self.numNodes]
+        self.numNodes -= 1
+        self._nodeIndex.rebuild(self.nodeTags)
+
+    def removeElement(self, tag):
+        row = self._eleIndex.rows.get(tag)
+        if row is None:
+            return
+        for name in ('_eleTags', '_eleNodes', '_eleData'):
+            array = getattr(self, name)
+            array[row:self.numElements - 1] = array[row + 1:self.numElements]
+        self.numElements -= 1
+        self._eleIndex.rebuild(self.eleTags)
+
+    # Queries
+    def nodeRows(self, tags):
+        """
+        Returns the rows of the input node tags.
+        """
+        return self._nodeIndex.lookup(tags, self.nodeTags, 'node')
+
+    def eleRows(self, tags):
+        """
+        Returns the rows of the input element tags.
+        """
+        return self._eleIndex.lookup(tags, self.eleTags, 'element')
+
+    def nodeCoord(self, tags=None):
+        """
+        Returns the (N, ndm) coordinates of the input nodes, or of all nodes.
+        """
+        if tags is None:
+            return self.coords
+        return self.coords[self.nodeRows(tags)]
+
+    def eleNodes(self, tags=None):
+        """
+        Returns the (M, nen) connectivity of the input elements, or of all
+        elements, padded with -1.
+        """
+        if tags is None:
+            return self.eleNodesTable
+        return self.eleNodesTable[self.eleRows(tags)]
+
+    def eleTypes(self, tags=None):
+        """
+        Returns the type names of the input elements, or of all elements.
+        """
+        codes = self.eleTypeCodes if tags is None else self.eleTypeCodes[self.eleRows(tags)]
+        return np.array(self.eleTypeNames, dtype=object)[codes]
+
+
+# Argument layout of common element types: the number of nodes, and the
+# positions of the material, section and transformation tags counted from the
+# first argument after the nodes. A string position is the flag before the tag,
+# and 'last' is the last numeric argument before any flags.
+# type: (nen, matPos, secPos, transfPos)
+elementLayouts = {
+    'Truss': (2, 1, None, None),
+    'corotTruss': (2, 1, None, None),
+    'TrussSection': (2, None, 0, None),
+    'corotTrussSection': (2, None, 0, None),
+    'forceBeamColumn': (2, None, 1, 0),
+    'dispBeamColumn': (2, None, 1, 0),
+    'zeroLength': (2, '-mat', None, None),
+    'twoNodeLink': (2, '-mat', None, None),
+    'zeroLengthND': (2, 0, None, None),
+    'zeroLengthSection': (2, None, 0, None),
+    'elasticBeamColumn': (2, None, None, 'last'),
+    'ModElasticBeam2d': (2, None, None, 'last'),
+    'ElasticTimoshenkoBeam': (2, None, None, 'last'),
+    'quad': (4, 2, None, None),
+    'tri31': (3, 2, None, None),
+    'SSPquad': (4, 0, None, None),
+    'SSPbrick': (8, 0, None, None),
+    'stdBrick': (8, 0, None, None),
+    'bbarBrick': (8, 0, None, None),
+    'FourNodeTetrahedron': (4, 0, None, None),
+    'ShellMITC4': (4, None, 0, None),
+    'ShellDKGQ': (4, None, 0, None),
+    'ShellNLDKGQ': (4, None, 0, None),
+    'ASDShellQ4': (4, None, 0, None),
+    'ShellDKGT': (3, None, 0, None),
+    'ShellNLDKGT': (3, None, 0, None),
+}
+
+
+def _tagAt(args, position):
+    """
+    Returns the tag at a position in the arguments after the element nodes.
+    """
+    if position is None:
+        return -1
+    if position == 'last':
+        numeric = []
+        for arg in args:
+            if isinstance(arg, str):
+                break
+            numeric.append(arg)
+        return int(numeric[-1]) if numeric else -1
+    if isinstance(position, str):
+        if position in args:
+            return int(args[args.index(position) + 1])
+        return -1
+    if position < len(args) and not isinstance(args[position], str):
+        return int(args[position])
+    return -1
+
+
+class ShadowBackend(Backend):
+    """
+    Forwards every command to ``inner``, and mirrors the model building
+    commands in a :class:`ShadowDomain`. Commands that don't change the model
+    are forwarded without any extra work.
+    """
+
+    def __init__(self, inner, domain=None):
+        super().__init__(inner)
+        self.domain = ShadowDomain() if domain is None else domain
+
+    def __getattr__(self, cmd):
+        if cmd.startswith('_'):
+            raise AttributeError(cmd)
+        target = getattr(self.inner, cmd)
+        mirror = getattr(self, '_mirror_' + cmd, None)
+        if mirror is None:
+            command = target
+        else:
+            def command(*args):
+                result = target(*args)
+                mirror(*args)
+                return result
+        setattr(self, cmd, command)
+        return command
+
+    def _mirror_wipe(self, *args):
+        self.domain.wipe()
+
+    def _mirror_model(self, *args):
+        if '-ndm' in args:
+            self.domain.ndm = int(args[args.index('-ndm') + 1])
+        if '-ndf' in args:
+            self.domain.ndf = int(args[args.index('-ndf') + 1])
+
+    def _mirror_node(self, tag, *args):
+        ndm = self.domain.ndm
+        if ndm is None:
+            ndm = next((ii for ii, arg in enumerate(args) if isinstance(arg, str)), len(args))
+        ndf = self.domain.ndf or -1
+        if '-ndf' in args:
+            ndf = int(args[args.index('-ndf') + 1])
+        self.domain.addNode(int(tag), args[:ndm], ndf)
+
+    def _mirror_element(self, eleType, tag, *args):
+        nen, matPos, secPos, transfPos = elementLayouts.get(eleType, (None, None, None, None))
+        if nen is None:
+            nodes = self.inner.eleNodes(tag)
+            if not isinstance(nodes, (list, tuple)):
+                nodes = []
+            nen = len(nodes)
+        else:
+            nodes = args[:nen]
+        rest = args[nen:]
+        self.domain.addElement(eleType, int(tag), nodes, _tagAt(rest, matPos),
+                               _tagAt(rest, secPos), _tagAt(rest, transfPos))
+
+    def _mirror_uniaxialMaterial(self, matType, tag, *args):
+        self.domain.materials[int(tag)] = ('uniaxialMaterial', matType)
+
+    def _mirror_nDMaterial(self, matType, tag, *args):
+        self.domain.materials[int(tag)] = ('nDMaterial', matType)
+
+    def _mirror_section(self, secType, tag, *args):
+        self.domain.sections[int(tag)] = secType
+
+    def _mirror_geomTransf(self, transfType, tag, *args):
+        self.domain.transforms[int(tag)] = transfType
+
+    def _mirror_constraints(self, handlerType, *args):
+        self.domain.constraints = handlerType
+
+    def _mirror_algorithm(self, algoType, *args):
+        self.domain.algorithm = algoType
+
+    def _mirror_integrator(self, intType, *args):
+        self.domain.integrator = intType
+
+    def _mirror_wipeAnalysis(self, *args):
+        self.domain.constraints = self.domain.algorithm = self.domain.integrator = None
+
+    def _mirror_setNodeCoord(self, tag, dim, value, *args):
+        self.domain.setNodeCoord(tag, dim, value)
+
+    def _mirror_remove(self, kind, *args):
+        if kind == 'node':
+            self.domain.removeNode(args[0])
+        elif kind in ('ele', 'element'):
+            self.domain.removeElement(args[0])
+
+
+def getShadow():
+    """
+    Returns the shadow domain of the active backend, or None if the shadow
+    domain is not enabled.
+    """
+    backend = findLayer(ShadowBackend)
+    return None if backend is None else backend.domain
+
+
+def enableShadow(capacity=1024):
+    """
+    Starts mirroring the model in a shadow domain, and returns it. If the
+    shadow domain is already enabled the existing one is returned.
+
+    ========================   ===========================================================================
+    ``capacity`` |int|         number of nodes and elements to allocate space for. The arrays grow as
+                               needed. (optional)
+    ========================   ===========================================================================
+    """
+    domain = getShadow()
+    if domain is None:
+        backend = ShadowBackend(getBackend(), ShadowDomain(capacity))
+        setBackend(backend)
+        domain = backend.domain
+    return domain
+
+
+def disableShadow():
+    """
+    Stops mirroring the model. The layer is removed wherever it sits in the
+    active backend.
+    """
+    if findLayer(ShadowBackend) is not None:
+        removeLayer(ShadowBackend)
@@ -0,0 +1,114 @@
+"""
+Command tapes: record the commands sent by the wrappers once, then replay
+them in bulk.
+
+While recording, the wrappers build their arguments as usual but the finished
+commands are stored on the tape instead of being run. Replaying the tape sends
+the stored commands straight to the backend, so none of the wrapper argument
+handling is repeated.
+
+For example,
+
+.. code-block:: python
+
+   import openseespyhint as op
+   from openseespyhint.tape import record
+
+   with record() as tape:
+       op.utility.wipe()
+       op.model.basic(2, 3)
+       buildModel()
+
+   for gm in groundMotions:
+       tape.replay()  # wipes and rebuilds the model
+       runGroundMotion(gm)
+
+"""
+import array
+import contextlib
+import pickle
+
+from .backend import ops, getBackend, useBackend, RecordingBackend
+
+
+class Tape:
+    """
+    A compact, ordered list of ``(cmd, args)`` commands.
+
+    Each distinct command name is stored once in ``commands``, and every entry
+    only keeps the index of its name in ``codes`` and its positional argument
+    tuple in ``args``.
+    """
+
+    def __init__(self):
+        self.commands = []
+        self.codes = array.array('H')
+        self.args = []
+        self._codeOf = {}
+
+    def append(self, entry):
+        """
+        Adds a ``(cmd, args)`` entry to the tape.
+        """
+        cmd, args = entry
+        code = self._codeOf.get(cmd)
+        if code is None:
+            code = self._codeOf[cmd] = len(self.commands)
+            self.commands.append(cmd)
+        self.codes.append(code)
+        self.args.append(args)
+
+    def __len__(self):
+        return len(self.args)
+
+    def __iter__(self):
+        commands = self.commands
+        for code, args in zip(self.codes, self.args):
+            yield commands[code], args
+
+    def replay(self, backend=None):
+        """
+        Sends every command on the tape to ``backend``, or to the active
+        backend if none is given.
+        """
+        target = ops if backend is None else backend
+        functions = [getattr(target, cmd) for cmd in self.commands]
+        for code, args in zip(self.codes, self.args):
+            functions[code](*args)
+
+    def save(self, path):
+        """
+        Writes the tape to a file, which can be read back with :func:`Tape.load`.
+        """
+        with open(path, 'wb') as f:
+            pickle.dump((self.commands, self.codes, self.args), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a tape written with :func:`Tape.save`.
+        """
+        tape = cls()
+        with open(path, 'rb') as f:
+            tape.commands, tape.codes, tape.args = pickle.load(f)
+        tape._codeOf = {cmd: ii for ii, cmd in enumerate(tape.commands)}
+        return tape
+
+
+@contextlib.contextmanager
+def record(tape=None, execute=False):
+    """
+    Records every command sent by the wrappers in a ``with`` block, and yields
+    the tape.
+
+    ========================   ===========================================================================
+    ``tape`` |Tape|            tape to append to. A new tape is created if none is given (optional)
+    ``execute`` |bool|         if True the commands are also run by the active backend, otherwise they
+                               are only recorded (optional)
+    ========================   ===========================================================================
+    """
+    tape = Tape() if tape is None else tape
+    inner = getBackend() if execute else None
+    with useBackend(RecordingBackend(inner, calls=tape)):
+        yield tape
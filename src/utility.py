@@ -1,4 +1,6 @@
-import openseespy.opensees as ops
+import sys
+
+from .backend import ops
 
 
 
@@ -151,7 +153,8 @@ def removeTag(type, tag):
 
 def removeRecorders():
     """
-    Remove all recorder objects.
+    Remove all recorder objects, including the memory recorders of
+    :mod:`openseespyhint.output.recorder`.
 
     
     Hints:
@@ -160,6 +163,9 @@ def removeRecorders():
     """
 
     ops.remove('recorders')
+    recorder = sys.modules.get(__package__ + '.output.recorder')
+    if recorder is not None:
+        recorder.removeMemoryRecorders()
 
 def removeSP(nodeTag, dofTag, patternTag = None):
     """
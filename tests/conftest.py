@@ -0,0 +1,100 @@
+"""
+Models shared by the test modules. Each fixture returns the function that
+builds its model, so a test can build it again.
+"""
+import numpy as np
+import pytest
+
+import openseespyhint as op
+import openseespy.opensees as ops
+
+
+def _buildTruss():
+    op.utility.wipe()
+    op.model.basic(2, 2)
+    op.model.node(1, [0.0, 0.0])
+    op.model.node(2, [144.0, 0.0])
+    op.model.node(3, [168.0, 0.0])
+    op.model.node(4, [72.0, 96.0])
+    op.model.SPconstraint.fix(1, [1, 1])
+    op.model.SPconstraint.fix(2, [1, 1])
+    op.model.SPconstraint.fix(3, [1, 1])
+    op.model.uniaxialMaterial.Elastic(1, 3000.0)
+    op.model.element.Truss(1, [1, 4], 10.0, 1)
+    op.model.element.Truss(2, [2, 4], 5.0, 1)
+    op.model.element.Truss(3, [3, 4], 5.0, 1)
+    op.model.timeSeries.Linear(1)
+    op.model.pattern.Plain(1, 1)
+    op.model.pattern.load(4, [100.0, -50.0])
+
+
+def _frame2D():
+    op.utility.wipe()
+    op.model.basic(2, 3)
+    op.model.nodes(np.arange(1, 5), [[0., 0.], [0., 3.], [4., 3.], [4., 0.]])
+    op.model.SPconstraint.fix(1, [1, 1, 1])
+    op.model.SPconstraint.fix(4, [1, 1, 1])
+    op.model.geomTransf.Linear2D(1)
+    op.model.timeSeries.Linear(1)
+    op.model.pattern.Plain(1, 1)
+    op.model.pattern.load(2, [10., 0., 0.])
+
+
+def _analyseStatic():
+    op.analysis.system.BandGen()
+    op.analysis.numberer.RCM()
+    op.analysis.constraints.Plain()
+    op.analysis.integrator.LoadControl(1.0)
+    op.analysis.algorithm.Newton()
+    op.analysis.test.NormDispIncr(1e-10, 20)
+    op.analysis.analysis('Static')
+    assert ops.analyze(1) == 0
+    return ops.nodeDisp(2, 1)
+
+
+def _transient():
+    _frame2D()
+    op.model.element.elasticBeamColumn2DMany([1, 2, 3], [[1, 2], [2, 3], [3, 4]],
+                                            0.01, 2e8, 1e-4, 1)
+    ops.mass(2, 1., 1., 0.)
+    ops.mass(3, 1., 1., 0.)
+    op.analysis.system.BandGen()
+    op.analysis.numberer.RCM()
+    op.analysis.constraints.Plain()
+    op.analysis.integrator.Newmark(0.5, 0.25)
+    op.analysis.test.NormDispIncr(1e-10, 10)
+    op.analysis.algorithm.Newton()
+    op.analysis.analysis('Transient')
+
+
+@pytest.fixture
+def buildTruss():
+    """
+    A plane truss of 3 bars meeting at node 4, loaded by pattern 1.
+    """
+    return _buildTruss
+
+
+@pytest.fixture
+def frame2D():
+    """
+    A plane portal frame of 4 nodes without elements, loaded by pattern 1.
+    """
+    return _frame2D
+
+
+@pytest.fixture
+def analyseStatic():
+    """
+    Runs one static step, and returns the displacement of node 2 along x.
+    """
+    return _analyseStatic
+
+
+@pytest.fixture
+def transient():
+    """
+    The portal frame of :func:`frame2D` with beams and masses, set up for a
+    transient analysis.
+    """
+    return _transient
@@ -0,0 +1,47 @@
+import openseespyhint as op
+from openseespyhint.backend import (useBackend, getBackend, NullBackend,
+                                    RecordingBackend, OpenSeesBackend)
+
+
+def buildTruss():
+    op.utility.wipe()
+    op.model.basic(2, 2)
+    op.model.node(1, [0.0, 0.0])
+    op.model.node(2, [144.0, 0.0])
+    op.model.SPconstraint.fix(1, [1, 1])
+    op.model.uniaxialMaterial.Elastic(1, 3000.0)
+    op.model.element.Truss(1, [1, 2], 10.0, 1)
+
+
+def test_null_backend_counts():
+    with useBackend(NullBackend()) as backend:
+        buildTruss()
+    assert backend.counts['node'] == 2
+    assert backend.counts['element'] == 1
+    assert isinstance(getBackend(), OpenSeesBackend)
+
+
+def test_null_backend_queries():
+    with useBackend(NullBackend()):
+        buildTruss()
+        assert op.backend.ops.getNodeTags() == []
+        assert op.backend.ops.nodeDisp(2) == []
+        assert op.backend.ops.nodeDisp(2, 1) == 0
+        assert op.output.nodeDispAll().shape[0] == 0
+        assert op.output.eleForceAll().shape[0] == 0
+
+
+def test_recording_backend():
+    with useBackend(RecordingBackend()) as backend:
+        buildTruss()
+    assert backend.calls[0] == ('wipe', ())
+    assert ('node', (2, 144.0, 0.0)) in backend.calls
+    assert ('element', ('Truss', 1, 1, 2, 10.0, 1)) in backend.calls
+
+
+def test_recording_passthrough():
+    with useBackend(RecordingBackend(getBackend())) as backend:
+        buildTruss()
+        tags = op.backend.ops.getNodeTags()
+    assert sorted(tags) == [1, 2]
+    assert backend.calls[-1] == ('getNodeTags', ())
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+import openseespyhint as op
+import openseespy.opensees as ops
+
+
+def test_nodes():
+    op.utility.wipe()
+    op.model.basic(2, 3)
+    tags = np.arange(1, 6)
+    coords = np.column_stack([np.linspace(0., 4., 5), np.zeros(5)])
+    op.model.nodes(tags, coords, mass=[1., 2., 0.])
+    assert ops.getNodeTags() == tags.tolist()
+    assert ops.nodeCoord(3) == [2., 0.]
+    assert ops.nodeMass(5) == [1., 2., 0.]
+
+
+def test_nodes_checks_shapes():
+    with pytest.raises(ValueError):
+        op.model.nodes([1, 2], np.zeros((3, 2)))
+    with pytest.raises(ValueError):
+        op.model.nodes([1, 1], np.zeros((2, 2)))
+    with pytest.raises(ValueError):
+        op.model.nodes([1, 2], np.zeros((2, 2)), mass=np.ones((2, 3)), ndf=2)
+
+
+def test_elastic_beam_many(frame2D, analyseStatic):
+    frame2D()
+    for tag, nodes in zip([1, 2, 3], [[1, 2], [2, 3], [3, 4]]):
+        ops.element('elasticBeamColumn', tag, *nodes, 0.01, 2e8, 1e-4, 1)
+    expected = analyseStatic()
+
+    frame2D()
+    op.model.element.elasticBeamColumn2DMany([1, 2, 3], [[1, 2], [2, 3], [3, 4]],
+                                            0.01, 2e8, [1e-4, 1e-4, 1e-4], 1)
+    assert ops.eleNodes(2) == [2, 3]
+    assert abs(analyseStatic() - expected) < 1e-12
+
+
+def test_beam_integration_many(frame2D, analyseStatic):
+    frame2D()
+    ops.section('Elastic', 1, 2e8, 0.01, 1e-4)
+    op.model.beamIntegration.Lobatto(1, 1, 5)
+    op.model.element.forceBeamColumnMany([1, 2], [[1, 2], [3, 4]], 1, 1,
+                                         maxIter=20, tol=1e-10, mass=[1., 2.])
+    op.model.element.dispBeamColumnMany([3], [[2, 3]], 1, 1)
+    assert ops.getEleTags() == [1, 2, 3]
+    assert analyseStatic() > 0.
+
+
+def test_truss_and_zero_length_many():
+    op.utility.wipe()
+    op.model.basic(2, 2)
+    op.model.nodes([1, 2, 3, 4], [[0., 0.], [1., 0.], [1., 0.], [2., 0.]])
+    op.model.uniaxialMaterial.Elastic(1, 100.)
+    op.model.element.TrussMany([1, 2], [[1, 2], [3, 4]], [1., 2.], 1, rho=0.5)
+    op.model.element.zeroLengthMany([3], [[2, 3]], [[1, 1]], [1, 2],
+                                    vecx=[1., 0., 0.], vecyp=[0., 1., 0.])
+    assert ops.eleNodes(3) == [2, 3]
+    assert ops.eleType(1) == 'Truss'
+
+    with pytest.raises(ValueError):
+        op.model.element.TrussMany([5, 6], [[1, 2, 3], [3, 4, 1]], 1., 1)
+    with pytest.raises(ValueError):
+        op.model.element.TrussMany([5, 6], [[1, 2], [3, 4]], [1., 2., 3.], 1)
+
+
+def test_fix_many_and_where():
+    op.utility.wipe()
+    op.model.basic(2, 2)
+    x, y = np.meshgrid(np.arange(4.), np.arange(3.))
+    coords = np.column_stack([x.ravel(), y.ravel()])
+    tags = np.arange(1, 13)
+    op.model.nodes(tags, coords)
+    mask = np.zeros((12, 2), dtype=bool)
+    mask[-1] = [False, True]
+    op.model.SPconstraint.fixMany(tags, mask)
+    base = op.model.SPconstraint.fixWhere(lambda xy: xy[:, 1] == 0., [1, 1], tags, coords)
+    assert base.tolist() == [1, 2, 3, 4]
+    assert sorted(ops.getFixedNodes()) == [1, 2, 3, 4, 12]
+    assert ops.getFixedDOFs(12) == [2]
+
+
+def test_loads_and_ele_loads(frame2D, analyseStatic):
+    frame2D()
+    op.model.element.elasticBeamColumn2DMany([1, 2, 3], [[1, 2], [2, 3], [3, 4]],
+                                            0.01, 2e8, 1e-4, 1)
+    ops.eleLoad('-ele', 2, '-type', '-beamUniform', -5.)
+    ops.load(3, 0., -2., 0.)
+    expected = analyseStatic()
+
+    frame2D()
+    op.model.element.elasticBeamColumn2DMany([1, 2, 3], [[1, 2], [2, 3], [3, 4]],
+                                            0.01, 2e8, 1e-4, 1)
+    op.model.pattern.eleLoads([1, 2, 3], [0., -5., 0.])
+    op.model.pattern.loads([1, 3], [[0., 0., 0.], [0., -2., 0.]])
+    assert abs(analyseStatic() - expected) < 1e-12
@@ -0,0 +1,49 @@
+import openseespyhint as op
+from openseespyhint.backend import getBackend, useBackend, RecordingBackend
+from openseespyhint.cache import CacheBackend, disableCache, enableCache, getCache
+from openseespyhint.shadow import ShadowBackend, disableShadow, enableShadow
+
+
+def test_queries_cached_until_domain_changes(buildTruss):
+    recorder = RecordingBackend(getBackend())
+    with useBackend(CacheBackend(recorder)) as cache:
+        buildTruss()
+        assert op.output.nodeCoord(4) == [72.0, 96.0]
+        u0 = op.output.nodeDisp(4, 1)
+        op.analysis.system.BandSPD()
+        op.analysis.numberer.RCM()
+        op.analysis.constraints.Plain()
+        op.analysis.integrator.LoadControl(1.0)
+        op.analysis.algorithm.Linear()
+        op.analysis.analysis('Static')
+        op.analysis.analyze(1)
+        u1 = op.output.nodeDisp(4, 1)
+        assert op.output.nodeDisp(4, 1) == u1 != u0
+        disp = op.output.nodeDisp(4)
+        disp.append(0.)
+        assert len(op.output.nodeDisp(4)) == 2
+
+        queries = [args for cmd, args in recorder.calls if cmd == 'nodeDisp']
+        assert queries == [(4, 1), (4, 1), (4,)]
+        assert cache.hits == 2
+
+        op.utility.setTime(2.0)
+        assert op.output.getTime() == 2.0
+        op.utility.wipe()
+        assert op.output.getNodeTags() == []
+
+
+def test_disable_inner_layer():
+    with useBackend(RecordingBackend()) as recorder:
+        enableCache()
+        enableShadow()
+        op.output.nodeDisp(1, 1)
+        op.output.nodeDisp(1, 1)
+        disableCache()
+        assert getCache() is None
+        assert isinstance(getBackend(), ShadowBackend)
+        assert getBackend().inner is recorder
+        op.output.nodeDisp(1, 1)
+        assert [cmd for cmd, args in recorder.calls].count('nodeDisp') == 2
+        disableShadow()
+        assert getBackend() is recorder
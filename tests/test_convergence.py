@@ -0,0 +1,50 @@
+import numpy as np
+
+import openseespyhint as op
+import openseespy.opensees as ops
+
+
+def test_convergence_log(transient):
+    transient()
+    ops.timeSeries('Trig', 2, 0.0, 10.0, 0.2)
+    ops.pattern('Plain', 2, 2)
+    ops.load(3, 10., 0., 0.)
+    log = op.analysis.convergence.ConvergenceLog(patternTag=2, capacity=4).start()
+    try:
+        for ii in range(10):
+            assert op.analysis.analyze(1, 0.01) == 0
+            assert log.iterations[-1] == ops.testIter()
+    finally:
+        log.remove()
+    assert op.analysis.stepHooks == [] and op.analysis.failHooks == []
+
+    assert len(log) == 10
+    assert np.allclose(log.time, 0.01 * np.arange(1, 11))
+    assert np.allclose(log.loadFactor, np.sin(2 * np.pi * log.time / 0.2))
+    assert np.all(log.iterations >= 1) and np.all(log.lastNorm <= 1e-10)
+    summary = log.summary()
+    assert summary['increments'] == 10 and summary['failures'] == 0
+    assert np.all(log.status == 0)
+    assert summary['totalIterations'] == log.iterations.sum()
+
+    assert log.slowRegions(minIterations=1) == [(log.time[0], log.time[-1])]
+    assert log.slowRegions(minIterations=100) == []
+    assert set(log.asDict()) == set(log.columns)
+
+
+def test_convergence_log_failure(transient):
+    transient()
+    ops.pattern('Plain', 2, 1)
+    ops.load(3, 10., 0., 0.)
+    log = op.analysis.convergence.ConvergenceLog().start()
+    try:
+        assert op.analysis.analyze(2, 0.01) == 0
+        op.analysis.test.NormDispIncr(1e-30, 2)
+        status = op.analysis.analyze(5, 0.01)
+    finally:
+        log.remove()
+    assert status < 0
+    assert len(log) == 3
+    assert np.array_equal(log.status, [0, 0, status])
+    assert log.iterations[-1] == 2 and log.lastNorm[-1] > 1e-30
+    assert log.summary()['failures'] == 1
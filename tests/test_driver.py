@@ -0,0 +1,119 @@
+import numpy as np
+
+import openseespyhint as op
+from openseespyhint.backend import Backend, getBackend, useBackend
+from openseespyhint.analysis.driver import (AdaptiveDriver, ErrorController, IterationController,
+                                           StepController, VariableStepDriver, recordTimePoints)
+
+
+class LargeStepsFail(Backend):
+    """
+    Fails every transient step larger than maxDt.
+    """
+
+    def __init__(self, inner, maxDt):
+        super().__init__(inner)
+        self.maxDt = maxDt
+
+    def analyze(self, numIncr, dt=0.0, *args):
+        if dt > self.maxDt:
+            return -3
+        return self.inner.analyze(numIncr, dt, *args)
+
+
+def test_driver_falls_back_through_ladder(buildTruss):
+    buildTruss()
+    op.analysis.system.BandSPD()
+    op.analysis.numberer.RCM()
+    op.analysis.constraints.Plain()
+    op.analysis.integrator.LoadControl(0.5)
+    op.analysis.analysis('Static')
+    driver = AdaptiveDriver([
+        {'algorithm': ('Newton',), 'test': ('NormDispIncr', 1e-12, 1)},
+        {'test': ('NormDispIncr', 1e-12, 10)},
+    ])
+    assert driver.run(2) == 0
+    stats = driver.stats()
+    assert stats['rung'].tolist() == [1, 1]
+    assert stats['failures'].tolist() == [1, 1]
+    assert stats['iterations'].tolist() == [2, 2]
+    assert op.output.getTime() == 1.0
+
+
+def test_driver_substeps_and_regrows(transient):
+    transient()
+    with useBackend(LargeStepsFail(getBackend(), 0.0026)):
+        driver = AdaptiveDriver(growAfter=2)
+        assert driver.run(2, 0.01) == 0
+    stats = driver.stats()
+    assert abs(op.output.getTime() - 0.02) < 1e-12
+    assert abs(stats['size'].sum() - 0.02) < 1e-12
+    assert stats['size'].max() == 0.0025
+    assert np.all(stats['rung'] == 0)
+
+
+def test_sticky_driver_skips_failed_rungs(buildTruss):
+    buildTruss()
+    op.analysis.system.BandSPD()
+    op.analysis.numberer.RCM()
+    op.analysis.constraints.Plain()
+    op.analysis.integrator.LoadControl(0.25)
+    op.analysis.analysis('Static')
+    driver = AdaptiveDriver([
+        {'algorithm': ('Newton',), 'test': ('NormDispIncr', 1e-12, 1)},
+        {'test': ('NormDispIncr', 1e-12, 10)},
+    ], sticky=True, growAfter=2)
+    assert driver.run(4) == 0
+    assert driver.stats()['failures'].tolist() == [1, 0, 0, 1]
+
+
+class Grow(StepController):
+    def accept(self, dt):
+        return 3 * dt
+
+
+def test_variable_step_driver_lands_on_time_points(transient):
+    transient()
+    points = 0.02 * np.arange(11)
+    driver = VariableStepDriver(Grow(), timePoints=points)
+    assert driver.run(0.2, 0.005) == 0
+    stats = driver.stats()
+    assert np.isclose(op.output.getTime(), 0.2)
+    # every point is landed on, and the steps grow up to the point spacing
+    assert all(np.isclose(stats['time'], point).any() for point in points[1:])
+    assert stats['size'].max() <= 0.02 + 1e-12
+    assert len(stats['time']) < 40
+
+    # failed steps are retried with a smaller step
+    transient()
+    with useBackend(LargeStepsFail(getBackend(), 0.004)):
+        driver = VariableStepDriver(Grow(), dtMin=0.001)
+        assert driver.run(0.05, 0.01) == 0
+    assert driver.stats()['size'].max() <= 0.004
+
+
+def test_error_controller(transient):
+    transient()
+    controller = ErrorController([2, 3], tol=1e-3)
+    driver = VariableStepDriver(controller, dtMin=1e-4, dtMax=0.05)
+    assert driver.run(0.5, 0.001) == 0
+    sizes = driver.stats()['size']
+    assert np.isclose(op.output.getTime(), 0.5)
+    assert sizes.max() > sizes[0] and np.isfinite(controller.error)
+
+
+def test_record_time_points():
+    times = np.arange(9.)
+    values = np.array([0., 1., 2., 3., 2., 1.5, 1.25, 1., 0.])
+    # the straight ramp is dropped, the peak at 3 is kept
+    assert recordTimePoints(times, values).tolist() == [0, 3, 4, 5, 7, 8]
+    assert recordTimePoints(times, values, tol=0.3).tolist() == [0, 3, 5, 7, 8]
+    assert np.allclose(recordTimePoints(times[:2], values[:2]), times[:2])
+
+
+def test_iteration_controller_limits(transient):
+    transient()
+    assert op.analysis.analyze(1, 0.01) == 0
+    controller = IterationController(target=1e-6, maxShrink=0.1)
+    assert np.isclose(controller.accept(1.0), 0.1)
+    assert np.isclose(IterationController(target=1e6, maxGrow=3.0).accept(1.0), 3.0)
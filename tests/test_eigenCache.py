@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from openseespy import opensees
+
+import openseespyhint as op
+from openseespyhint.backend import getBackend, useBackend, RecordingBackend
+from openseespyhint.eigenCache import EigenCacheBackend
+
+
+@pytest.fixture
+def buildFrame(frame2D):
+    def build():
+        frame2D()
+        op.model.element.elasticBeamColumn2DMany([1, 2, 3], [[1, 2], [2, 3], [3, 4]],
+                                                0.01, 2e8, 1e-4, 1)
+        op.backend.ops.mass(2, 1., 1., 0.)
+        op.backend.ops.mass(3, 1., 1., 0.)
+    return build
+
+
+def test_eigen_cache(buildFrame, tmp_path):
+    with useBackend(EigenCacheBackend(getBackend(), tmp_path)) as cache:
+        buildFrame()
+        values = op.analysis.eigen(numEigenvalues=2)
+        vector = op.output.nodeEigenvector(2, 1)
+        assert cache.misses == 1 and len(values) == 2
+
+        # the domain holds other modes, the cache serves the stored ones
+        op.analysis.eigen('-fullGenLapack', 1)
+        assert op.analysis.eigen(numEigenvalues=2) == values
+        assert cache.hits == 1 and cache.misses == 2
+        assert op.output.nodeEigenvector(2, 2, 1) == op.output.nodeEigenvector(2, 2)[0]
+        assert op.output.nodeEigenvector(2, 1) == vector
+
+        op.backend.ops.mass(2, 2., 2., 0.)
+        changed = op.analysis.eigen(numEigenvalues=2)
+        assert cache.misses == 3 and changed[0] < values[0]
+
+        # modal damping needs the served modes in the domain
+        op.analysis.eigen('-fullGenLapack', 1)
+        op.analysis.eigen(numEigenvalues=2)
+        op.utility.modalDamping(0.02)
+        assert cache.misses == 5
+
+    # rebuilding the same model in a new cache reads the saved file
+    inner = RecordingBackend(getBackend())
+    with useBackend(EigenCacheBackend(inner, tmp_path)) as cache:
+        buildFrame()
+        assert np.allclose(op.analysis.eigen(numEigenvalues=2), values)
+        assert op.output.nodeEigenvector(2, 1) == vector
+        assert cache.hits == 1 and cache.misses == 0
+
+        # other recorders don't need the eigen results in the domain
+        op.backend.ops.recorder('Node', '-file', str(tmp_path / 'disp.out'), '-node', 2,
+                                '-dof', 1, 'disp')
+        op.backend.ops.record()
+        op.backend.ops.remove('recorders')
+        assert 'eigen' not in [cmd for cmd, args in inner.calls] and cache.misses == 0
+
+        # eigen recorders write the served modes
+        path = str(tmp_path / 'mode1.out')
+        op.backend.ops.recorder('Node', '-file', path, '-node', 2, '-dof', 1, 'eigen 1')
+        op.backend.ops.record()
+        op.backend.ops.remove('recorders')
+        # the sign of a mode may differ between solves
+        assert np.isclose(abs(np.loadtxt(path)), abs(vector[0]))
+        assert cache.misses == 1
+
+    # plots read the domain through openseespy, see restoreDomain
+    with useBackend(EigenCacheBackend(getBackend(), tmp_path)) as cache:
+        buildFrame()
+        op.analysis.eigen(numEigenvalues=2)
+        assert cache.misses == 0
+        cache.restoreDomain()
+        assert np.allclose(np.abs(opensees.nodeEigenvector(2, 1)), np.abs(vector))
+        assert cache.hits == 1 and cache.misses == 1
@@ -0,0 +1,140 @@
+import numpy as np
+
+import openseespyhint as op
+from openseespyhint.backend import getBackend, useBackend, RecordingBackend
+from openseespyhint.shadow import ShadowDomain, disableShadow, enableShadow
+from openseespyhint.analysis.graph import (bandwidthProfile, choleskyFill, dofGraph,
+                                           estimateOrderings, nodeGraph, rcmOrder)
+
+
+def strip(N):
+    """
+    A strip of N x 2 nodes, numbered so the Plain order has a wide band.
+    """
+    tags = np.concatenate([np.arange(1, N + 1), np.arange(N + 1, 2 * N + 1)])
+    coords = np.column_stack([np.tile(np.arange(N), 2), np.repeat([0., 1.], N)])
+    bottom, top = np.arange(1, N + 1), np.arange(N + 1, 2 * N + 1)
+    eleNodes = np.concatenate([
+        np.column_stack([bottom[:-1], bottom[1:]]),
+        np.column_stack([top[:-1], top[1:]]),
+        np.column_stack([bottom, top])])
+    domain = ShadowDomain.fromArrays(tags, coords, nodeNdf=[3] * 2 * N,
+                                     eleTags=np.arange(1, len(eleNodes) + 1), eleNodes=eleNodes)
+    return domain
+
+
+def test_node_graph_orderings():
+    domain = strip(10)
+    tags, indptr, indices = nodeGraph(domain)
+    assert list(indices[indptr[0]:indptr[1]]) == [1, 10]
+    assert np.diff(indptr).max() == 3
+
+    order = rcmOrder(indptr, indices)
+    assert sorted(order) == list(range(20))
+    assert bandwidthProfile(np.arange(20), indptr, indices)[:2] == (10, 109)
+    assert bandwidthProfile(order, indptr, indices)[0] <= 2
+
+    stats = estimateOrderings(domain)
+    assert stats['numEqn'] == 60
+    assert stats['RCM']['bandwidth'] < stats['Plain']['bandwidth'] == 32
+    assert stats['RCM']['profile'] < stats['Plain']['profile']
+
+
+def test_auto_solver():
+    domain = strip(10)
+    recorder = RecordingBackend(getBackend())
+    with useBackend(recorder):
+        choice = op.analysis.system.auto('Newton', 'Newmark', domain=domain)
+    assert choice['spd'] and choice['system'] in ('BandSPD', 'ProfileSPD')
+    assert choice['numberer'] == 'RCM'
+    assert recorder.calls == [('system', (choice['system'],)), ('numberer', ('RCM',))]
+    with useBackend(RecordingBackend()) as recorder:
+        assert op.analysis.numberer.auto('Newton', 'Newmark', domain=domain) == choice
+    assert recorder.calls == [('system', (choice['system'],)), ('numberer', ('RCM',))]
+
+    choice = op.analysis.system.chooseSolver('Newton', 'DisplacementControl', domain=domain)
+    assert not choice['spd'] and choice['system'] == 'BandGen'
+    assert any('DisplacementControl' in reason for reason in choice['reasons'])
+
+    # the shadow records the constraint handler, Lagrange multipliers make the system indefinite
+    domain.constraints = 'Lagrange'
+    choice = op.analysis.system.chooseSolver('Newton', 'Newmark', domain=domain)
+    assert not choice['spd'] and choice['system'] == 'BandGen'
+    assert any('Lagrange' in reason for reason in choice['reasons'])
+    assert op.analysis.system.chooseSolver('Newton', 'Newmark', domain=domain,
+                                          constraints='Plain')['spd']
+
+
+def test_auto_solver_reads_shadow():
+    # without an integrator the system is not taken as positive definite
+    choice = op.analysis.system.chooseSolver(domain=strip(10))
+    assert not choice['spd'] and choice['system'] == 'BandGen'
+    assert any('integrator is not known' in reason for reason in choice['reasons'])
+
+    shadow = enableShadow()
+    try:
+        op.utility.wipe()
+        op.model.basic(2, 2)
+        op.model.nodes([1, 2, 3], [[0., 0.], [1., 0.], [2., 0.]])
+        op.model.SPconstraint.fix(1, [1, 1])
+        op.model.uniaxialMaterial.Elastic(1, 100.)
+        op.model.element.Truss(1, [1, 2], 1., 1)
+        op.model.element.Truss(2, [2, 3], 1., 1)
+        op.analysis.algorithm.Newton()
+        op.analysis.integrator.LoadControl(0.1)
+        assert op.analysis.system.chooseSolver()['spd']
+        op.analysis.integrator.ArcLength(1.0, 1.0)
+        choice = op.analysis.system.chooseSolver()
+        assert shadow.integrator == 'ArcLength' and shadow.algorithm == 'Newton'
+        assert not choice['spd'] and any('ArcLength' in reason for reason in choice['reasons'])
+        op.utility.wipeAnalysis()
+        assert shadow.integrator is None
+    finally:
+        disableShadow()
+        op.utility.wipe()
+
+
+def test_dof_graph_and_fill():
+    domain = strip(4)
+    dofNode, indptr, indices = dofGraph(domain)
+    assert len(dofNode) == 24 and list(dofNode[:4]) == [0, 0, 0, 1]
+    # a corner dof couples to the 3 dofs of its node and of its 2 neighbours
+    assert list(indices[indptr[0]:indptr[1]]) == [0, 1, 2, 3, 4, 5, 12, 13, 14]
+
+    # the block estimates on the node graph match the dof graph
+    tags, nodePtr, nodeIndices = nodeGraph(domain)
+    order = rcmOrder(nodePtr, nodeIndices)
+    dofOrder = (3 * order[:, None] + np.arange(3)).ravel()
+    blocks = bandwidthProfile(order, nodePtr, nodeIndices, [3] * 8)
+    assert blocks == bandwidthProfile(dofOrder, indptr, indices)
+    assert choleskyFill(order, nodePtr, nodeIndices, [3] * 8) == \
+        choleskyFill(dofOrder, indptr, indices)
+
+    # a path has no fill in its natural order
+    path = np.array([0, 1, 3, 5, 6]), np.array([1, 0, 2, 1, 3, 2])
+    assert choleskyFill(np.arange(4), *path) == (7, 4 + 4 + 4 + 1)
+
+    stats = estimateOrderings(strip(30))
+    assert stats['AMD']['fill'] <= stats['Plain']['fill']
+    costs = op.analysis.graph.systemCosts(stats)
+    assert costs['BandSPD']['numberer'] == 'RCM'
+    assert costs['BandSPD']['bytes'] == 8 * 180 * (stats['RCM']['bandwidth'] + 1)
+    assert costs['SparseSYM']['numberer'] == 'AMD'
+
+
+def test_auto_memory_limit():
+    choice = op.analysis.system.chooseSolver('Linear', 'LoadControl', domain=strip(30), memoryLimit=8 * 180 * 6)
+    assert choice['system'] == 'ProfileSPD'
+    assert any('BandSPD would need' in reason for reason in choice['reasons'])
+
+
+def test_auto_large_model(monkeypatch):
+    stats = estimateOrderings(strip(30), ('Plain', 'AMD'), fill=('AMD',))
+    assert 'fill' in stats['AMD'] and 'fill' not in stats['Plain']
+
+    monkeypatch.setattr(op.analysis.system, 'amdLimit', 500)
+    choice = op.analysis.system.chooseSolver('Newton', 'Newmark', domain=strip(400))
+    assert 'AMD' not in choice['stats'] and 'fill' not in choice['stats']['RCM']
+    assert any('more than 500 nodes' in reason for reason in choice['reasons'])
+    # the envelope bounds the fill of the sparse system
+    assert choice['costs']['SparseSYM']['bytes'] >= 8 * choice['stats']['RCM']['profile']
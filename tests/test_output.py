@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+import openseespyhint as op
+import openseespy.opensees as ops
+
+
+def test_node_response_all(frame2D, analyseStatic):
+    frame2D()
+    op.model.element.elasticBeamColumn2DMany([1, 2, 3], [[1, 2], [2, 3], [3, 4]],
+                                            0.01, 2e8, 1e-4, 1)
+    ops.node(5, 9., 9., '-ndf', 2)
+    ops.fix(5, 1, 1)
+    analyseStatic()
+    expected = np.array([ops.nodeDisp(tag) for tag in [1, 2, 3, 4]])
+
+    U = op.output.nodeDispAll()
+    assert U.shape == (5, 3)
+    assert np.array_equal(U[:4], expected)
+    assert np.isnan(U[4, 2])
+
+    out = np.zeros((2, 2))
+    assert op.output.nodeDispAll([3, 2], dofs=[3, 1], out=out) is out
+    assert np.array_equal(out, expected[[2, 1]][:, [2, 0]])
+
+    out = np.zeros((4, 3))
+    op.output.nodeDispAll([1, 2, 3, 4], out=out)
+    assert np.array_equal(out, expected)
+    ops.reactions()
+    R = op.output.nodeReactionAll([1, 4], dofs=[1])
+    assert abs(R.sum() + 10.) < 1e-8
+    with pytest.raises(ValueError):
+        op.output.nodeDispAll([1, 2], out=out)
+    with pytest.raises(ValueError):
+        op.output.nodeDispAll([5], out=np.zeros((1, 3)))
+
+
+def test_element_response_all(frame2D, analyseStatic):
+    frame2D()
+    op.model.element.elasticBeamColumn2DMany([1, 2, 3], [[1, 2], [2, 3], [3, 4]],
+                                            0.01, 2e8, 1e-4, 1)
+    op.model.uniaxialMaterial.Elastic(1, 1e5)
+    op.model.element.Truss(4, [1, 3], 1.0, 1)
+    analyseStatic()
+
+    F = op.output.eleForceAll()
+    assert np.array_equal(F, [ops.eleForce(tag) for tag in [1, 2, 3, 4]])
+
+    groups = op.output.basicForceAll(grouped=True)
+    assert sorted(groups) == [1, 3]
+    assert groups[1][0].tolist() == [4]
+    assert groups[3][1].shape == (3, 3)
+    assert np.array_equal(groups[3][1][1], ops.basicForce(2))
+
+    op.model.pattern.load(3, [0., -10., 0.])
+    ops.analyze(1)
+    values = groups[3][1]
+    assert op.output.basicForceAll(grouped=True, out=groups) is groups
+    assert groups[3][1] is values
+    assert np.array_equal(values[0], ops.basicForce(1))
+
+    padded = op.output.basicForceAll([4, 1])
+    assert np.isnan(padded[0, 1:]).all()
+
+    # a narrower result is not broadcast across a wider buffer
+    with pytest.raises(ValueError):
+        op.output.basicForceAll([4], out=np.zeros((1, 3)))
+    with pytest.raises(ValueError):
+        op.output.eleForceAll([1, 2], out=np.zeros((2, 3)))
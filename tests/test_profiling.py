@@ -0,0 +1,34 @@
+import openseespyhint as op
+from openseespyhint import profiling
+from openseespyhint.backend import RecordingBackend
+from openseespyhint.profiling import profile
+
+
+def test_profile_counts_and_stacks(buildTruss, tmp_path):
+    with profile(stacks=True) as profiler:
+        with profiler.phase('setup'):
+            buildTruss()
+            op.model.nodes([5, 6], [[0., 1.], [0., 2.]])
+        op.output.getNodeTags()
+    assert profiler.counts['node'] == 6
+    assert profiler.counts['getNodeTags'] == 1
+    edges, counts = profiler.histogram('node')
+    assert sum(counts) == 6 and len(edges) == len(counts) + 1
+
+    report = profiler.report()
+    assert 'model' in report and 'query' in report and 'node' in report
+
+    stacks = {stack.rsplit(';', 1)[0].split(';')[0] for stack in profiler.folded}
+    assert 'setup' in stacks
+    assert any(stack.endswith('openseespyhint.model.bulk:nodes;node') for stack in profiler.folded)
+    path = tmp_path / 'run.folded'
+    profiler.exportFolded(path)
+    assert len(path.read_text().splitlines()) == len(profiler.folded)
+
+
+def test_zero_times_in_lowest_bin(monkeypatch):
+    monkeypatch.setattr(profiling.time, 'perf_counter', lambda: 1.0)
+    profiler = profiling.ProfilingBackend(RecordingBackend())
+    profiler.node(1, 0., 0.)
+    edges, counts = profiler.histogram('node')
+    assert counts == [1] and edges[1] <= 2 * profiling.minTime
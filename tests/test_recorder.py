@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+
+import openseespyhint as op
+import openseespy.opensees as ops
+from openseespyhint.backend import RecordingBackend, useBackend
+
+
+def test_memory_recorders(transient):
+    transient()
+    nodes = op.output.recorder.MemoryNode([2, 3], dofs=[1], deltaT=0.02, capacity=2)
+    ring = op.output.recorder.MemoryElement([1, 3], ring=True, capacity=4)
+    expected, disp = [], []
+    try:
+        for ii in range(10):
+            assert op.analysis.analyze(1, 0.01) == 0
+            expected.append(ops.eleForce(3))
+            disp.append(ops.nodeDisp(3, 1))
+    finally:
+        op.utility.removeRecorders()
+    assert op.analysis.stepHooks == []
+
+    assert np.allclose(nodes.time, [0.01, 0.03, 0.05, 0.07, 0.09])
+    assert nodes.values.shape == (5, 2, 1)
+    assert np.array_equal(nodes.values[:, 1, 0], disp[::2])
+
+    assert len(ring) == 4 and ring.count == 10
+    assert np.allclose(ring.time, [0.07, 0.08, 0.09, 0.10])
+    assert np.array_equal(ring.values[:, 1], expected[-4:])
+
+    op.analysis.analyze(2, 0.01)
+    assert ring.count == 10
+
+
+def test_envelope_monitor(transient):
+    transient()
+    history = op.output.recorder.MemoryNode([2, 3])
+    envelope = op.output.recorder.MemoryEnvelopeNode([2, 3])
+    disp = np.empty((2, 1))
+
+    def storyDrift(out):
+        op.output.nodeDispAll([2, 3], dofs=[1], out=disp)
+        return np.subtract(disp[1:], disp[:-1], out=out)
+
+    drift = op.output.recorder.EnvelopeMonitor(storyDrift).start()
+    try:
+        op.analysis.analyze(40, 0.01)
+    finally:
+        op.utility.removeRecorders()
+    values = history.values
+    assert np.array_equal(envelope.max, values.max(axis=0))
+    assert np.array_equal(envelope.min, values.min(axis=0))
+    assert np.array_equal(envelope.absMax, np.abs(values).max(axis=0))
+    assert np.array_equal(envelope.timeAbsMax, history.time[np.abs(values).argmax(axis=0)])
+    assert np.array_equal(drift.absMax, np.abs(np.diff(values[:, :, :1], axis=1)).max(axis=0))
+
+
+def test_results_store(transient, tmp_path):
+    from openseespyhint.output.store import ResultsWriter, ResultsReader
+    transient()
+    history = op.output.recorder.MemoryNode([2, 3])
+    forces = op.output.recorder.MemoryElement([1, 2])
+    with ResultsWriter(tmp_path, chunkSize=8) as writer:
+        op.output.recorder.StoreNode(writer, 'disp', [2, 3])
+        op.output.recorder.StoreElement(writer, 'force', [1, 2])
+        try:
+            op.analysis.analyze(20, 0.01)
+        finally:
+            op.utility.removeRecorders()
+        partial = ResultsReader(tmp_path)
+        assert partial['disp'].shape == (16, 2, 3)
+
+    results = ResultsReader(tmp_path)
+    assert isinstance(results['disp'], np.memmap)
+    assert np.array_equal(results['disp'], history.values)
+    assert np.array_equal(results['disp.time'], history.time)
+    assert np.array_equal(results['force'], forces.values)
+    assert results.tags('force').tolist() == [1, 2]
+    selected = results.select('disp', tags=[3], steps=slice(5, 10))
+    assert np.array_equal(selected, history.values[5:10, [1]])
+    assert np.array_equal(results.select('disp', tags=[3], steps=7), history.values[7, [1]])
+
+
+def test_load_recorder_files(transient, tmp_path, monkeypatch):
+    from openseespyhint.output import load
+    transient()
+    history = op.output.recorder.MemoryNode([2, 3], dofs=[1, 2])
+    forces = op.output.recorder.MemoryElement([1, 2], ['localForce'])
+    paths = {}
+    for fileType in ['file', 'binary', 'xml']:
+        paths[fileType] = str(tmp_path / f'disp.{fileType}')
+        op.output.recorder.Node(paths[fileType], [2, 3], [1, 2], 'disp', fileType, time=True)
+    op.output.recorder.Element(str(tmp_path / 'force.xml'), [1, 2], ['localForce'], 'xml')
+    try:
+        op.analysis.analyze(30, 0.01)
+    finally:
+        op.utility.removeRecorders()
+        op.utility.wipe()
+
+    expected = np.column_stack([history.time, history.values.reshape(30, -1)])
+    # force small chunks, so rows are split between reads
+    monkeypatch.setattr(load, '_chunkBytes', 100)
+    assert np.allclose(load.loadRecorder(paths['file']), expected, rtol=1e-5, atol=1e-12)
+    assert np.array_equal(load.loadRecorder(paths['binary']), expected)
+    assert np.allclose(load.loadRecorder(paths['xml']), expected, rtol=1e-5, atol=1e-12)
+    assert load.loadRecorder(paths['binary'], columns=5).shape == (30, 5)
+
+    data = load.loadRecorder(str(tmp_path / 'force.xml'), cache=True)
+    assert np.allclose(data, forces.values.reshape(30, -1), rtol=1e-5, atol=1e-12)
+    assert np.array_equal(np.load(str(tmp_path / 'force.xml.npy')), data)
+    header = load.readRecorderHeader(str(tmp_path / 'force.xml'))
+    assert [block[1]['eleTag'] for block in header] == ['1', '2']
+    assert header[0][2][:3] == ['N_1', 'V_1', 'M_1']
+
+
+def test_analyze_arguments():
+    recorder = RecordingBackend()
+    with useBackend(recorder):
+        op.analysis.analyze(2)
+        op.analysis.analyze(2, 0.01)
+        op.analysis.analyze(2, 0.0, 0.001, 0.02, 3)
+    assert recorder.calls == [('analyze', (2,)), ('analyze', (2, 0.01)),
+                              ('analyze', (2, 0.0, 0.001, 0.02, 3))]
+
+    hook = op.analysis.addStepHook(lambda: None)
+    try:
+        with useBackend(RecordingBackend()), pytest.raises(ValueError):
+            op.analysis.analyze(2, 0.01, 0.001, 0.02, 3)
+    finally:
+        op.analysis.removeStepHook(hook)
+
+
+def test_step_recorder_is_abstract():
+    with pytest.raises(TypeError):
+        op.output.recorder.StepRecorder(None)
@@ -0,0 +1,121 @@
+import concurrent.futures
+import math
+import os
+import signal
+import time
+
+import openseespyhint as op
+from openseespyhint.runner import forkCases, runCases
+
+
+def staticCase(load):
+    ops = op.backend.ops
+    ops.model('basic', '-ndm', 2, '-ndf', 2)
+    ops.node(1, 0., 0.)
+    ops.node(2, 1., 0.)
+    ops.fix(1, 1, 1)
+    ops.fix(2, 0, 1)
+    ops.uniaxialMaterial('Elastic', 1, 100.)
+    ops.element('truss', 1, 1, 2, 1., 1)
+    ops.timeSeries('Linear', 1)
+    ops.pattern('Plain', 1, 1)
+    ops.load(2, load, 0.)
+    op.analysis.system.BandGen()
+    op.analysis.numberer.Plain()
+    op.analysis.constraints.Plain()
+    op.analysis.integrator.LoadControl(1.)
+    op.analysis.algorithm.Linear()
+    ops.analysis('Static')
+    op.analysis.analyze(1)
+    return op.output.nodeDisp(2, 1)
+
+
+def slowCase(seconds):
+    if seconds < 0:
+        raise ValueError('negative')
+    time.sleep(seconds)
+    return seconds
+
+
+def blockedCase(seconds):
+    # a case the worker can't interrupt itself, like a long native analyze
+    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM, signal.SIGINT})
+    time.sleep(seconds)
+    return seconds
+
+
+def crashingCase(seconds):
+    if seconds < 0:
+        os._exit(1)
+    time.sleep(seconds)
+    return seconds
+
+
+def flakyCase(path):
+    if not os.path.exists(path):
+        open(path, 'w').close()
+        raise RuntimeError('first attempt')
+    return 'ok'
+
+
+def test_run_cases():
+    results = sorted(runCases(staticCase, [1., 2., 3.], workers=2), key=lambda r: r.index)
+    assert [r.error for r in results] == [None] * 3
+    assert [round(r.value, 12) for r in results] == [0.01, 0.02, 0.03]
+
+
+def test_run_cases_errors(tmp_path):
+    results = {r.index: r for r in runCases(slowCase, [0.0, -1.0, 5.0], workers=3, timeout=0.5)}
+    assert results[0].value == 0.0
+    assert isinstance(results[1].error, ValueError)
+    assert isinstance(results[2].error, TimeoutError)
+
+    start = time.monotonic()
+    results = {r.index: r for r in runCases(blockedCase, [0.2, 30.0, 0.1, 0.1], workers=2,
+                                            timeout=0.5, retries=1)}
+    assert time.monotonic() - start < 10
+    assert isinstance(results[1].error, TimeoutError) and results[1].attempts == 2
+    assert [results[i].value for i in (0, 2, 3)] == [0.2, 0.1, 0.1]
+    assert [results[i].attempts for i in (0, 2, 3)] == [1, 1, 1]
+
+    # only the case whose worker died counts an attempt
+    for workers in (1, 3):
+        results = {r.index: r for r in runCases(crashingCase, [0.2, -1.0, 0.2, 0.1],
+                                                workers=workers)}
+        assert isinstance(results[1].error, concurrent.futures.process.BrokenProcessPool)
+        assert [results[i].value for i in (0, 2, 3)] == [0.2, 0.2, 0.1]
+        assert [r.attempts for r in results.values()] == [1] * 4
+
+    [result] = runCases(flakyCase, [str(tmp_path / 'flag')], workers=1, retries=1)
+    assert result.value == 'ok' and result.attempts == 2
+
+
+def transientCase(scale):
+    # a load applied suddenly, the truss swings to twice its static displacement in half a period
+    ops = op.backend.ops
+    ops.mass(2, 1., 0.)
+    ops.timeSeries('Constant', 2, '-factor', scale)
+    ops.pattern('Plain', 2, 2)
+    ops.load(2, 1., 0.)
+    op.analysis.system.BandGen()
+    op.analysis.numberer.Plain()
+    op.analysis.constraints.Plain()
+    op.analysis.integrator.Newmark(0.5, 0.25)
+    op.analysis.algorithm.Linear()
+    ops.analysis('Transient')
+    op.analysis.analyze(100, math.pi / 1000)
+    if scale < 0:
+        time.sleep(5)
+    return op.output.getTime(), op.output.nodeDisp(2, 1)
+
+
+def test_fork_cases():
+    results = {r.index: r for r in forkCases(transientCase, [1., 2., -1.], build=lambda: staticCase(3.),
+                                             workers=3, timeout=1.0)}
+    # the gravity load is constant, and the time restarts at 0
+    assert abs(results[0].value[0] - math.pi / 10) < 1e-12
+    assert abs(results[0].value[1] - 0.05) < 1e-4
+    assert abs(results[1].value[1] - 0.07) < 1e-4
+    assert isinstance(results[2].error, TimeoutError)
+    # the parent is left at the built state
+    assert round(op.output.nodeDisp(2, 1), 12) == 0.03
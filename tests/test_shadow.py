@@ -0,0 +1,79 @@
+import numpy as np
+
+import openseespyhint as op
+from openseespyhint.shadow import enableShadow, disableShadow, getShadow
+
+
+def test_shadow_mirrors_model():
+    shadow = enableShadow(capacity=2)
+    try:
+        op.utility.wipe()
+        op.model.basic(2, 3)
+        tags = np.arange(1, 6)
+        coords = np.column_stack([np.arange(5.), np.zeros(5)])
+        op.model.nodes(tags, coords)
+        op.model.geomTransf.Linear2D(7)
+        op.model.uniaxialMaterial.Elastic(3, 100.)
+        op.model.element.elasticBeamColumn2DMany([1, 2], [[1, 2], [2, 3]], 1., 1., 1., 7)
+        op.model.element.Truss(3, [3, 4], 1.0, 3)
+        # commands sent without a wrapper are mirrored too
+        op.backend.ops.nDMaterial('ElasticIsotropic', 4, 100., 0.3)
+        op.backend.ops.node(6, 0., 1., '-ndf', 2)
+        op.backend.ops.node(7, 1., 1., '-ndf', 2)
+        op.backend.ops.element('tri31', 4, 6, 7, 6, 1.0, 'PlaneStress', 4)
+
+        assert shadow is getShadow()
+        assert shadow.nodeTags.tolist() == tags.tolist() + [6, 7]
+        assert shadow.nodeNdf.tolist() == [3] * 5 + [2, 2]
+        assert np.array_equal(shadow.nodeCoord([5, 2]), coords[[4, 1]])
+        assert shadow.eleNodes([3]).tolist() == [[3, 4, -1]]
+        assert shadow.eleNodes([4]).tolist() == [[6, 7, 6]]
+        assert shadow.eleTypes().tolist() == ['elasticBeamColumn'] * 2 + ['Truss', 'tri31']
+        assert shadow.eleTransfTags.tolist() == [7, 7, -1, -1]
+        assert shadow.eleMatTags.tolist() == [-1, -1, 3, 4]
+        assert shadow.materials[4] == ('nDMaterial', 'ElasticIsotropic')
+        op.analysis.constraints.Lagrange(1.0, 1.0)
+        assert shadow.constraints == 'Lagrange'
+
+        base = op.model.SPconstraint.fixWhere(lambda xy: (xy[:, 0] < 0.5) & (xy[:, 1] < 0.5), [1, 1, 1])
+        assert base.tolist() == [1]
+
+        op.utility.removeTag('ele', 3)
+        assert shadow.eleTags.tolist() == [1, 2, 4]
+        op.utility.wipe()
+        assert shadow.numNodes == 0 and shadow.numElements == 0 and shadow.constraints is None
+    finally:
+        disableShadow()
+    assert getShadow() is None
+
+
+def test_model_json_matches_shadow():
+    from openseespyhint.output.modelJSON import modelGeometry
+    shadow = enableShadow()
+    try:
+        op.utility.wipe()
+        op.model.basic(2, 3)
+        op.model.nodes([1, 2, 3], [[0., 0.], [0., 3.], [4., 3.]])
+        op.model.geomTransf.Linear2D(1)
+        op.model.element.elasticBeamColumn2DMany([1], [[1, 2]], 0.01, 2e8, 1e-4, 1)
+        op.model.uniaxialMaterial.Elastic(1, 1e5)
+        op.model.element.Truss(4, [1, 3], 1.0, 1)
+        op.backend.ops.nDMaterial('ElasticIsotropic', 4, 100., 0.3)
+        op.model.nodes([6, 7, 8], [[0., 1.], [1., 1.], [1., 2.]], ndf=2)
+        op.backend.ops.element('tri31', 8, 6, 7, 8, 1.0, 'PlaneStress', 4)
+        assert modelGeometry() is shadow
+    finally:
+        disableShadow()
+
+    model = modelGeometry()
+    assert model is not shadow
+    assert np.array_equal(model.nodeTags, shadow.nodeTags)
+    assert np.array_equal(model.coords, shadow.coords)
+    assert np.array_equal(model.nodeNdf, shadow.nodeNdf)
+    assert np.array_equal(model.eleNodes([8, 1]), shadow.eleNodes([8, 1]))
+    assert np.array_equal(model.eleMatTags, shadow.eleMatTags)
+    assert np.array_equal(model.eleTransfTags, shadow.eleTransfTags)
+    assert model.eleTypes([8]).tolist() == ['Tri31']
+    assert model.materials[4] == ('nDMaterial', 'ElasticIsotropicMaterial')
+    assert model.materialData[4]['type'] == 'ElasticIsotropicMaterial'
+    assert set(model.transforms) == set(shadow.transforms)
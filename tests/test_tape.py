@@ -0,0 +1,35 @@
+import openseespyhint as op
+import openseespy.opensees as ops
+from openseespyhint.tape import record, Tape
+
+
+def runStatic():
+    op.analysis.system.BandSPD()
+    op.analysis.numberer.RCM()
+    op.analysis.constraints.Plain()
+    op.analysis.integrator.LoadControl(1.0)
+    op.analysis.algorithm.Linear()
+    op.analysis.analysis('Static')
+    ops.analyze(1)
+    return ops.nodeDisp(4, 1)
+
+
+def test_record_does_not_execute(buildTruss):
+    ops.wipe()
+    with record() as tape:
+        buildTruss()
+    assert len(tape) == 16
+    assert tape.commands.count('node') == 1
+    assert ops.getNodeTags() == []
+
+
+def test_replay_matches_direct_build(buildTruss, tmp_path):
+    with record() as tape:
+        buildTruss()
+    buildTruss()
+    expected = runStatic()
+    path = tmp_path / 'truss.tape'
+    tape.save(path)
+    for ii in range(2):
+        Tape.load(path).replay()
+        assert abs(runStatic() - expected) < 1e-12